@@ -414,6 +414,19 @@ Advanced customization
   override the ``get()`` method of the ``BaseProvider`` and query
   the search engine.
 
+- `Concurrent requests`
+  The views are synchronous, like the database layer (Invenio-DB) and the
+  search engine client they build on. Flask runs ``async`` views in a
+  worker thread with their own event loop, so rewriting the views as
+  coroutines would not let a worker hold more requests in flight. To serve
+  many slow searches per worker process, run the application with a
+  cooperative worker class (e.g. ``gunicorn --worker-class gevent``), which
+  makes the blocking calls of the search engine client yield while waiting
+  (the PostgreSQL driver additionally needs e.g. ``psycogreen``). Load on the
+  search engine can further be reduced with the search and aggregations
+  caches, and by coalescing identical searches
+  (``RECORDS_REST_SEARCH_SINGLE_FLIGHT``).
+
 Serialization
 -------------
 A key feature of invenio-records-rest is the ability to transform
@@ -21,3 +21,29 @@ except ImportError:  # Python 2 way of inspecting functions
         """Test if the links_factory function accepts kwargs."""
         spec = getargspec(links_factory)
         return spec.keywords is None
+
+
+def webargs_location_kwargs(location):
+    """Get the keyword arguments selecting the location of webargs parsing."""
+    from webargs.flaskparser import parser
+
+    if "location" in signature(parser.parse).parameters:
+        # webargs >= 6.0.0b1
+        return dict(location=location)
+    # webargs < 6.0.0b1
+    return dict(locations=[location])
+
+
+def compile_argmap(argmap):
+    """Convert a dictionary of webargs fields into a schema instance.
+
+    webargs converts dictionaries into schemas on every request, hence
+    compiling the schema once is much faster. Dictionaries are kept if the
+    schema class can not be created from a dictionary (marshmallow < 3).
+    """
+    from webargs.flaskparser import parser
+
+    schema_class = getattr(parser, "schema_class", None)
+    if schema_class is None or not hasattr(schema_class, "from_dict"):
+        return argmap
+    return schema_class.from_dict(argmap)()
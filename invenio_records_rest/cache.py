@@ -0,0 +1,728 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Caches for REST API responses.
+
+Caching is disabled by default. It is enabled by setting
+:data:`invenio_records_rest.config.RECORDS_REST_SEARCH_CACHE` to a factory
+returning a cache backend, e.g. an in-process cache:
+
+.. code-block:: python
+
+    from functools import partial
+    from invenio_records_rest.cache import LRUCache
+
+    RECORDS_REST_SEARCH_CACHE = partial(LRUCache, maxsize=1000)
+
+or a cache shared between processes, e.g. the one of Invenio-Cache:
+
+.. code-block:: python
+
+    from invenio_cache import current_cache
+    from invenio_records_rest.cache import CacheAdapter
+
+    RECORDS_REST_SEARCH_CACHE = lambda: CacheAdapter(current_cache)
+
+A cache backend only has to implement the :class:`BaseCache` interface.
+
+The resolution of persistent identifiers in the item URLs can be cached with
+:class:`PIDCache` (see :data:`invenio_records_rest.config.RECORDS_REST_PID_CACHE`).
+
+Serialized records can be cached with :class:`RecordCache` (see
+:data:`invenio_records_rest.config.RECORDS_REST_RECORD_CACHE`). Any object
+with the ``get``/``set``/``delete`` interface of a shared cache can be adapted
+with :class:`CacheAdapter`, e.g. ``CacheAdapter(LRUCache())`` is a local
+stand-in for a shared cache in development and tests.
+
+The queries built from the ``q`` query string argument can be cached with
+:class:`QueryParserCache` (see
+:data:`invenio_records_rest.config.RECORDS_REST_QUERY_PARSER_CACHE`).
+
+The existence of records in the search engine, used by
+:func:`invenio_records_rest.utils.check_search_existence`, is tracked with an
+:class:`ExistenceIndex` per search.
+
+Concurrent identical searches can also be coalesced with
+:class:`SingleFlight` (see
+:data:`invenio_records_rest.config.RECORDS_REST_SEARCH_SINGLE_FLIGHT`).
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from flask import current_app
+from invenio_pidstore.errors import PIDRedirectedError
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
+from sqlalchemy.orm.exc import NoResultFound
+
+
+class BaseCache(object):
+    """Interface of the cache backends.
+
+    The ``timeout`` of :meth:`set` is given in seconds. ``None`` means the
+    default timeout of the backend and ``0`` means that the value never
+    expires (it can still be evicted).
+    """
+
+    def get(self, key):
+        """Get a value.
+
+        :param key: Cache key.
+        :returns: The cached value or ``None`` if it is missing.
+        """
+        raise NotImplementedError()
+
+    def set(self, key, value, timeout=None):
+        """Set a value.
+
+        :param key: Cache key.
+        :param value: Value to cache.
+        :param timeout: Expiration time in seconds.
+        """
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """Delete a value.
+
+        :param key: Cache key.
+        """
+        raise NotImplementedError()
+
+
+class LRUCache(BaseCache):
+    """Thread-safe in-process cache with LRU eviction and expiration."""
+
+    def __init__(self, maxsize=1024, default_timeout=300):
+        """Initialize cache.
+
+        :param maxsize: Maximum number of entries.
+        :param default_timeout: Default expiration time in seconds.
+        """
+        self.maxsize = maxsize
+        self.default_timeout = default_timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a value."""
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return None
+            if expires and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        """Set a value."""
+        if timeout is None:
+            timeout = self.default_timeout
+        expires = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Delete a value."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self):
+        """Number of entries (including expired ones not yet removed)."""
+        return len(self._data)
+
+
+class CacheAdapter(BaseCache):
+    """Adapter for shared caches with a Flask-Caching/cachelib interface.
+
+    The adapted cache must provide ``get(key)``, ``set(key, value,
+    timeout=None)`` and ``delete(key)``, and store picklable values.
+    """
+
+    def __init__(self, cache, key_prefix="records_rest:"):
+        """Initialize adapter.
+
+        :param cache: Cache instance, e.g. ``invenio_cache.current_cache``.
+        :param key_prefix: Prefix added to all keys.
+        """
+        self.cache = cache
+        self.key_prefix = key_prefix
+
+    def get(self, key):
+        """Get a value."""
+        return self.cache.get(self.key_prefix + key)
+
+    def set(self, key, value, timeout=None):
+        """Set a value."""
+        self.cache.set(self.key_prefix + key, value, timeout=timeout)
+
+    def delete(self, key):
+        """Delete a value."""
+        self.cache.delete(self.key_prefix + key)
+
+
+class NamespacedCache(object):
+    """Cache grouped in namespaces which can be invalidated at once.
+
+    Each namespace (e.g. a search index) has a version token which is part of
+    all keys of the namespace. Invalidating a namespace replaces the token, so
+    that all previous entries are no longer reachable and eventually expire,
+    without having to enumerate keys in the backend.
+
+    The token also records the time of the invalidation. Writes are only
+    visible to searches once the index is refreshed, so values computed within
+    ``refresh_interval`` seconds after an invalidation may be stale and are not
+    cached.
+    """
+
+    def __init__(self, backend, timeout=None, refresh_interval=0):
+        """Initialize cache.
+
+        :param backend: A :class:`BaseCache` instance.
+        :param timeout: Expiration time of the cached values in seconds.
+        :param refresh_interval: Time in seconds after an invalidation during
+            which values are not cached.
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+
+    @staticmethod
+    def _new_version():
+        """Create a version token recording the current time."""
+        return "{0}-{1:.3f}".format(uuid.uuid4().hex, time.time())
+
+    def _version(self, namespace):
+        """Get the current version token of a namespace."""
+        version_key = "version:{0}".format(namespace)
+        version = self.backend.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            self.backend.set(version_key, version, timeout=0)
+        return version
+
+    def make_key(self, namespace, *parts):
+        """Build a key from a namespace and JSON serializable parts.
+
+        :param namespace: Namespace of the key.
+        :param parts: Values identifying the cached value.
+        :returns: Cache key.
+        """
+        fingerprint = hashlib.sha1(
+            json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return "{0}:{1}:{2}".format(namespace, self._version(namespace), fingerprint)
+
+    def is_settled(self, key):
+        """Check if the index refresh interval after an invalidation elapsed.
+
+        :param key: Key created by :meth:`make_key`.
+        :returns: ``False`` if the namespace of the key was invalidated less
+            than ``refresh_interval`` seconds ago.
+        """
+        if not self.refresh_interval:
+            return True
+        version = key.rsplit(":", 2)[-2]
+        if "-" not in version:
+            return True
+        invalidated = float(version.split("-", 1)[1])
+        return time.time() - invalidated >= self.refresh_interval
+
+    def get(self, key):
+        """Get a cached value.
+
+        :param key: Key created by :meth:`make_key`.
+        :returns: The value or ``None``.
+        """
+        return self.backend.get(key)
+
+    def set(self, key, value):
+        """Cache a value.
+
+        The value is not cached if the namespace was invalidated within the
+        refresh interval, as it may have been computed before the index
+        refresh (see :meth:`is_settled`).
+
+        :param key: Key created by :meth:`make_key`.
+        :param value: Value to cache.
+        """
+        if self.is_settled(key):
+            self.backend.set(key, value, timeout=self.timeout)
+
+    def invalidate(self, namespace):
+        """Invalidate all entries of a namespace.
+
+        :param namespace: Namespace to invalidate.
+        """
+        self.backend.set(
+            "version:{0}".format(namespace), self._new_version(), timeout=0
+        )
+
+
+class ResponseCache(NamespacedCache):
+    """Namespaced cache of serialized responses."""
+
+    def get(self, key):
+        """Get a cached response.
+
+        :param key: Key created by :meth:`make_key`.
+        :returns: A response or ``None``.
+        """
+        data = super().get(key)
+        if data is None:
+            return None
+        return current_app.response_class(
+            data["data"],
+            status=data["status"],
+            headers=data["headers"],
+            mimetype=data["mimetype"],
+        )
+
+    def set(self, key, response):
+        """Cache a response.
+
+        :param key: Key created by :meth:`make_key`.
+        :param response: A non-streamed response.
+        """
+        super().set(
+            key,
+            dict(
+                data=response.get_data(),
+                status=response.status_code,
+                mimetype=response.mimetype,
+                headers=[
+                    (k, v)
+                    for k, v in response.headers.items()
+                    if k.lower() not in ("content-type", "content-length")
+                ],
+            ),
+        )
+
+
+class RecordCache(object):
+    """Cache of serialized records.
+
+    The keys include the identifier and the revision of the record, hence a
+    modified record is never served from the cache and no invalidation is
+    needed.
+    """
+
+    def __init__(self, backend, timeout=None):
+        """Initialize cache.
+
+        :param backend: A :class:`BaseCache` instance.
+        :param timeout: Expiration time of the cached records in seconds.
+        """
+        self.backend = backend
+        self.timeout = timeout
+
+    @staticmethod
+    def make_key(pid, record, mimetype, *options):
+        """Build the key of a serialized record.
+
+        :param pid: Persistent identifier of the record.
+        :param record: Record instance.
+        :param mimetype: Media type of the serialization.
+        :param options: JSON serializable values the serialization depends on
+            (e.g. query string arguments).
+        :returns: Cache key.
+        """
+        fingerprint = hashlib.sha1(
+            json.dumps(
+                [
+                    pid.pid_type,
+                    pid.pid_value,
+                    record.id,
+                    record.revision_id,
+                    mimetype,
+                    options,
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        return "record:{0}".format(fingerprint)
+
+    def get(self, key):
+        """Get a serialized record.
+
+        :param key: Key created by :meth:`make_key`.
+        :returns: The serialized record or ``None``.
+        """
+        return self.backend.get(key)
+
+    def set(self, key, data):
+        """Cache a serialized record.
+
+        :param key: Key created by :meth:`make_key`.
+        :param data: Serialized record.
+        """
+        self.backend.set(key, data, timeout=self.timeout)
+
+
+class PIDCache(object):
+    """Cache of the resolution of persistent identifiers.
+
+    Registered PIDs are cached with the identifier of their object, and
+    redirected PIDs with their destination, so that resolving them does not
+    query the PID tables. Other PIDs (e.g. deleted ones) are always resolved.
+
+    The cached PIDs are transient instances, hence they must not be modified.
+    """
+
+    _fields = ("id", "pid_type", "pid_value", "pid_provider", "object_type")
+
+    def __init__(self, backend, timeout=None):
+        """Initialize cache.
+
+        :param backend: A :class:`BaseCache` instance.
+        :param timeout: Expiration time of the cached resolutions in seconds.
+        """
+        self.backend = backend
+        self.timeout = timeout
+
+    @staticmethod
+    def make_key(pid_type, object_type, pid_value):
+        """Build the key of a persistent identifier.
+
+        :param pid_type: Persistent identifier type.
+        :param object_type: Type of the assigned object.
+        :param pid_value: Persistent identifier value.
+        :returns: Cache key.
+        """
+        fingerprint = hashlib.sha1(
+            json.dumps([pid_type, object_type, pid_value]).encode("utf-8")
+        ).hexdigest()
+        return "pid:{0}".format(fingerprint)
+
+    def _dump(self, pid, destination=None):
+        """Dump a PID into a cacheable dictionary."""
+        data = {field: getattr(pid, field) for field in self._fields}
+        data.update(
+            status=pid.status.value,
+            object_uuid=str(pid.object_uuid) if pid.object_uuid else None,
+        )
+        if destination is not None:
+            data["redirect"] = [destination.pid_type, destination.pid_value]
+        return data
+
+    def _load(self, data):
+        """Create a transient PID from a cached dictionary."""
+        object_uuid = data["object_uuid"]
+        return PersistentIdentifier(
+            status=PIDStatus(data["status"]),
+            object_uuid=uuid.UUID(object_uuid) if object_uuid else None,
+            **{field: data[field] for field in self._fields}
+        )
+
+    def resolve(self, resolver, pid_value):
+        """Resolve a persistent identifier, using the cache.
+
+        :param resolver: A :class:`invenio_pidstore.resolver.Resolver`.
+        :param pid_value: Persistent identifier value.
+        :returns: A tuple with the PID and the object.
+        :raises invenio_pidstore.errors.PIDRedirectedError: If the PID is
+            redirected.
+        """
+        key = self.make_key(resolver.pid_type, resolver.object_type, pid_value)
+        cached = self.backend.get(key)
+        if cached is not None:
+            pid = self._load(cached)
+            if "redirect" in cached:
+                pid_type, value = cached["redirect"]
+                raise PIDRedirectedError(
+                    pid, PersistentIdentifier(pid_type=pid_type, pid_value=value)
+                )
+            try:
+                return pid, resolver.object_getter(pid.object_uuid)
+            except NoResultFound:
+                self.backend.delete(key)
+
+        try:
+            pid, obj = resolver.resolve(pid_value)
+        except PIDRedirectedError as e:
+            self.backend.set(
+                key, self._dump(e.pid, e.destination_pid), timeout=self.timeout
+            )
+            raise
+        self.backend.set(key, self._dump(pid), timeout=self.timeout)
+        return pid, obj
+
+    def invalidate(self, pid):
+        """Remove a persistent identifier from the cache.
+
+        :param pid: Persistent identifier whose status or assignment changed.
+        """
+        self.backend.delete(self.make_key(pid.pid_type, pid.object_type, pid.pid_value))
+
+
+class QueryParserCache(object):
+    """Cache of the queries built by a query parser from query strings.
+
+    Query strings which the parser rejects are cached as well, so that they
+    are rejected again without parsing them. The parser must only depend on
+    the query string. Hits and misses are counted per process.
+    """
+
+    def __init__(self, backend, timeout=None):
+        """Initialize cache.
+
+        :param backend: A :class:`BaseCache` instance.
+        :param timeout: Expiration time of the cached queries in seconds.
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        """Ratio of the queries served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def make_key(self, query_parser, qstr, scope=None):
+        """Build the key of a query string.
+
+        Parsers are identified by their qualified name, which is not unique
+        e.g. for lambdas, so keys also depend on the ``scope`` (e.g. the
+        endpoint) the parser is used in.
+
+        :param query_parser: Query parser.
+        :param qstr: Query string.
+        :param scope: Name of the endpoint the parser is used in.
+        :returns: Cache key.
+        """
+        parser_name = "{0}.{1}".format(
+            getattr(query_parser, "__module__", ""),
+            getattr(query_parser, "__qualname__", repr(query_parser)),
+        )
+        fingerprint = hashlib.sha1(
+            json.dumps([scope, parser_name, qstr]).encode("utf-8")
+        ).hexdigest()
+        return "query:{0}".format(fingerprint)
+
+    def parse(self, query_parser, qstr, scope=None):
+        """Parse a query string, using the cache.
+
+        :param query_parser: Query parser.
+        :param qstr: Query string.
+        :param scope: Name of the endpoint the parser is used in.
+        :returns: The query.
+        :raises SyntaxError: If the query string is invalid.
+        """
+        key = self.make_key(query_parser, qstr, scope=scope)
+        cached = self.backend.get(key)
+        self._count(cached is not None)
+        if cached is not None:
+            if cached["invalid"]:
+                raise SyntaxError("Invalid query string (cached).")
+            return dsl.Q(cached["query"])
+
+        try:
+            query = query_parser(qstr)
+        except SyntaxError:
+            self.backend.set(key, dict(invalid=True), timeout=self.timeout)
+            raise
+        self.backend.set(
+            key, dict(invalid=False, query=query.to_dict()), timeout=self.timeout
+        )
+        return query
+
+
+class ExistenceIndex(object):
+    """Per-process set of the identifiers of the documents matched by a search.
+
+    The identifiers are loaded from the search engine in the background and
+    reloaded once older than ``refresh_interval`` seconds. Identifiers found in
+    the set are known to exist, while all other answers are uncertain and must
+    be checked against the search engine.
+    """
+
+    def __init__(self, refresh_interval=300, max_size=1000000, key=None):
+        """Initialize index.
+
+        :param refresh_interval: Time in seconds after which the identifiers
+            are reloaded.
+        :param max_size: Maximum number of identifiers. Larger searches are
+            not loaded, hence all answers are uncertain.
+        :param key: Identifier of the search the identifiers are loaded from.
+        """
+        self.refresh_interval = refresh_interval
+        self.max_size = max_size
+        self.key = key
+        self._ids = None
+        self._loaded_at = None
+        self._loading = False
+        self._discarded = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, id_):
+        """Check if an identifier is known to exist."""
+        ids = self._ids
+        return ids is not None and id_ in ids
+
+    @property
+    def is_stale(self):
+        """Whether the identifiers must be (re)loaded."""
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.refresh_interval
+        )
+
+    def add(self, id_):
+        """Add an identifier known to exist."""
+        with self._lock:
+            if self._ids is not None:
+                self._ids.add(id_)
+
+    def discard(self, id_):
+        """Remove an identifier which may no longer exist."""
+        with self._lock:
+            if self._ids is not None:
+                self._ids.discard(id_)
+            if self._loading:
+                self._discarded.add(id_)
+
+    def refresh(self, search, executor):
+        """Reload the identifiers in the background.
+
+        Does nothing if the identifiers are already being loaded.
+
+        :param search: Search matching the documents.
+        :param executor: Executor running the loading.
+        :returns: Future of the loading or ``None``.
+        """
+        with self._lock:
+            if self._loading:
+                return None
+            self._loading = True
+            self._discarded = set()
+        app = current_app._get_current_object()
+
+        def load():
+            with app.app_context():
+                try:
+                    ids = self._scan(search)
+                except Exception:
+                    app.logger.exception("Failed loading existence index.")
+                    ids = None
+            with self._lock:
+                self._ids = ids - self._discarded if ids is not None else None
+                self._loaded_at = time.monotonic()
+                self._loading = False
+
+        return executor.submit(load)
+
+    def _scan(self, search):
+        """Get the identifiers of all documents of a search.
+
+        :returns: A set of identifiers or ``None`` if there are more than
+            ``max_size`` documents.
+        """
+        body = search.to_dict()
+        body.pop("aggs", None)
+        body["_source"] = False
+        ids = set()
+        for hit in search_engine.helpers.scan(
+            dsl.connections.get_connection(search._using),
+            query=body,
+            index=search._index,
+            size=5000,
+            **search._params
+        ):
+            ids.add(hit["_id"])
+            if len(ids) > self.max_size:
+                return None
+        return ids
+
+
+class _Call(object):
+    """Call in flight of :class:`SingleFlight`."""
+
+    def __init__(self):
+        """Initialize call."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesce concurrent identical calls within a process.
+
+    While a call for a key is running, other calls for the same key wait for
+    it and get its result (or exception) instead of running again.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """Call a function, unless a call for the same key is in flight.
+
+        :param key: Key identifying identical calls.
+        :param func: Function without arguments.
+        :returns: Tuple of the result of the function and a boolean telling
+            if the result is shared with another call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+def default_search_cache_scope():
+    """Permission scope of a cached search response.
+
+    Anonymous users share cached responses, while authenticated users get
+    their own entries, since the search results may depend on their
+    permissions.
+
+    :returns: A JSON serializable value identifying the scope.
+    """
+    if not hasattr(current_app, "login_manager"):
+        return None
+    from flask_login import current_user
+
+    if current_user.is_authenticated:
+        return current_user.get_id()
+    return None
@@ -8,7 +8,9 @@ from invenio_i18n import lazy_gettext as _
 from invenio_indexer.api import RecordIndexer
 from invenio_search import RecordsSearch
 
+from .cache import default_search_cache_scope
 from .facets import terms_filter
+from .query import default_query_analyzer
 from .utils import allow_all, check_search, deny_all
 
 RECORDS_REST_ENDPOINTS = dict(
@@ -139,11 +141,22 @@ The structure of the dictionary is as follows:
     when building endpoints for the defined ``pid_type``. By default the
     default prefix is defined to be the value of ``pid_type``.
 
+:param cursor_tiebreaker: Unique, sortable field appended to the sort when
+    paginating with ``cursor`` (``search_after``). Defaults to ``_id``; a
+    keyword copy of the record identifier is recommended for large indices.
+
 :param default_media_type: Default media type for both records and search.
 
 :param delete_permission_factory_imp: Import path to factory that creates a
     delete permission object for a given record.
 
+:param export_serializers: Streaming serializers for exporting all records
+    matching a search (e.g.
+    ``{'application/json': 'invenio_records_rest.serializers'
+    ':json_v1_search_stream'}``). If defined, an export route
+    ``<list_route>_export`` is installed, see
+    :class:`invenio_records_rest.views.RecordsExportResource`.
+
 :param item_route: URL rule for a single record.
 
 :param links_factory_imp: Factory for record links generation.
@@ -180,6 +193,27 @@ The structure of the dictionary is as follows:
     (see `config.REST_MIMETYPE_QUERY_ARG_NAME`) to valid mimetypes for record
     item serializers: dict(alias -> mimetype).
 
+:param required_source_fields: Fields always fetched from the search engine
+    when clients request a subset of fields with the ``fields`` query string
+    argument, e.g. the field read by the PID fetcher. Defaults to
+    ``['control_number', '_created', '_updated']`` (with the
+    ``PIDSTORE_RECID_FIELD`` field) for the ``recid`` fetchers. With other
+    fetchers, the full ``_source`` is fetched unless the fields are set.
+
+:param search_timeout: Time budget of the search and suggest requests sent
+    to the search engine (e.g. ``'2s'``). Partial results are flagged in the
+    search response.
+
+:param search_terminate_after: Maximum number of documents to collect per
+    shard for a search. Partial results are flagged in the search response.
+
+:param allow_partial_search_results: Whether the search engine may return
+    partial results when shards fail or time out (default: search engine
+    setting).
+
+:param query_limits: Complexity limits of the query strings, overriding
+    ``RECORDS_REST_DEFAULT_QUERY_LIMITS``.
+
 :param search_class: Import path or class object for the object in charge of
     execute the search queries. The default search class is
     :class:`invenio_search.api.RecordsSearch`.
@@ -221,6 +255,23 @@ The structure of the dictionary is as follows:
 :param use_options_view: Determines if a special option view should be
     installed.
 
+:param use_facets_view: Determines if a facets route ``<list_route>_facets``
+    should be installed, returning only the aggregations of a search (see
+    :class:`invenio_records_rest.views.RecordsFacetsResource`). Defaults to
+    ``False``.
+
+:param use_mget_view: Determines if a multi-get route ``<list_route>_mget``
+    should be installed, returning many records requested by PID value in a
+    single response (see
+    :class:`invenio_records_rest.views.RecordsMultiGetResource`). Defaults to
+    ``False``.
+
+:param use_bulk_view: Determines if a bulk route ``<list_route>_bulk``
+    should be installed, creating, updating or deleting many records in one
+    request (see
+    :class:`invenio_records_rest.views.RecordsBulkResource`). Defaults to
+    ``False``.
+
 :param error_handlers: Error handlers configuration for the endpoint. The
     dictionary has an exception type or HTTP status code as a key and a
     function or an import path to a function as a value. The function will be
@@ -358,6 +409,42 @@ RECORDS_REST_DEFAULT_LIST_PERMISSION_FACTORY = allow_all
 RECORDS_REST_DEFAULT_READ_PERMISSION_FACTORY = check_search
 """Default read permission factory: check if the record exists."""
 
+RECORDS_REST_EXISTENCE_INDEX_REFRESH_INTERVAL = 30
+"""Time in seconds after which the existence indexes are reloaded.
+
+Existence indexes are used by the
+:func:`invenio_records_rest.utils.check_search_existence` read permission
+factory, an alternative to :func:`invenio_records_rest.utils.check_search`
+which avoids a search request on each record read:
+
+.. code-block:: python
+
+    RECORDS_REST_DEFAULT_READ_PERMISSION_FACTORY = check_search_existence
+
+.. warning::
+
+    Existence indexes are kept per process. A record deleted or hidden from
+    the search (e.g. restricted) is only removed from the existence indexes
+    of the process which handled the change. The other processes keep
+    granting read access to the record until their indexes are reloaded, i.e.
+    for up to this interval. Keep it short, or do not use
+    ``check_search_existence`` for records whose access may be revoked.
+"""
+
+RECORDS_REST_EXISTENCE_INDEX_MAX_SIZE = 1000000
+"""Maximum number of records of an existence index.
+
+Indices with more records are not loaded in memory, and each read searches
+for the record as with :func:`invenio_records_rest.utils.check_search`.
+"""
+
+RECORDS_REST_EXISTENCE_INDEX_MAX_INDEXES = 100
+"""Maximum number of existence indexes of a process (one per endpoint).
+
+Reads of the endpoints without an existence index search for the record as
+with :func:`invenio_records_rest.utils.check_search`.
+"""
+
 RECORDS_REST_DEFAULT_UPDATE_PERMISSION_FACTORY = deny_all
 """Default update permission factory: reject any request."""
 
@@ -375,3 +462,166 @@ RECORDS_REST_SEARCH_ERROR_HANDLERS = {
 
 RECORDS_REST_DEFAULT_RESULTS_SIZE = 10
 """Default search results size."""
+
+RECORDS_REST_MGET_MAX_SIZE = 100
+"""Maximum number of PID values requested at once from the multi-get views."""
+
+RECORDS_REST_BULK_MAX_SIZE = 10000
+"""Maximum number of records sent at once to the bulk views."""
+
+RECORDS_REST_BULK_BATCH_SIZE = 500
+"""Number of records of the bulk views committed and indexed together."""
+
+RECORDS_REST_EXPORT_BATCH_SIZE = 1000
+"""Number of hits fetched per scroll request by the export views."""
+
+RECORDS_REST_EXPORT_SCROLL_TIMEOUT = "2m"
+"""Time the scroll context of the export views is kept alive between batches."""
+
+RECORDS_REST_SEARCH_CACHE = None
+"""Factory of the cache backend for search responses.
+
+The factory (or import path to it) is called once per application and must
+return a :class:`invenio_records_rest.cache.BaseCache` instance. Caching of
+search responses is disabled if ``None``. Cached responses of a search index
+are invalidated when a record of the index is created, updated or deleted
+through the REST API, see :mod:`invenio_records_rest.cache`.
+"""
+
+RECORDS_REST_SEARCH_CACHE_TIMEOUT = 60
+"""Expiration time in seconds of cached search responses."""
+
+RECORDS_REST_SEARCH_CACHE_REFRESH_INTERVAL = 1
+"""Time in seconds after an invalidation during which searches are not cached.
+
+Records written through the REST API are only visible to searches after the
+next refresh of the index. Search responses and aggregations computed within
+this time after an invalidation are therefore not cached. It should be at
+least the refresh interval of the search indexes (one second by default).
+"""
+
+RECORDS_REST_AGGREGATIONS_CACHE = None
+"""Factory of the cache backend for aggregation results.
+
+If set, the list views compute the aggregations (facets) in a separate
+request, keyed only on the query, the aggregations and the permission scope,
+and cache the result. Paging through or re-sorting the hits hence reuses the
+cached facet counts. The factory follows the same conventions as
+:data:`RECORDS_REST_SEARCH_CACHE` and the cache is invalidated on the same
+writes.
+"""
+
+RECORDS_REST_AGGREGATIONS_CACHE_TIMEOUT = 300
+"""Expiration time in seconds of cached aggregation results."""
+
+RECORDS_REST_CONCURRENT_AGGREGATIONS = False
+"""Compute aggregations concurrently with the hits of a search.
+
+If enabled, the list views send the hits and each aggregation as separate
+requests, executed concurrently in a thread pool, and merge the results before
+serialization. Aggregations which are not computed within
+:data:`RECORDS_REST_AGGREGATIONS_TIMEOUT` are left out of the response, so that
+slow facets do not delay the hits. If the thread pool has not enough idle
+threads for all aggregations, they are computed in a single request instead.
+"""
+
+RECORDS_REST_AGGREGATIONS_TIMEOUT = 2
+"""Time in seconds to wait for concurrently computed aggregations."""
+
+RECORDS_REST_SEARCH_THREADS = 8
+"""Number of threads used per process for concurrent searches."""
+
+RECORDS_REST_RECORD_CACHE = None
+"""Factory of the cache backend for serialized records.
+
+If set, the serialized records returned by the item views are cached, so that
+popular records are served without being dumped and encoded again. The record
+is still loaded and the read permission still checked on each request. The
+keys include the revision of the record, the media type, the endpoint, the
+host, the query string arguments (e.g. ``prettyprint``) and the permission
+scope (see :data:`RECORDS_REST_SEARCH_CACHE_SCOPE`). The factory follows the
+same conventions as :data:`RECORDS_REST_SEARCH_CACHE`.
+"""
+
+RECORDS_REST_RECORD_CACHE_TIMEOUT = 300
+"""Expiration time in seconds of cached serialized records."""
+
+RECORDS_REST_PID_CACHE = None
+"""Factory of the cache backend for the resolution of persistent identifiers.
+
+If set, ``GET`` and ``HEAD`` requests on the item views resolve registered
+and redirected PIDs from the cache, saving the PID lookups in the database.
+Entries are removed when the PIDs are deleted through the REST API; changes
+made otherwise are only picked up once the entries expire. The factory follows
+the same conventions as :data:`RECORDS_REST_SEARCH_CACHE`.
+"""
+
+RECORDS_REST_PID_CACHE_TIMEOUT = 300
+"""Expiration time in seconds of cached PID resolutions."""
+
+RECORDS_REST_QUERY_PARSER_CACHE = None
+"""Factory of the cache backend for parsed query strings.
+
+If set, the queries built by the search query parser of the default search
+factory are cached per endpoint and query string, including the query strings
+the parser rejects. It must be a callable (or an import path to it) returning
+a :class:`invenio_records_rest.cache.BaseCache` instance, e.g.:
+
+.. code-block:: python
+
+    RECORDS_REST_QUERY_PARSER_CACHE = partial(LRUCache, maxsize=500)
+
+Only use it with query parsers which depend on the query string only. Hit
+and miss counts are available on ``current_records_rest.query_parser_cache``.
+"""
+
+RECORDS_REST_QUERY_PARSER_CACHE_TIMEOUT = 3600
+"""Time in seconds parsed query strings are cached."""
+
+RECORDS_REST_DEFAULT_QUERY_LIMITS = None
+"""Default complexity limits of the query strings of all endpoints.
+
+Query strings exceeding the limits are rejected with a 400 error before they
+are parsed and sent to the search engine. Endpoints can override the limits
+with their ``query_limits`` option. Example:
+
+.. code-block:: python
+
+    RECORDS_REST_DEFAULT_QUERY_LIMITS = dict(
+        max_clauses=100,
+        allow_leading_wildcard=False,
+        max_wildcards=5,
+        max_regex_length=50,
+        max_fuzziness=1,
+        max_fuzzy_terms=5,
+        text_fields=["title", "description"],
+    )
+
+See :func:`invenio_records_rest.query.default_query_analyzer` for the meaning
+of the limits. ``None`` disables the checks. The number of rejected queries
+per kind of exceeded limit is counted in
+``current_records_rest.rejected_queries``.
+"""
+
+RECORDS_REST_QUERY_ANALYZER = default_query_analyzer
+"""Function checking a query string against complexity limits.
+
+It receives the query string and the limits, and returns the list of the
+kinds of exceeded limits.
+"""
+
+RECORDS_REST_SEARCH_SINGLE_FLIGHT = False
+"""Coalesce concurrent identical searches of a process.
+
+If enabled, identical searches (same index and request body) sent while one
+of them is in flight wait for it and share its result, instead of all hitting
+the search engine. Used by the search and suggest views.
+"""
+
+RECORDS_REST_SEARCH_CACHE_SCOPE = default_search_cache_scope
+"""Function returning the permission scope of cached search results.
+
+The value returned for the current request is part of the keys of the search
+and aggregations caches, so that users whose permissions differ never share
+cached results.
+"""
@@ -55,6 +55,34 @@ class InvalidQueryRESTError(RESTException):
         super().__init__(**kwargs)
 
 
+class QueryTooComplexRESTError(InvalidQueryRESTError):
+    """Query string exceeding the complexity limits of the endpoint."""
+
+    messages = {
+        "clauses": "The query has too many clauses.",
+        "leading_wildcard": "Terms must not start with a wildcard.",
+        "wildcards": "The query has too many wildcards.",
+        "regex": "The regular expression is too long.",
+        "fuzziness": "The fuzziness of a term is too high.",
+        "fuzzy_terms": "The query has too many fuzzy terms.",
+        "text_range": "Range queries are not allowed on text fields.",
+    }
+    """Error messages of the kinds of exceeded limits."""
+
+    def __init__(self, violations=None, **kwargs):
+        """Initialize exception.
+
+        :param violations: Kinds of exceeded limits.
+        """
+        if "description" not in kwargs:
+            kwargs["description"] = _("The search query is too complex.")
+        kwargs.setdefault(
+            "errors",
+            [FieldError("q", self.messages.get(v, v)) for v in (violations or [])],
+        )
+        super().__init__(**kwargs)
+
+
 #
 # CiteProc
 #
@@ -133,6 +161,18 @@ class PIDMissingObjectRESTError(PIDRESTException):
         super().__init__(**kwargs)
 
 
+class PIDAlreadyExistsRESTError(PIDRESTException):
+    """PID already exists."""
+
+    code = 409
+
+    def __init__(self, **kwargs):
+        """Initialize exception."""
+        if "description" not in kwargs:
+            kwargs["description"] = _("PID already exists.")
+        super().__init__(**kwargs)
+
+
 class PIDRedirectedRESTError(PIDRESTException):
     """Invalid redirect for destination."""
 
@@ -3,11 +3,22 @@
 
 """Flask extension for the Invenio-Records-REST."""
 
+import threading
 import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from werkzeug.utils import cached_property
 
 from . import config
+from .cache import (
+    NamespacedCache,
+    PIDCache,
+    QueryParserCache,
+    RecordCache,
+    ResponseCache,
+    SingleFlight,
+)
 from .utils import (
     build_default_endpoint_prefixes,
     load_or_import_from_config,
@@ -22,6 +33,9 @@ class _RecordRESTState(object):
     def __init__(self, app):
         """Initialize state."""
         self.app = app
+        # Number of rejected query strings per kind of exceeded limit.
+        self.rejected_queries = Counter()
+        self._rejected_queries_lock = threading.Lock()
 
     @cached_property
     def loaders(self):
@@ -63,6 +77,140 @@ class _RecordRESTState(object):
             "RECORDS_REST_DEFAULT_LIST_PERMISSION_FACTORY", app=self.app
         )
 
+    @cached_property
+    def search_cache(self):
+        """Search response cache or ``None`` if caching is disabled."""
+        backend_factory = load_or_import_from_config(
+            "RECORDS_REST_SEARCH_CACHE", app=self.app
+        )
+        if not backend_factory:
+            return None
+        return ResponseCache(
+            backend_factory(),
+            timeout=self.app.config["RECORDS_REST_SEARCH_CACHE_TIMEOUT"],
+            refresh_interval=self.app.config[
+                "RECORDS_REST_SEARCH_CACHE_REFRESH_INTERVAL"
+            ],
+        )
+
+    @cached_property
+    def aggregations_cache(self):
+        """Aggregations cache or ``None`` if caching is disabled."""
+        backend_factory = load_or_import_from_config(
+            "RECORDS_REST_AGGREGATIONS_CACHE", app=self.app
+        )
+        if not backend_factory:
+            return None
+        return NamespacedCache(
+            backend_factory(),
+            timeout=self.app.config["RECORDS_REST_AGGREGATIONS_CACHE_TIMEOUT"],
+            refresh_interval=self.app.config[
+                "RECORDS_REST_SEARCH_CACHE_REFRESH_INTERVAL"
+            ],
+        )
+
+    @cached_property
+    def pid_cache(self):
+        """PID resolution cache or ``None`` if caching is disabled."""
+        backend_factory = load_or_import_from_config(
+            "RECORDS_REST_PID_CACHE", app=self.app
+        )
+        if not backend_factory:
+            return None
+        return PIDCache(
+            backend_factory(),
+            timeout=self.app.config["RECORDS_REST_PID_CACHE_TIMEOUT"],
+        )
+
+    @cached_property
+    def record_cache(self):
+        """Serialized records cache or ``None`` if caching is disabled."""
+        backend_factory = load_or_import_from_config(
+            "RECORDS_REST_RECORD_CACHE", app=self.app
+        )
+        if not backend_factory:
+            return None
+        return RecordCache(
+            backend_factory(),
+            timeout=self.app.config["RECORDS_REST_RECORD_CACHE_TIMEOUT"],
+        )
+
+    @cached_property
+    def query_parser_cache(self):
+        """Parsed query strings cache or ``None`` if caching is disabled."""
+        backend_factory = load_or_import_from_config(
+            "RECORDS_REST_QUERY_PARSER_CACHE", app=self.app
+        )
+        if not backend_factory:
+            return None
+        return QueryParserCache(
+            backend_factory(),
+            timeout=self.app.config["RECORDS_REST_QUERY_PARSER_CACHE_TIMEOUT"],
+        )
+
+    @cached_property
+    def query_analyzer(self):
+        """Load the query complexity analyzer."""
+        return load_or_import_from_config("RECORDS_REST_QUERY_ANALYZER", app=self.app)
+
+    def count_rejected_query(self, violations):
+        """Count a rejected query string in :attr:`rejected_queries`.
+
+        :param violations: Kinds of limits exceeded by the query string.
+        """
+        with self._rejected_queries_lock:
+            self.rejected_queries.update(violations)
+
+    @cached_property
+    def search_executor(self):
+        """Thread pool for executing searches concurrently."""
+        return ThreadPoolExecutor(
+            max_workers=self.app.config["RECORDS_REST_SEARCH_THREADS"],
+            thread_name_prefix="records-rest-search",
+        )
+
+    @cached_property
+    def search_slots(self):
+        """Threads of the search thread pool available to aggregations."""
+        return threading.BoundedSemaphore(
+            self.app.config["RECORDS_REST_SEARCH_THREADS"]
+        )
+
+    @cached_property
+    def existence_index_executor(self):
+        """Thread for loading the existence indexes in the background.
+
+        It is separate from the search thread pool, so that the scans loading
+        the indexes do not delay concurrent aggregations.
+        """
+        return ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="records-rest-existence-index"
+        )
+
+    @cached_property
+    def existence_indexes(self):
+        """Existence indexes per endpoint, see ``check_search_existence``."""
+        return {}
+
+    @cached_property
+    def search_single_flight(self):
+        """Coalescing of identical searches or ``None`` if disabled."""
+        if not self.app.config["RECORDS_REST_SEARCH_SINGLE_FLIGHT"]:
+            return None
+        return SingleFlight()
+
+    @cached_property
+    def link_templates(self):
+        """Compiled link templates per endpoint."""
+        return {}
+
+    @cached_property
+    def search_cache_scope(self):
+        """Load search cache permission scope function."""
+        return load_or_import_from_config(
+            "RECORDS_REST_SEARCH_CACHE_SCOPE", app=self.app
+        )
+
     @cached_property
     def default_endpoint_prefixes(self):
         """Map between pid_type and endpoint_prefix."""
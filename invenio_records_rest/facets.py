@@ -7,6 +7,9 @@ See :data:`invenio_records_rest.config.RECORDS_REST_FACETS` for more
 information on how to specify aggregations and filters.
 """
 
+import operator
+from functools import reduce
+
 from flask import current_app, request
 from invenio_rest.errors import FieldError, RESTValidationError
 from invenio_search.engine import dsl
@@ -119,11 +122,12 @@ def range_filter(field, start_date_math=None, end_date_math=None, **kwargs):
     return inner
 
 
-def _create_filter_dsl(urlkwargs, definitions):
+def _create_filter_dsl(urlkwargs, definitions, args=None):
     """Create a filter DSL expression."""
+    request_values = request.values if args is None else args.values
     filters = []
     for name, filter_factory in definitions.items():
-        values = request.values.getlist(name, type=text_type)
+        values = request_values.getlist(name, type=text_type)
         if values:
             filters.append(filter_factory(values))
             for v in values:
@@ -132,22 +136,24 @@ def _create_filter_dsl(urlkwargs, definitions):
     return (filters, urlkwargs)
 
 
-def _post_filter(search, urlkwargs, definitions):
+def _post_filter(search, urlkwargs, definitions, args=None):
     """Ingest post filter in query."""
-    filters, urlkwargs = _create_filter_dsl(urlkwargs, definitions)
+    filters, urlkwargs = _create_filter_dsl(urlkwargs, definitions, args)
 
-    for filter_ in filters:
-        search = search.post_filter(filter_)
+    if filters:
+        search = search.post_filter(reduce(operator.and_, filters))
 
     return (search, urlkwargs)
 
 
-def _query_filter(search, urlkwargs, definitions):
+def _query_filter(search, urlkwargs, definitions, args=None):
     """Ingest query filter in query."""
-    filters, urlkwargs = _create_filter_dsl(urlkwargs, definitions)
+    filters, urlkwargs = _create_filter_dsl(urlkwargs, definitions, args)
 
-    for filter_ in filters:
-        search = search.filter(filter_)
+    # Same as calling ``search.filter()`` for each filter, but with a single
+    # copy of the search.
+    if filters:
+        search = search.query(dsl.Q("bool", filter=filters))
 
     return (search, urlkwargs)
 
@@ -165,7 +171,7 @@ def remove_filter_from_list(facet_filters, facet_names):
     return new_facet_filters
 
 
-def _aggregations(search, definitions, updated_filters={}, urlkwargs=None):
+def _aggregations(search, definitions, updated_filters={}, urlkwargs=None, args=None):
     """Add aggregations to query."""
     if definitions:
         for name, agg in definitions.items():
@@ -182,7 +188,7 @@ def _aggregations(search, definitions, updated_filters={}, urlkwargs=None):
                 #                     "aggs": {"filtered": {"term": {"field": "color"}}}}}}}
 
                 facet_filters, _ = _create_filter_dsl(
-                    urlkwargs, remove_filter_from_list(updated_filters, [name])
+                    urlkwargs, remove_filter_from_list(updated_filters, [name]), args
                 )
                 agg = {
                     "filter": {
@@ -198,7 +204,62 @@ def _aggregations(search, definitions, updated_filters={}, urlkwargs=None):
     return search
 
 
-def default_facets_factory(search, index):
+class CompiledFacets(object):
+    """Facets definition of an index compiled into search engine DSL objects.
+
+    The aggregations are converted once instead of on every request. They are
+    shared between searches and must not be modified in place; use a callable
+    aggregation definition for aggregations which depend on the request.
+    """
+
+    def __init__(self, facets):
+        """Compile a facets definition.
+
+        :param facets: Facets definition of an index (see
+            :data:`invenio_records_rest.config.RECORDS_REST_FACETS`).
+        """
+        self.definition = facets
+        self.fingerprint = _facets_fingerprint(facets)
+        self.aggs = {
+            name: agg if callable(agg) else dsl.A(agg)
+            for name, agg in facets.get("aggs", {}).items()
+        }
+        self.filters = facets.get("filters", {})
+        self.post_filters = facets.get("post_filters", {})
+
+
+def _facets_fingerprint(facets):
+    """Identities of the aggregations and filters of a facets definition."""
+    return tuple(
+        tuple((name, id(value)) for name, value in facets.get(section, {}).items())
+        for section in ("aggs", "filters", "post_filters")
+    )
+
+
+_compiled_facets = {}
+
+
+def compile_facets(facets):
+    """Get the compiled version of a facets definition.
+
+    Compiled definitions are cached per definition object. The cache entry is
+    compiled again if aggregations or filters were added, removed or replaced
+    in the definition; changes nested inside an aggregation are not detected.
+
+    :param facets: Facets definition of an index.
+    :returns: A :class:`CompiledFacets` instance.
+    """
+    compiled = _compiled_facets.get(id(facets))
+    if (
+        compiled is None
+        or compiled.definition is not facets
+        or compiled.fingerprint != _facets_fingerprint(facets)
+    ):
+        compiled = _compiled_facets[id(facets)] = CompiledFacets(facets)
+    return compiled
+
+
+def default_facets_factory(search, index, args=None):
     """Add a default facets to query.
 
     It's possible to select facets which should be added to query
@@ -206,6 +267,9 @@ def default_facets_factory(search, index):
 
     :param search: Basic search object.
     :param index: Index name.
+    :param args: Parsed request arguments
+        (:class:`invenio_records_rest.utils.SearchArgs`). By default, the
+        arguments are read from the current request.
     :returns: A tuple containing the new search object and a dictionary with
         all fields and values used.
     """
@@ -213,11 +277,17 @@ def default_facets_factory(search, index):
 
     facets = current_app.config["RECORDS_REST_FACETS"].get(index)
     if facets is not None:
+        facets = compile_facets(facets)
         # Aggregations.
         # First get requested facets, also split by ',' to get facets names
         # if they were provided as list separated by comma.
-        selected_facets = make_comma_list_a_list(request.args.getlist("facets", None))
-        all_aggs = facets.get("aggs", {})
+        if args is None:
+            selected_facets = make_comma_list_a_list(
+                request.args.getlist("facets", None)
+            )
+        else:
+            selected_facets = args.facets
+        all_aggs = facets.aggs
 
         # This parameter is a bit tricky. Let's go first with an example to see the goal.
         # Imagine a website that sells cars, where the cars can be filtered by two categories: brand and color.
@@ -232,14 +302,16 @@ def default_facets_factory(search, index):
         #    restrictions will be applied to the other categories, so brand: bmw, mercedes, ferrari,... (since the
         #    filter on ferrari is not applied on the brand, and color: red (since all the ferraris are red).
         if current_app.config["RECORDS_REST_FACETS_POST_FILTERS_PROPAGATE"]:
-            updated_filters = facets.get("post_filters", {})
+            updated_filters = facets.post_filters
         else:
             updated_filters = {}
 
         # If no facets were requested, assume default behaviour - Take all.
         if all_aggs:
             if not selected_facets:
-                search = _aggregations(search, all_aggs, updated_filters, urlkwargs)
+                search = _aggregations(
+                    search, all_aggs, updated_filters, urlkwargs, args
+                )
             # otherwise, check if there are facets to chose
             else:
                 aggs = {}
@@ -247,14 +319,12 @@ def default_facets_factory(search, index):
                 for facet_name, facet_body in all_aggs.items():
                     if facet_name in selected_facets:
                         aggs.update({facet_name: facet_body})
-                search = _aggregations(search, aggs, updated_filters, urlkwargs)
+                search = _aggregations(search, aggs, updated_filters, urlkwargs, args)
 
         # Query filter
-        search, urlkwargs = _query_filter(search, urlkwargs, facets.get("filters", {}))
+        search, urlkwargs = _query_filter(search, urlkwargs, facets.filters, args)
 
         # Post filter
-        search, urlkwargs = _post_filter(
-            search, urlkwargs, facets.get("post_filters", {})
-        )
+        search, urlkwargs = _post_filter(search, urlkwargs, facets.post_filters, args)
 
     return (search, urlkwargs)
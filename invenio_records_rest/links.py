@@ -7,10 +7,113 @@ Link factory can be specified as ``links_factory_impl`` in
 :data:`invenio_records_rest.config.RECORDS_REST_ENDPOINTS` configuration.
 """
 
-from flask import request, url_for
+from flask import current_app, has_request_context, request, url_for
 
 from .proxies import current_records_rest
 
+_PLACEHOLDER = "__records_rest_url_value__"
+
+_MISSING = object()
+
+
+class LinkTemplate(object):
+    """URL of an endpoint with a single URL variable.
+
+    The URL path is split around the variable, so that formatting a link only
+    requires converting the value with the converter of the URL rule (e.g.
+    :class:`invenio_records_rest.utils.PIDPathConverter`) instead of building
+    the URL with the URL map. The path is relative to the application root, so
+    that the same template serves all hosts.
+    """
+
+    def __init__(self, prefix, suffix, converter):
+        """Initialize the template.
+
+        :param prefix: URL path before the variable.
+        :param suffix: URL path after the variable.
+        :param converter: URL converter of the variable.
+        """
+        self.prefix = prefix
+        self.suffix = suffix
+        self.converter = converter
+
+    def format(self, value, root_url=""):
+        """Build the URL for a value of the variable.
+
+        :param value: Value of the URL variable.
+        :param root_url: Scheme, host and script root prepended to the path.
+        """
+        return root_url + self.prefix + self.converter.to_url(value) + self.suffix
+
+
+def compile_link_template(endpoint, name):
+    """Compile the URL path of an endpoint into a template.
+
+    Must be called within a request context.
+
+    :param endpoint: Endpoint name (relative endpoints are not supported).
+    :param name: Name of the URL variable.
+    :returns: A :class:`LinkTemplate` or ``None`` if the URL can not be
+        compiled (e.g. the endpoint has several URL rules).
+    """
+    rules = list(current_app.url_map.iter_rules(endpoint))
+    if len(rules) != 1 or rules[0].arguments != {name}:
+        return None
+    if current_app.url_map.host_matching or rules[0].subdomain:
+        return None
+    converter = rules[0]._converters[name]
+    path = url_for(endpoint, **{name: _PLACEHOLDER})
+    script_root = request.script_root.rstrip("/")
+    if not path.startswith(script_root):
+        return None
+    parts = path[len(script_root) :].split(_PLACEHOLDER)
+    if len(parts) != 2:
+        return None
+    return LinkTemplate(parts[0], parts[1], converter)
+
+
+def _link_root_url(req, key, endpoint, name, template):
+    """Get the scheme, host and script root of a template in a request."""
+    root_urls = req.__dict__.setdefault("_link_root_urls", {})
+    root_url = root_urls.get(key, _MISSING)
+    if root_url is _MISSING:
+        url = url_for(endpoint, _external=True, **{name: _PLACEHOLDER})
+        path = template.prefix + _PLACEHOLDER + template.suffix
+        root_url = root_urls[key] = url[: -len(path)] if url.endswith(path) else None
+    return root_url
+
+
+def build_link(endpoint, name, value):
+    """Build the external URL of an endpoint with a single URL variable.
+
+    Equivalent to ``url_for(endpoint, _external=True, **{name: value})``, but
+    the URL path is compiled once per endpoint into a :class:`LinkTemplate`,
+    and the scheme, host and script root once per request.
+
+    :param endpoint: Endpoint name, e.g. ``.recid_item``.
+    :param name: Name of the URL variable.
+    :param value: Value of the URL variable.
+    :returns: The URL.
+    """
+    if not has_request_context():
+        return url_for(endpoint, _external=True, **{name: value})
+    req = request._get_current_object()
+    templates = current_records_rest.link_templates
+    key = (endpoint, name, req.blueprint)
+    template = templates.get(key, _MISSING)
+    if template is _MISSING:
+        full_endpoint = endpoint
+        if endpoint.startswith("."):
+            # Same resolution of relative endpoints as ``url_for``.
+            full_endpoint = req.blueprint + endpoint if req.blueprint else endpoint[1:]
+        template = templates[key] = compile_link_template(full_endpoint, name)
+    root_url = None
+    if template is not None:
+        root_url = _link_root_url(req, key, endpoint, name, template)
+    if root_url is None:
+        return url_for(endpoint, _external=True, **{name: value})
+    return template.format(value, root_url=root_url)
+
 
 def default_links_factory(pid, record=None, **kwargs):
     """Factory for record links generation.
@@ -21,7 +124,7 @@ def default_links_factory(pid, record=None, **kwargs):
     endpoint = ".{0}_item".format(
         current_records_rest.default_endpoint_prefixes[pid.pid_type]
     )
-    links = dict(self=url_for(endpoint, pid_value=pid.pid_value, _external=True))
+    links = dict(self=build_link(endpoint, "pid_value", pid.pid_value))
     return links
 
 
@@ -3,15 +3,143 @@
 
 """Query factories for REST API."""
 
+import re
+
 from flask import current_app, request
 from invenio_search.engine import dsl
 
-from .errors import InvalidQueryRESTError
+from .errors import InvalidQueryRESTError, QueryTooComplexRESTError
+from .proxies import current_records_rest
+from .utils import SearchArgs
+
+_QUERY_TOKEN = re.compile(
+    r"""
+    (?P<phrase>"(?:\\.|[^"\\])*"(?:~[\d.]*)?)
+    | (?P<regex>/(?:\\.|[^/\\])*/)
+    | (?P<range>[\[{][^\]}]*[\]}])
+    | (?P<operator>\bAND\b|\bOR\b|\bNOT\b|&&|\|\||[()+\-!])
+    | (?P<term>(?:\\.|[^\s()"/\[\]{}])+)
+    """,
+    re.VERBOSE,
+)
+"""Tokens of the query string syntax."""
+
+_FIELD_PREFIX = re.compile(r"^((?:\\.|[^:\\])+):")
+"""Field name at the start of a term (e.g. ``title:``)."""
+
+_WILDCARD = re.compile(r"(?<!\\)[*?]")
+"""Unescaped wildcard characters."""
+
+
+def default_query_analyzer(query_string, limits):
+    """Check the complexity of a query string before it is executed.
+
+    The query string is scanned with the query string syntax of the search
+    engine, without parsing it into a query. The supported limits are:
+
+    - ``max_clauses``: maximum number of terms, phrases, ranges and regular
+      expressions.
+    - ``allow_leading_wildcard``: whether terms may start with a wildcard
+      (a single ``*`` is always allowed).
+    - ``max_wildcards``: maximum number of wildcards in the query.
+    - ``max_regex_length``: maximum length of a regular expression.
+    - ``max_fuzziness``: maximum edit distance of fuzzy terms (``term~2``).
+    - ``max_fuzzy_terms``: maximum number of fuzzy terms.
+    - ``text_fields``: fields on which range queries are not allowed.
+
+    Missing limits are not checked.
+
+    :param query_string: The query string (``q`` argument).
+    :param limits: Dictionary of limits.
+    :returns: List of the kinds of exceeded limits (empty if none).
+    """
+    violations = set()
+    clauses = wildcards = fuzzy_terms = 0
+    text_fields = set(limits.get("text_fields", ()))
+    field = None
+    for match in _QUERY_TOKEN.finditer(query_string):
+        kind, token = match.lastgroup, match.group()
+        if kind == "operator":
+            field = None
+            continue
+        if kind == "term":
+            prefix = _FIELD_PREFIX.match(token)
+            if prefix:
+                field = prefix.group(1)
+                token = token[prefix.end() :]
+                if not token:
+                    # The value is the next token, e.g. ``title:/regex/``.
+                    continue
+        clauses += 1
+        if kind == "regex":
+            if len(token) - 2 > limits.get("max_regex_length", float("inf")):
+                violations.add("regex")
+        elif kind == "range":
+            if field in text_fields:
+                violations.add("text_range")
+        elif kind == "term":
+            if token[0] in "<>" and field in text_fields:
+                violations.add("text_range")
+            value, tilde, fuzziness = token.partition("~")
+            if tilde:
+                fuzzy_terms += 1
+                try:
+                    fuzziness = int(fuzziness) if fuzziness else 2
+                except ValueError:
+                    fuzziness = 2
+                if fuzziness > limits.get("max_fuzziness", float("inf")):
+                    violations.add("fuzziness")
+            if value != "*":
+                count = len(_WILDCARD.findall(value))
+                wildcards += count
+                if (
+                    count
+                    and value[0] in "*?"
+                    and not limits.get("allow_leading_wildcard", True)
+                ):
+                    violations.add("leading_wildcard")
+        field = None
+
+    if clauses > limits.get("max_clauses", float("inf")):
+        violations.add("clauses")
+    if wildcards > limits.get("max_wildcards", float("inf")):
+        violations.add("wildcards")
+    if fuzzy_terms > limits.get("max_fuzzy_terms", float("inf")):
+        violations.add("fuzzy_terms")
+    return sorted(violations)
+
+
+def check_query_complexity(view, query_string):
+    """Reject query strings exceeding the complexity limits of an endpoint.
+
+    :param view: REST view, whose ``query_limits`` attribute (if any)
+        overrides :data:`invenio_records_rest.config.RECORDS_REST_DEFAULT_QUERY_LIMITS`.
+    :param query_string: The query string.
+    :raises invenio_records_rest.errors.QueryTooComplexRESTError: If a limit
+        is exceeded.
+    """
+    limits = getattr(view, "query_limits", None)
+    if limits is None:
+        limits = current_app.config["RECORDS_REST_DEFAULT_QUERY_LIMITS"]
+    if not limits or not query_string:
+        return
+    violations = current_records_rest.query_analyzer(query_string, limits)
+    if violations:
+        current_records_rest.count_rejected_query(violations)
+        current_app.logger.debug(
+            "Rejected query ({0}): {1}".format(", ".join(violations), query_string)
+        )
+        raise QueryTooComplexRESTError(violations=violations)
 
 
 def default_search_factory(self, search, query_parser=None):
     """Parse query using the search engine DSL query.
 
+    Query strings are first checked against the complexity limits of the
+    endpoint (see :func:`check_query_complexity`). If
+    :data:`invenio_records_rest.config.RECORDS_REST_QUERY_PARSER_CACHE` is
+    set, the parsed queries are cached per query string.
+
     :param self: REST view.
     :param search: search engine DSL search instance.
     :returns: Tuple with search instance and URL arguments.
@@ -26,21 +154,30 @@ def default_search_factory(self, search, query_parser=None):
     from .facets import default_facets_factory
     from .sorter import default_sorter_factory
 
-    query_string = request.values.get("q")
+    args = SearchArgs.from_request()
+    query_string = args.q
     query_parser = query_parser or _default_parser
+    query_parser_cache = current_records_rest.query_parser_cache
+    check_query_complexity(self, query_string)
 
     try:
-        search = search.query(query_parser(query_string))
+        if query_parser_cache is not None:
+            query = query_parser_cache.parse(
+                query_parser, query_string, scope=request.endpoint
+            )
+        else:
+            query = query_parser(query_string)
+        search = search.query(query)
     except SyntaxError:
         current_app.logger.debug(
-            "Failed parsing query: {0}".format(request.values.get("q", "")),
+            "Failed parsing query: {0}".format(query_string or ""),
             exc_info=True,
         )
         raise InvalidQueryRESTError()
 
     search_index = getattr(search, "_original_index", search._index)[0]
-    search, urlkwargs = default_facets_factory(search, search_index)
-    search, sortkwargs = default_sorter_factory(search, search_index)
+    search, urlkwargs = default_facets_factory(search, search_index, args=args)
+    search, sortkwargs = default_sorter_factory(search, search_index, args=args)
     for key, value in sortkwargs.items():
         urlkwargs.add(key, value)
 
@@ -4,8 +4,8 @@
 """Record serialization."""
 
 from ..schemas import RecordSchemaJSONV1
-from .json import JSONSerializer
-from .response import record_responsify, search_responsify
+from .json import JSONIdsSerializer, JSONSerializer
+from .response import record_responsify, search_responsify, search_stream_responsify
 
 json_v1 = JSONSerializer(RecordSchemaJSONV1)
 """JSON v1 serializer."""
@@ -15,3 +15,17 @@ json_v1_response = record_responsify(json_v1, "application/json")
 
 json_v1_search = search_responsify(json_v1, "application/json")
 """JSON search response builder that uses the JSON v1 serializer."""
+
+json_v1_search_stream = search_stream_responsify(json_v1, "application/json")
+"""JSON streaming search response builder that uses the JSON v1 serializer."""
+
+json_v1_ids = JSONIdsSerializer()
+"""JSON serializer of search results as lists of persistent identifiers."""
+
+json_v1_search_ids = search_responsify(json_v1_ids, "application/x-ids+json")
+"""JSON search response builder returning only the persistent identifiers.
+
+Add it to the ``search_serializers`` of an endpoint (e.g. with the ``ids``
+alias in ``search_serializers_aliases``) to list identifiers without
+fetching and serializing the records.
+"""
@@ -6,6 +6,8 @@
 
 import copy
 
+from ..utils import get_requested_fields, select_fields
+
 
 class SerializerMixinInterface(object):
     """Mixin serializing records.
@@ -46,6 +48,22 @@ class SerializerMixinInterface(object):
         """
         raise NotImplementedError()
 
+    def serialize_search_stream(
+        self, pid_fetcher, hits, links=None, item_links_factory=None, **kwargs
+    ):
+        """Serialize an iterable of search hits as a stream of chunks.
+
+        Used for exporting full result sets, hence implementations should
+        not hold more than one hit in memory at a time.
+
+        :param pid_fetcher: Persistent identifier fetcher.
+        :param hits: Iterable of raw search engine hits.
+        :param links: Dictionary of links to add to response.
+        :param item_links_factory: Factory function for record links.
+        :returns: Iterator of serialized chunks.
+        """
+        raise NotImplementedError()
+
     def serialize_oaipmh(self, pid, record):
         """Serialize a single record for OAI-PMH.
 
@@ -101,6 +119,13 @@ class PreprocessorMixinInterface(object):
     This class builds a dictionary which is then transformed and serialized.
     """
 
+    source_fields = None
+    """Paths of the ``_source`` fields used to serialize search hits.
+
+    If set, only these fields are fetched from the search engine when the
+    serializer is used for a search. ``None`` fetches the full documents.
+    """
+
     def preprocess_record(self, pid, record, links_factory=None, **kwargs):
         """Prepare a record and persistent identifier for serialization.
 
@@ -124,19 +149,33 @@ class PreprocessorMixinInterface(object):
 class PreprocessorMixin(PreprocessorMixinInterface):
     """Base class for serializers."""
 
-    def __init__(self, replace_refs=False, **kwargs):
-        """Constructor."""
+    def __init__(self, replace_refs=False, source_fields=None, **kwargs):
+        """Constructor.
+
+        :param replace_refs: Replace the JSON references of the records.
+        :param source_fields: Paths of the ``_source`` fields used to
+            serialize search hits (see :attr:`source_fields`).
+        """
         super().__init__(**kwargs)
         self.replace_refs = replace_refs
+        if source_fields is not None:
+            self.source_fields = source_fields
 
     def preprocess_record(self, pid, record, links_factory=None, **kwargs):
-        """Prepare a record and persistent identifier for serialization."""
+        """Prepare a record and persistent identifier for serialization.
+
+        If a subset of fields was requested with the ``fields`` query string
+        argument, only these fields of the record are serialized.
+        """
         links_factory = links_factory or (lambda x, record=None, **k: dict())
         metadata = (
             copy.deepcopy(record.replace_refs())
             if self.replace_refs
             else record.dumps()
         )
+        fields = get_requested_fields()
+        if fields:
+            metadata = select_fields(metadata, fields)
         return dict(
             pid=pid,
             metadata=metadata,
@@ -163,4 +202,8 @@ class PreprocessorMixin(PreprocessorMixinInterface):
             if key in record["metadata"]:
                 record[key[1:]] = record["metadata"][key]
                 del record["metadata"][key]
+        # Drop fields only fetched for internal use (e.g. by the PID fetcher).
+        fields = get_requested_fields()
+        if fields:
+            record["metadata"] = select_fields(record["metadata"], fields)
         return record
@@ -32,6 +32,9 @@ class CSVSerializer(SerializerMixinInterface, MarshmallowMixin, PreprocessorMixi
     records.
     """
 
+    derive_source_fields = True
+    """Fetch only the ``_source`` fields of the included columns for searches."""
+
     def __init__(self, *args, **kwargs):
         """Initialize CSVSerializer.
 
@@ -51,6 +54,33 @@ class CSVSerializer(SerializerMixinInterface, MarshmallowMixin, PreprocessorMixi
         self.header_separator = kwargs.pop("header_separator", "_")
         super().__init__(*args, **kwargs)
 
+    def _derive_source_fields(self, source_paths):
+        """Get the ``_source`` fields read for the included fields.
+
+        A field of the schema is kept if its name is part of an included
+        field. If it dumps the whole ``_source`` (e.g. ``metadata`` in
+        :class:`invenio_records_rest.schemas.json.RecordSchemaJSONV1`), every
+        key the included fields can refer to is fetched.
+        """
+        if source_paths is None or not self.csv_included_fields:
+            return super()._derive_source_fields(source_paths)
+        paths = set()
+        for name, field_paths in source_paths.items():
+            if not self.key_in_field(name, self.csv_included_fields):
+                continue
+            for path in field_paths:
+                if path:
+                    paths.add(path)
+                    continue
+                prefix = name + self.header_separator
+                for field in self.csv_included_fields:
+                    start = field.find(prefix)
+                    while start != -1:
+                        rest = field[start + len(prefix) :]
+                        paths.update(rest[:end] for end in range(1, len(rest) + 1))
+                        start = field.find(prefix, start + 1)
+        return sorted(paths)
+
     def serialize(self, pid, record, links_factory=None):
         """Serialize a single record and persistent identifier.
 
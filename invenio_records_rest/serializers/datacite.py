@@ -20,6 +20,9 @@ class BaseDataCiteSerializer(MarshmallowMixin, PreprocessorMixin):
     records.
     """
 
+    derive_source_fields = True
+    """Fetch only the ``_source`` fields read by the schema for searches."""
+
     schema = None
     """Class variable to define which schema use."""
     version = None
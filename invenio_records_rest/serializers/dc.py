@@ -19,6 +19,9 @@ class DublinCoreSerializer(
     records.
     """
 
+    derive_source_fields = True
+    """Fetch only the ``_source`` fields read by the schema for searches."""
+
     def serialize(self, pid, record, links_factory=None):
         """Serialize a single record and persistent identifier.
 
@@ -5,6 +5,7 @@
 
 from flask import json, request
 
+from ..utils import is_partial_search_result
 from .base import PreprocessorMixin, SerializerMixinInterface
 from .marshmallow import MarshmallowMixin
 
@@ -43,31 +44,112 @@ class JSONSerializerMixin(SerializerMixinInterface):
     ):
         """Serialize a search result.
 
+        If the search result is partial (e.g. the search timed out), the
+        ``timed_out`` and ``terminated_early`` flags and the shards statistics
+        of the search engine are included.
+
         :param pid_fetcher: Persistent identifier fetcher.
         :param search_result: The search engine result.
         :param links: Dictionary of links to add to response.
         """
-        total = search_result["hits"]["total"]["value"]
-        return json.dumps(
-            dict(
-                hits=dict(
-                    hits=[
-                        self.transform_search_hit(
-                            pid_fetcher(hit["_id"], hit["_source"]),
-                            hit,
-                            links_factory=item_links_factory,
-                            **kwargs
-                        )
-                        for hit in search_result["hits"]["hits"]
-                    ],
-                    total=total,
-                ),
-                links=links or {},
-                aggregations=search_result.get("aggregations", dict()),
+        return self._dump_search(
+            [
+                self.transform_search_hit(
+                    pid_fetcher(hit["_id"], hit["_source"]),
+                    hit,
+                    links_factory=item_links_factory,
+                    **kwargs
+                )
+                for hit in search_result["hits"]["hits"]
+            ],
+            search_result,
+            links=links,
+        )
+
+    def _dump_search(self, hits, search_result, links=None):
+        """Dump the transformed hits of a search result as JSON.
+
+        :param hits: List of transformed hits.
+        :param search_result: The search engine result.
+        :param links: Dictionary of links to add to response.
+        """
+        data = dict(
+            hits=dict(
+                hits=hits,
+                total=search_result["hits"]["total"]["value"],
             ),
-            **self._format_args()
+            links=links or {},
+            aggregations=search_result.get("aggregations", dict()),
         )
+        if is_partial_search_result(search_result):
+            shards = search_result.get("_shards", {})
+            data.update(
+                timed_out=search_result.get("timed_out", False),
+                terminated_early=search_result.get("terminated_early", False),
+                _shards={k: v for k, v in shards.items() if k != "failures"},
+            )
+        return json.dumps(data, **self._format_args())
+
+    def serialize_search_stream(
+        self, pid_fetcher, hits, links=None, item_links_factory=None, **kwargs
+    ):
+        """Serialize an iterable of search hits as a stream of JSON chunks.
+
+        The output has the same structure as :meth:`serialize_search`, except
+        that the total and the aggregations are not included.
+
+        :param pid_fetcher: Persistent identifier fetcher.
+        :param hits: Iterable of raw search engine hits.
+        :param links: Dictionary of links to add to response.
+        :param item_links_factory: Factory function for record links.
+        """
+        format_args = self._format_args()
+        yield '{"hits":{"hits":['
+        for idx, hit in enumerate(hits):
+            if idx:
+                yield ","
+            yield json.dumps(
+                self.transform_search_hit(
+                    pid_fetcher(hit["_id"], hit["_source"]),
+                    hit,
+                    links_factory=item_links_factory,
+                    **kwargs
+                ),
+                **format_args
+            )
+        yield ']},"links":' + json.dumps(links or {}, **format_args) + "}"
 
 
 class JSONSerializer(JSONSerializerMixin, MarshmallowMixin, PreprocessorMixin):
     """Marshmallow based JSON serializer for records."""
+
+
+class JSONIdsSerializer(JSONSerializerMixin):
+    """JSON serializer of search results as lists of persistent identifiers.
+
+    Each hit is serialized as its persistent identifier value, without
+    preprocessing or transforming the record. Only the fields needed by the
+    persistent identifier fetcher are fetched from the search engine (see
+    the ``required_source_fields`` endpoint option).
+    """
+
+    source_fields = []
+    """No other ``_source`` fields are needed."""
+
+    def serialize_search(
+        self, pid_fetcher, search_result, links=None, item_links_factory=None, **kwargs
+    ):
+        """Serialize a search result.
+
+        :param pid_fetcher: Persistent identifier fetcher.
+        :param search_result: The search engine result.
+        :param links: Dictionary of links to add to response.
+        """
+        return self._dump_search(
+            [
+                pid_fetcher(hit["_id"], hit["_source"]).pid_value
+                for hit in search_result["hits"]["hits"]
+            ],
+            search_result,
+            links=links,
+        )
@@ -5,17 +5,127 @@
 
 """Base class for Marshmallow based serializers."""
 
+from marshmallow import Schema, fields
+
 from ..schemas import RecordSchemaJSONV1
 from .base import TransformerMixinInterface
 
+_RECORD_ATTRIBUTES = ("pid", "links", "revision", "created", "updated")
+"""Attributes of the intermediate representation not read from ``_source``."""
+
+
+class _UnknownSourcePaths(Exception):
+    """A schema reads values which can not be derived from its fields."""
+
+
+def _field_source_paths(field, path, in_metadata):
+    """Get the ``_source`` paths read by a schema field.
+
+    :param field: Marshmallow field.
+    :param path: Attribute (or name) of the field.
+    :param in_metadata: Whether the field belongs to a schema of the record
+        metadata instead of the intermediate representation of the record.
+    :returns: List of paths, the empty path standing for the whole source.
+    """
+    if getattr(field, "load_only", False) or isinstance(field, fields.Constant):
+        return []
+    if isinstance(field, (fields.Method, fields.Function)):
+        raise _UnknownSourcePaths()
+    if in_metadata:
+        return [path]
+    parts = path.split(".")
+    if parts[0] != "metadata":
+        # Other attributes of the intermediate representation.
+        return []
+    if len(parts) > 1:
+        return [".".join(parts[1:])]
+    nested = getattr(field, "nested", None)
+    if isinstance(nested, type) and issubclass(nested, Schema):
+        return sorted(
+            {
+                source_path
+                for source_paths in _schema_source_paths(nested, True).values()
+                for source_path in source_paths
+            }
+        )
+    return [""]
+
+
+def _schema_source_paths(schema_class, in_metadata=False):
+    """Get the ``_source`` paths read by each field of a schema."""
+    hooks = getattr(schema_class, "_hooks", None) or getattr(
+        schema_class, "__processors__", None
+    )
+    if hooks and any("dump" in str(key) for key, value in hooks.items() if value):
+        # Dump hooks may read any value.
+        raise _UnknownSourcePaths()
+    return {
+        getattr(field, "data_key", None)
+        or getattr(field, "dump_to", None)
+        or name: (_field_source_paths(field, field.attribute or name, in_metadata))
+        for name, field in schema_class._declared_fields.items()
+    }
+
+
+def schema_source_paths(schema_class):
+    """Get the ``_source`` paths read by the fields of a record schema.
+
+    The paths are derived from the ``attribute`` (or name) of the fields of a
+    schema dumping the intermediate representation of the records (e.g.
+    ``attribute="metadata.title"``), including the fields of a schema nested
+    as ``metadata``.
+
+    :param schema_class: Marshmallow schema class.
+    :returns: Dictionary mapping the name of each dumped field to the list of
+        paths it reads, the empty path standing for the whole ``_source``, or
+        ``None`` if a field reads values which can not be derived (e.g. method
+        fields and dump hooks).
+    """
+    try:
+        return _schema_source_paths(schema_class)
+    except _UnknownSourcePaths:
+        return None
+
 
 class MarshmallowMixin(TransformerMixinInterface):
     """Base class for marshmallow serializers."""
 
+    derive_source_fields = False
+    """Whether to derive the ``_source`` fields from the schema fields.
+
+    Used if the schema class does not declare ``source_fields``, see
+    :func:`schema_source_paths`. Disabled by default, as links factories may
+    read other fields of the search hits.
+    """
+
     def __init__(self, schema_class=RecordSchemaJSONV1, **kwargs):
-        """Initialize record."""
+        """Initialize record.
+
+        The ``_source`` fields used to serialize search hits can be declared
+        with a ``source_fields`` attribute on the schema class.
+        """
         self.schema_class = schema_class
         super().__init__(**kwargs)
+        if getattr(self, "source_fields", None) is None:
+            self.source_fields = getattr(schema_class, "source_fields", None)
+        if self.source_fields is None and self.derive_source_fields:
+            self.source_fields = self._derive_source_fields(
+                schema_source_paths(schema_class)
+            )
+
+    def _derive_source_fields(self, source_paths):
+        """Get the ``_source`` fields from the paths read by the schema fields.
+
+        :param source_paths: Result of :func:`schema_source_paths`.
+        :returns: List of field paths, or ``None`` if the whole ``_source``
+            is needed.
+        """
+        if source_paths is None:
+            return None
+        paths = {path for field_paths in source_paths.values() for path in field_paths}
+        if "" in paths:
+            return None
+        return sorted(paths)
 
     def dump(self, obj, context=None):
         """Serialize object with schema."""
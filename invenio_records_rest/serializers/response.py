@@ -6,22 +6,54 @@
 Responsible for creating a HTTP response given the output of a serializer.
 """
 
-from flask import current_app
+from flask import current_app, has_request_context, request, stream_with_context
+
+from ..proxies import current_records_rest
 
 
 def record_responsify(serializer, mimetype):
     """Create a Records-REST response serializer.
 
+    If a record cache is configured (see
+    :data:`invenio_records_rest.config.RECORDS_REST_RECORD_CACHE`), the
+    serialized records of ``GET`` requests are cached.
+
+    The serializer is available as the ``serializer`` attribute of the
+    returned function, e.g. to embed records in a multi-get response.
+
     :param serializer: Serializer instance.
     :param mimetype: MIME type of response.
     :returns: Function that generates a record HTTP response.
     """
 
     def view(pid, record, code=200, headers=None, links_factory=None):
-        response = current_app.response_class(
-            serializer.serialize(pid, record, links_factory=links_factory),
-            mimetype=mimetype,
-        )
+        record_cache = current_records_rest.record_cache
+        key = data = None
+        if (
+            record_cache is not None
+            and code == 200
+            and headers is None
+            and has_request_context()
+            and request.method in ("GET", "HEAD")
+        ):
+            key = record_cache.make_key(
+                pid,
+                record,
+                mimetype,
+                request.endpoint,
+                request.root_url,
+                sorted(request.args.items(multi=True)),
+                current_records_rest.search_cache_scope(),
+            )
+            data = record_cache.get(key)
+        if data is None:
+            data = serializer.serialize(pid, record, links_factory=links_factory)
+            if key is not None:
+                if isinstance(data, str):
+                    data = data.encode("utf-8")
+                record_cache.set(key, data)
+
+        response = current_app.response_class(data, mimetype=mimetype)
         response.status_code = code
         response.cache_control.no_cache = True
         response.set_etag(str(record.revision_id))
@@ -34,12 +66,16 @@ def record_responsify(serializer, mimetype):
 
         return response
 
+    view.serializer = serializer
     return view
 
 
 def search_responsify(serializer, mimetype):
     """Create a Records-REST search result response serializer.
 
+    The serializer is available as the ``serializer`` attribute of the
+    returned function, e.g. to find the ``_source`` fields it needs.
+
     :param serializer: Serializer instance.
     :param mimetype: MIME type of response.
     :returns: Function that generates a record HTTP response.
@@ -71,6 +107,50 @@ def search_responsify(serializer, mimetype):
 
         return response
 
+    view.serializer = serializer
+    return view
+
+
+def search_stream_responsify(serializer, mimetype):
+    """Create a Records-REST streaming search response serializer.
+
+    The response body is produced lazily by the serializer's
+    ``serialize_search_stream`` method, so that arbitrarily large result sets
+    can be sent as a chunked response.
+
+    :param serializer: Serializer instance.
+    :param mimetype: MIME type of response.
+    :returns: Function that generates a streamed HTTP response.
+    """
+
+    def view(
+        pid_fetcher,
+        hits,
+        code=200,
+        headers=None,
+        links=None,
+        item_links_factory=None,
+    ):
+        response = current_app.response_class(
+            stream_with_context(
+                serializer.serialize_search_stream(
+                    pid_fetcher,
+                    hits,
+                    links=links,
+                    item_links_factory=item_links_factory,
+                )
+            ),
+            mimetype=mimetype,
+        )
+        response.status_code = code
+        if headers is not None:
+            response.headers.extend(headers)
+
+        if links is not None:
+            add_link_header(response, links)
+
+        return response
+
     return view
 
 
@@ -98,20 +98,95 @@ def eval_field(field, asc):
         return {key: {"order": "asc" if key_asc else "desc"}}
 
 
-def default_sorter_factory(search, index):
+class CompiledSortOptions(object):
+    """Sort options of an index with the sort fields evaluated in advance.
+
+    Fields defined as strings or dictionaries are evaluated once for both
+    orders, while callable fields are still evaluated on each request.
+    """
+
+    def __init__(self, sort_options):
+        """Compile sort options.
+
+        :param sort_options: Sort options of an index (see
+            :data:`invenio_records_rest.config.RECORDS_REST_SORT_OPTIONS`).
+        """
+        self.definition = sort_options
+        self.fingerprint = _sort_options_fingerprint(sort_options)
+        self.fields = {
+            key: {
+                asc: [f if callable(f) else eval_field(f, asc) for f in opts["fields"]]
+                for asc in (True, False)
+            }
+            for key, opts in sort_options.items()
+        }
+
+    def eval_fields(self, key, asc):
+        """Get the sort fields of a sort option.
+
+        :param key: Name of the sort option.
+        :param asc: ``True`` if order is ascending, ``False`` if descending.
+        :returns: List of sort fields or ``None`` if the option is unknown.
+        """
+        fields = self.fields.get(key)
+        if fields is None:
+            return None
+        return [f(asc) if callable(f) else f for f in fields[asc]]
+
+
+def _sort_options_fingerprint(sort_options):
+    """Identities of the sort options and their fields."""
+    return tuple(
+        (key, id(opts), id(opts["fields"]), len(opts["fields"]))
+        for key, opts in sort_options.items()
+    )
+
+
+_compiled_sort_options = {}
+
+
+def compile_sort_options(sort_options):
+    """Get the compiled version of the sort options of an index.
+
+    Compiled sort options are cached per sort options object. The cache entry
+    is compiled again if options were added, removed or replaced, or if their
+    list of fields was replaced or resized.
+
+    :param sort_options: Sort options of an index.
+    :returns: A :class:`CompiledSortOptions` instance.
+    """
+    compiled = _compiled_sort_options.get(id(sort_options))
+    if (
+        compiled is None
+        or compiled.definition is not sort_options
+        or compiled.fingerprint != _sort_options_fingerprint(sort_options)
+    ):
+        compiled = _compiled_sort_options[id(sort_options)] = CompiledSortOptions(
+            sort_options
+        )
+    return compiled
+
+
+def default_sorter_factory(search, index, args=None):
     """Default sort query factory.
 
     :param query: Search query.
     :param index: Index to search in.
+    :param args: Parsed request arguments
+        (:class:`invenio_records_rest.utils.SearchArgs`). By default, the
+        arguments are read from the current request.
     :returns: Tuple of (query, URL arguments).
     """
     sort_arg_name = "sort"
-    urlfield = request.values.get(sort_arg_name, "", type=str)
+    if args is None:
+        urlfield = request.values.get(sort_arg_name, "", type=str)
+        # cast to six.text_type to handle unicodes in Python 2
+        has_query = request.values.get("q", type=six.text_type)
+    else:
+        urlfield, has_query = args.sort, args.q
 
     # Get default sorting if sort is not specified.
     if not urlfield:
-        # cast to six.text_type to handle unicodes in Python 2
-        has_query = request.values.get("q", type=six.text_type)
         urlfield = (
             current_app.config["RECORDS_REST_DEFAULT_SORT"]
             .get(index, {})
@@ -121,13 +196,13 @@ def default_sorter_factory(search, index):
     # Parse sort argument
     key, asc = parse_sort_field(urlfield)
 
-    # Get sort options
-    sort_options = (
-        current_app.config["RECORDS_REST_SORT_OPTIONS"].get(index, {}).get(key)
-    )
+    # Get fields to sort query by
+    sort_options = current_app.config["RECORDS_REST_SORT_OPTIONS"].get(index)
     if sort_options is None:
         return (search, {})
+    fields = compile_sort_options(sort_options).eval_fields(key, asc)
+    if fields is None:
+        return (search, {})
 
-    # Get fields to sort query by
-    search = search.sort(*[eval_field(f, asc) for f in sort_options["fields"]])
+    search = search.sort(*fields)
     return (search, {sort_arg_name: urlfield})
@@ -4,11 +4,23 @@
 
 """General utility functions module."""
 
+import base64
+import copy
+import json
+from collections import namedtuple
 from functools import partial
 from importlib.metadata import version
 
 import six
-from flask import abort, current_app, jsonify, make_response, request, url_for
+from flask import (
+    abort,
+    current_app,
+    has_request_context,
+    jsonify,
+    make_response,
+    request,
+    url_for,
+)
 from invenio_pidstore.errors import (
     PIDDeletedError,
     PIDDoesNotExistError,
@@ -18,9 +30,11 @@ from invenio_pidstore.errors import (
 )
 from invenio_pidstore.resolver import Resolver
 from invenio_records.api import Record
+from werkzeug.datastructures import ImmutableMultiDict
 from werkzeug.routing import BaseConverter, BuildError, PathConverter
 from werkzeug.utils import cached_property, import_string
 
+from .cache import ExistenceIndex
 from .errors import (
     PIDDeletedRESTError,
     PIDDoesNotExistRESTError,
@@ -117,6 +131,65 @@ def check_search(record, *args, **kwargs):
     return type("CheckES", (), {"can": can})()
 
 
+def check_search_existence(record, *args, **kwargs):
+    """Return permission that check if the record exists in the search engine index.
+
+    Same as :func:`check_search`, but the records known to exist are looked
+    up in a per-process :class:`invenio_records_rest.cache.ExistenceIndex` of
+    the search of the view, instead of searching for them on every request.
+    Only the records missing from the existence index are searched for.
+
+    The existence index is refreshed every
+    ``RECORDS_REST_EXISTENCE_INDEX_REFRESH_INTERVAL`` seconds and records are
+    removed from it when they are updated or deleted through the REST API of
+    the process. Changes made otherwise may be seen with this delay. There is
+    one existence index per endpoint; if the search of the view differs from
+    the one of the existence index (e.g. it depends on the user), the record
+    is searched for as with :func:`check_search`.
+
+    :params record: A record object.
+    :returns: A object instance with a ``can()`` method.
+    """
+
+    def can(self):
+        """Look up the record in the existence index or search for it."""
+        search = request._methodview.search_class()
+        key = json.dumps([search._index, search.to_dict()], sort_keys=True)
+        indexes = current_records_rest.existence_indexes
+        max_indexes = current_app.config["RECORDS_REST_EXISTENCE_INDEX_MAX_INDEXES"]
+        existence_index = indexes.get(request.endpoint)
+        if existence_index is None and len(indexes) < max_indexes:
+            existence_index = indexes.setdefault(
+                request.endpoint,
+                ExistenceIndex(
+                    refresh_interval=current_app.config[
+                        "RECORDS_REST_EXISTENCE_INDEX_REFRESH_INTERVAL"
+                    ],
+                    max_size=current_app.config[
+                        "RECORDS_REST_EXISTENCE_INDEX_MAX_SIZE"
+                    ],
+                    key=key,
+                ),
+            )
+
+        record_id = str(record.id)
+        if existence_index is None or existence_index.key != key:
+            # Too many indexes or the search depends on the request.
+            return search.get_record(record_id).count() == 1
+        if existence_index.is_stale:
+            existence_index.refresh(
+                search, current_records_rest.existence_index_executor
+            )
+        if record_id in existence_index:
+            return True
+        if search.get_record(record_id).count() == 1:
+            existence_index.add(record_id)
+            return True
+        return False
+
+    return type("CheckSearchExistence", (), {"can": can})()
+
+
 def make_comma_list_a_list(elements_to_rocess):
     """Process a list with commas to simple list.
 
@@ -132,6 +205,149 @@ def make_comma_list_a_list(elements_to_rocess):
     return list(set(output_list))
 
 
+_REQUESTED_FIELDS_KEY = "invenio_records_rest.requested_fields"
+"""WSGI environment key of the fields parsed by :func:`get_requested_fields`."""
+
+
+def get_requested_fields(arg_name="fields"):
+    """Get the fields requested in the query string of the current request.
+
+    Fields can be given as a comma separated list and/or by repeating the
+    argument, e.g. ``?fields=title,year&fields=creators.name``.
+
+    The argument is parsed once per request, as the serializers get the
+    fields for every search hit.
+
+    :param arg_name: Name of the query string argument.
+    :returns: Sorted list of field paths (empty if no fields were requested).
+    """
+    if not has_request_context():
+        return []
+    parsed = request.environ.setdefault(_REQUESTED_FIELDS_KEY, {})
+    if arg_name not in parsed:
+        parsed[arg_name] = sorted(
+            field
+            for field in make_comma_list_a_list(request.args.getlist(arg_name))
+            if field
+        )
+    return parsed[arg_name]
+
+
+class SearchArgs(namedtuple("SearchArgs", ["values", "q", "sort", "facets"])):
+    """Query string arguments of a search request.
+
+    The arguments are read from the request once and shared by the query,
+    facets and sort factories.
+
+    :param values: Frozen copy of all the request values (e.g. filters).
+    :param q: Query string (``q``) or ``None``.
+    :param sort: Sort option (``sort``) or an empty string.
+    :param facets: Names of the requested facets (``facets``).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_request(cls):
+        """Parse the arguments of the current request."""
+        values = ImmutableMultiDict(request.values)
+        return cls(
+            values=values,
+            q=values.get("q"),
+            sort=values.get("sort", ""),
+            facets=make_comma_list_a_list(request.args.getlist("facets")),
+        )
+
+
+def select_fields(data, fields):
+    """Select a subset of the fields of a dictionary.
+
+    :param data: Dictionary, e.g. a record dump.
+    :param fields: List of field paths. Nested fields are separated by dots
+        (e.g. ``creators.name``) and lists are traversed.
+    :returns: New dictionary containing copies of the selected fields only.
+    """
+    tree = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                # The parent field is already fully selected.
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return _select_fields(data, tree)
+
+
+def _select_fields(value, tree):
+    """Select the fields of a value according to a tree of field names."""
+    if tree is None:
+        return copy.deepcopy(value)
+    if isinstance(value, list):
+        return [
+            _select_fields(item, tree)
+            for item in value
+            if isinstance(item, (dict, list))
+        ]
+    result = {}
+    for key, subtree in tree.items():
+        if key in value and (subtree is None or isinstance(value[key], (dict, list))):
+            result[key] = _select_fields(value[key], subtree)
+    return result
+
+
+def is_partial_search_result(search_result):
+    """Check if a search result is incomplete.
+
+    A result is incomplete if the search timed out, terminated early (see
+    ``terminate_after``) or if some shards failed.
+
+    :param search_result: Search result as a dictionary.
+    :returns: ``True`` if the result is partial.
+    """
+    return bool(
+        search_result.get("timed_out")
+        or search_result.get("terminated_early")
+        or search_result.get("_shards", {}).get("failed")
+    )
+
+
+def encode_search_cursor(sort_values):
+    """Encode the sort values of a search hit into an opaque cursor.
+
+    :param sort_values: List of sort values as returned by the search engine
+        for a hit (``hit["sort"]``).
+    :returns: URL-safe cursor string.
+    """
+    data = json.dumps(sort_values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor):
+    """Decode an opaque cursor into a list of ``search_after`` values.
+
+    :param cursor: Cursor string created by :func:`encode_search_cursor`. An
+        empty cursor denotes the first page.
+    :returns: List of sort values (empty for the first page).
+    :raises ValueError: If the cursor is malformed or its values are not
+        scalars.
+    """
+    if not cursor:
+        return []
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if not isinstance(values, list) or not all(
+        v is None or isinstance(v, (str, int, float, bool)) for v in values
+    ):
+        raise ValueError("Invalid cursor.")
+    return values
+
+
 class LazyPIDValue(object):
     """Lazy PID resolver.
 
@@ -153,9 +369,19 @@ class LazyPIDValue(object):
     def data(self):
         """Resolve PID from a value and return a tuple with PID and the record.
 
+        The resolution of ``GET`` and ``HEAD`` requests is cached if
+        :data:`invenio_records_rest.config.RECORDS_REST_PID_CACHE` is set.
+
         :returns: A tuple with the PID and the record resolved.
         """
+        pid_cache = current_records_rest.pid_cache
         try:
+            if (
+                pid_cache is not None
+                and has_request_context()
+                and request.method in ("GET", "HEAD")
+            ):
+                return pid_cache.resolve(self.resolver, self.value)
             return self.resolver.resolve(self.value)
         except PIDDoesNotExistError as pid_error:
             raise PIDDoesNotExistRESTError(pid_error=pid_error)
@@ -5,9 +5,16 @@
 """REST API resources."""
 
 import copy
+import hashlib
+import itertools
+import json
+import time
 import uuid
 from collections import defaultdict
+from concurrent.futures import wait
+from contextlib import contextmanager
 from functools import partial, wraps
+from types import SimpleNamespace
 
 from flask import (
     Blueprint,
@@ -23,11 +30,15 @@ from invenio_db import db
 from invenio_i18n import gettext as _
 from invenio_indexer.api import RecordIndexer
 from invenio_pidstore import current_pidstore
-from invenio_pidstore.models import PersistentIdentifier
+from invenio_pidstore.errors import PIDAlreadyExists
+from invenio_pidstore.fetchers import recid_fetcher, recid_fetcher_v2
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records.api import Record
 from invenio_rest import ContentNegotiatedMethodView
 from invenio_rest.decorators import require_content_types
+from invenio_rest.errors import FieldError, RESTException, RESTValidationError
 from invenio_search import RecordsSearch
+from invenio_search.engine import dsl
 from invenio_search.engine import search as search_engine
 from jsonpatch import JsonPatchException, JsonPointerException
 from jsonschema.exceptions import ValidationError
@@ -35,15 +46,22 @@ from sqlalchemy.exc import SQLAlchemyError
 from webargs import ValidationError as WebargsValidationError
 from webargs import fields, validate
 from webargs.flaskparser import parser
-from werkzeug.exceptions import BadRequest
+from werkzeug.exceptions import BadRequest, HTTPException, PreconditionFailed
+from werkzeug.routing import BuildError
 
-from ._compat import wrap_links_factory
+from ._compat import compile_argmap, webargs_location_kwargs, wrap_links_factory
 from .errors import (
     InvalidDataRESTError,
     InvalidQueryRESTError,
     JSONSchemaValidationError,
     PatchJSONFailureRESTError,
+    PIDAlreadyExistsRESTError,
+    PIDDeletedRESTError,
+    PIDDoesNotExistRESTError,
+    PIDMissingObjectRESTError,
+    PIDRedirectedRESTError,
     PIDResolveRESTError,
+    PIDUnregisteredRESTError,
     SearchPaginationRESTError,
     SuggestMissingContextRESTError,
     SuggestNoCompletionsRESTError,
@@ -53,7 +71,13 @@ from .errors import (
 from .links import default_links_factory
 from .proxies import current_records_rest
 from .query import es_search_factory
-from .utils import obj_or_import_string
+from .utils import (
+    decode_search_cursor,
+    encode_search_cursor,
+    get_requested_fields,
+    is_partial_search_result,
+    obj_or_import_string,
+)
 
 
 def search_query_parsing_exception_handler(error):
@@ -198,6 +222,16 @@ def create_url_rules(
     suggesters=None,
     default_endpoint_prefix=None,
     search_query_parser=None,
+    cursor_tiebreaker=None,
+    export_serializers=None,
+    required_source_fields=None,
+    search_timeout=None,
+    search_terminate_after=None,
+    allow_partial_search_results=None,
+    query_limits=None,
+    use_facets_view=False,
+    use_mget_view=False,
+    use_bulk_view=False,
 ):
     """Create Werkzeug URL rules.
 
@@ -251,6 +285,30 @@ def create_url_rules(
     :param links_factory_imp: Factory for record links generation.
     :param suggesters: Suggester fields configuration.
     :param search_query_parser: Function that implements the query parser
+    :param cursor_tiebreaker: Unique field appended to the sort for cursor
+        pagination (default: ``_id``).
+    :param export_serializers: Streaming serializers used for exporting the
+        full result set of a search. If set, an export view is installed.
+    :param required_source_fields: Fields always fetched from the search
+        engine when a subset of fields is requested with ``fields`` (e.g. the
+        field read by the PID fetcher). Known by default for the ``recid``
+        fetchers only, otherwise the full ``_source`` is fetched.
+    :param search_timeout: Time budget of the search and suggest requests
+        sent to the search engine (e.g. ``'2s'``). Results collected until the
+        timeout are returned and flagged as partial.
+    :param search_terminate_after: Maximum number of documents to collect per
+        shard for a search. Results are flagged as partial if reached.
+    :param allow_partial_search_results: Whether the search engine may return
+        partial results when shards fail or time out. If ``None``, the search
+        engine default is used.
+    :param query_limits: Complexity limits of the query strings (see
+        :data:`invenio_records_rest.config.RECORDS_REST_DEFAULT_QUERY_LIMITS`).
+    :param use_facets_view: Determines if a view returning only the
+        aggregations of a search should be installed.
+    :param use_mget_view: Determines if a view returning many records
+        requested by PID value should be installed.
+    :param use_bulk_view: Determines if a view creating, updating or
+        deleting many records in one request should be installed.
 
     :returns: a list of dictionaries with can each be passed as keywords
         arguments to ``Blueprint.add_url_rule``.
@@ -323,6 +381,13 @@ def create_url_rules(
         item_links_factory=links_factory,
         record_class=record_class,
         search_query_parser=search_query_parser,
+        cursor_tiebreaker=cursor_tiebreaker,
+        search_index=search_index,
+        required_source_fields=required_source_fields,
+        search_timeout=search_timeout,
+        search_terminate_after=search_terminate_after,
+        allow_partial_search_results=allow_partial_search_results,
+        query_limits=query_limits,
     )
     item_view = RecordResource.as_view(
         RecordResource.view_name.format(endpoint),
@@ -336,6 +401,7 @@ def create_url_rules(
         indexer_class=indexer_class,
         links_factory=links_factory,
         default_media_type=default_media_type,
+        search_index=search_index,
     )
 
     views = [
@@ -347,10 +413,90 @@ def create_url_rules(
             SuggestResource.view_name.format(endpoint),
             suggesters=suggesters,
             search_class=search_class,
+            search_timeout=search_timeout,
+            allow_partial_search_results=allow_partial_search_results,
         )
 
         views.append(dict(rule=list_route + "_suggest", view_func=suggest_view))
 
+    if export_serializers:
+        export_serializers = {
+            mime: obj_or_import_string(func)
+            for mime, func in export_serializers.items()
+        }
+        export_view = RecordsExportResource.as_view(
+            RecordsExportResource.view_name.format(endpoint),
+            pid_type=pid_type,
+            pid_fetcher=pid_fetcher,
+            list_permission_factory=list_permission_factory,
+            search_class=search_class,
+            export_serializers=export_serializers,
+            serializers_query_aliases=search_serializers_aliases,
+            default_media_type=default_media_type,
+            search_factory=(
+                obj_or_import_string(search_factory_imp, default=es_search_factory)
+            ),
+            item_links_factory=links_factory,
+            search_query_parser=search_query_parser,
+            query_limits=query_limits,
+        )
+
+        views.append(dict(rule=list_route + "_export", view_func=export_view))
+
+    if use_facets_view:
+        facets_view = RecordsFacetsResource.as_view(
+            RecordsFacetsResource.view_name.format(endpoint),
+            pid_type=pid_type,
+            list_permission_factory=list_permission_factory,
+            search_class=search_class,
+            search_factory=(
+                obj_or_import_string(search_factory_imp, default=es_search_factory)
+            ),
+            search_query_parser=search_query_parser,
+            search_timeout=search_timeout,
+            allow_partial_search_results=allow_partial_search_results,
+            query_limits=query_limits,
+        )
+
+        views.append(dict(rule=list_route + "_facets", view_func=facets_view))
+
+    if use_mget_view:
+        mget_view = RecordsMultiGetResource.as_view(
+            RecordsMultiGetResource.view_name.format(endpoint),
+            pid_type=pid_type,
+            read_permission_factory=read_permission_factory,
+            record_class=record_class,
+            record_serializers=record_serializers,
+            default_media_type=default_media_type,
+            search_class=search_class,
+            links_factory=links_factory,
+        )
+
+        views.append(dict(rule=list_route + "_mget", view_func=mget_view))
+
+    if use_bulk_view:
+        bulk_view = RecordsBulkResource.as_view(
+            RecordsBulkResource.view_name.format(endpoint),
+            minter_name=pid_minter,
+            pid_type=pid_type,
+            create_permission_factory=create_permission_factory,
+            update_permission_factory=update_permission_factory,
+            delete_permission_factory=delete_permission_factory,
+            list_permission_factory=list_permission_factory,
+            record_class=record_class,
+            search_class=search_class,
+            search_factory=(
+                obj_or_import_string(search_factory_imp, default=es_search_factory)
+            ),
+            search_query_parser=search_query_parser,
+            query_limits=query_limits,
+            record_loaders=record_loaders,
+            indexer_class=indexer_class,
+            search_index=search_index,
+        )
+
+        views.append(dict(rule=list_route + "_bulk", view_func=bulk_view))
+
     if use_options_view:
         options_view = RecordsListOptionsResource.as_view(
             RecordsListOptionsResource.view_name.format(endpoint),
@@ -430,16 +576,394 @@ def need_record_permission(factory_name):
     return need_record_permission_builder
 
 
+def invalidate_pid_cache(pids):
+    """Remove persistent identifiers from the PID resolution cache.
+
+    :param pids: Persistent identifiers whose status changed.
+    """
+    pid_cache = current_records_rest.pid_cache
+    if pid_cache is not None:
+        for pid in pids:
+            pid_cache.invalidate(pid)
+
+
+def invalidate_existence_indexes(record):
+    """Remove a modified record from the existence indexes of the process.
+
+    :param record: Updated or deleted record.
+    """
+    for existence_index in current_records_rest.existence_indexes.values():
+        existence_index.discard(str(record.id))
+
+
+def acquire_slots(semaphore, count):
+    """Acquire several slots of a semaphore without blocking.
+
+    :param semaphore: A :class:`threading.BoundedSemaphore`.
+    :param count: Number of slots.
+    :returns: ``True`` if all slots were acquired, ``False`` if none was.
+    """
+    for acquired in range(count):
+        if not semaphore.acquire(blocking=False):
+            if acquired:
+                semaphore.release(acquired)
+            return False
+    return True
+
+
+def invalidate_search_cache(search_index):
+    """Invalidate the cached search responses and aggregations of an index.
+
+    :param search_index: Name of the search index.
+    """
+    for cache in (
+        current_records_rest.search_cache,
+        current_records_rest.aggregations_cache,
+    ):
+        if cache is not None:
+            cache.invalidate(search_index)
+
+
+@contextmanager
+def item_request_json(data, pid=None, record=None):
+    """Make the record loaders read an item of a bulk request.
+
+    Within the context, :meth:`flask.Request.get_json` of the current request
+    returns ``data`` instead of the request body. If a record is given, it is
+    available to the loaders as the resolved ``pid_value`` of the request,
+    like in the item views.
+
+    :param data: Deserialized JSON item.
+    :param pid: Persistent identifier of the updated record.
+    :param record: Updated record.
+    """
+    req = request._get_current_object()
+    req.get_json = lambda *args, **kwargs: data
+    view_args = req.view_args
+    if pid is not None:
+        req.view_args = dict(
+            view_args or {},
+            pid_value=SimpleNamespace(value=pid.pid_value, data=(pid, record)),
+        )
+    try:
+        yield
+    finally:
+        del req.get_json
+        req.view_args = view_args
+
+
+def bulk_error_item(error):
+    """Get the bulk response item of a failed operation.
+
+    :param error: HTTP exception the item view would have raised.
+    :returns: Dictionary with the ``status`` and ``message`` of the error.
+    """
+    if isinstance(error, RESTException):
+        return json.loads(error.get_body())
+    return dict(status=error.code, message=error.description)
+
+
+def _redirect_item(pid):
+    """Get the bulk response item of a redirected PID."""
+    destination_pid = pid.get_redirect()
+    try:
+        location = url_for(
+            ".{0}_item".format(
+                current_records_rest.default_endpoint_prefixes[destination_pid.pid_type]
+            ),
+            pid_value=destination_pid.pid_value,
+        )
+    except (BuildError, KeyError):
+        error = PIDRedirectedRESTError(destination_pid.pid_type)
+        return dict(id=pid.pid_value, status=error.code, message=error.description)
+    return dict(
+        id=pid.pid_value,
+        status=301,
+        message="Moved Permanently",
+        location=location,
+    )
+
+
+def resolve_pid_values(pid_type, pid_values, record_class, with_deleted=True):
+    """Resolve many PID values to records.
+
+    The PIDs are fetched with one query and the records with another one.
+    The PIDs are checked like in
+    :meth:`invenio_pidstore.resolver.Resolver.resolve`.
+
+    :param pid_type: Persistent identifier type.
+    :param pid_values: PID values.
+    :param record_class: Record API class.
+    :param with_deleted: Whether to return deleted records. Otherwise they
+        are reported as gone.
+    :returns: Dictionary mapping each PID value to a tuple with the PID and
+        the record, or to the bulk response item of the resolution error.
+    """
+    pids = {
+        pid.pid_value: pid
+        for pid in PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.pid_value.in_(set(pid_values)),
+        )
+    }
+    object_uuids = {
+        pid.object_uuid
+        for pid in pids.values()
+        if pid.is_registered() and pid.get_assigned_object("rec")
+    }
+    records = {}
+    if object_uuids:
+        records = {
+            record.id: record
+            for record in record_class.get_records(
+                list(object_uuids), with_deleted=True
+            )
+        }
+
+    resolved = {}
+    for pid_value in pid_values:
+        pid = pids.get(pid_value)
+        if pid is None:
+            error = PIDDoesNotExistRESTError()
+        elif pid.is_new() or pid.is_reserved():
+            error = PIDUnregisteredRESTError()
+        elif pid.is_deleted():
+            error = PIDDeletedRESTError()
+        elif pid.is_redirected():
+            resolved[pid_value] = _redirect_item(pid)
+            continue
+        elif not pid.get_assigned_object("rec"):
+            error = PIDMissingObjectRESTError(pid.pid_value)
+        elif pid.object_uuid not in records:
+            error = PIDResolveRESTError(pid.pid_value)
+        elif not with_deleted and records[pid.object_uuid].model.is_deleted:
+            error = PIDDeletedRESTError()
+        else:
+            resolved[pid_value] = (pid, records[pid.object_uuid])
+            continue
+        resolved[pid_value] = dict(
+            id=pid_value, status=error.code, message=error.description
+        )
+    return resolved
+
+
+def _bulk_record_operation(indexer, actions):
+    """Send bulk actions on records to the search engine and log failures."""
+    _, errors = search_engine.helpers.bulk(
+        indexer.client, actions, raise_on_error=False
+    )
+    for error in errors:
+        (result,) = error.values()
+        # Deleting a document which was never indexed is not a failure.
+        if result.get("status") == 404 and result.get("result") == "not_found":
+            continue
+        current_app.logger.error("Failed bulk operation on record: {0}".format(error))
+
+
+def _sends_bulk_actions(indexer, method):
+    """Check if an indexer method can be replaced by a bulk action.
+
+    Only the methods of :class:`invenio_indexer.api.RecordIndexer` are known
+    to be equivalent to the bulk actions built from its helpers; other
+    indexers (or overridden methods) are called for each record.
+    """
+    return isinstance(indexer, RecordIndexer) and getattr(
+        type(indexer), method
+    ) is getattr(RecordIndexer, method)
+
+
+def bulk_index_records(indexer, records):
+    """Index records with one bulk request to the search engine.
+
+    Unlike :meth:`invenio_indexer.api.RecordIndexer.bulk_index`, which queues
+    the records for a background worker, the records are indexed before the
+    response is sent, like in the item views. Indexers which are not a
+    :class:`invenio_indexer.api.RecordIndexer` or which override its
+    ``index()`` method index each record with ``index()``.
+
+    :param indexer: Record indexer.
+    :param records: Committed records.
+    """
+    if not _sends_bulk_actions(indexer, "index"):
+        for record in records:
+            indexer.index(record)
+        return
+
+    def actions():
+        for record in records:
+            index = indexer.record_to_index(record)
+            arguments = {}
+            body = indexer._prepare_record(record, index, arguments)
+            action = {
+                "_op_type": "index",
+                "_index": indexer._prepare_index(index),
+                "_id": str(record.id),
+                "_version": record.revision_id,
+                "_version_type": indexer._version_type,
+                "_source": body,
+            }
+            action.update(arguments)
+            yield action
+
+    if records:
+        _bulk_record_operation(indexer, actions())
+
+
+def bulk_delete_records(indexer, records):
+    """Remove records from the search engine with one bulk request.
+
+    Indexers which are not a :class:`invenio_indexer.api.RecordIndexer` or
+    which override its ``delete()`` method remove each record with
+    ``delete()``.
+
+    :param indexer: Record indexer.
+    :param records: Committed deleted records.
+    """
+    if not _sends_bulk_actions(indexer, "delete"):
+        for record in records:
+            indexer.delete(record)
+        return
+
+    actions = [
+        {
+            "_op_type": "delete",
+            "_index": indexer._prepare_index(indexer.record_to_index(record)),
+            "_id": str(record.id),
+            "_version": record.revision_id,
+            "_version_type": indexer._version_type,
+        }
+        for record in records
+    ]
+    if actions:
+        _bulk_record_operation(indexer, actions)
+
+
+def delete_record_pids(object_uuids, object_type="rec"):
+    """Mark all persistent identifiers of records as deleted.
+
+    Same as :meth:`invenio_pidstore.models.PersistentIdentifier.delete` for
+    each PID, but with one SQL statement per PID status: new PIDs are
+    removed and the other ones are marked as deleted.
+
+    :param object_uuids: Identifiers of the deleted records.
+    :param object_type: Object type of the records.
+    """
+    if not object_uuids:
+        return
+    criteria = (
+        PersistentIdentifier.object_type == object_type,
+        PersistentIdentifier.object_uuid.in_(object_uuids),
+    )
+    if current_records_rest.pid_cache is not None:
+        invalidate_pid_cache(
+            db.session.query(
+                PersistentIdentifier.pid_type,
+                PersistentIdentifier.object_type,
+                PersistentIdentifier.pid_value,
+            ).filter(*criteria)
+        )
+    query = PersistentIdentifier.query.filter(*criteria)
+    query.filter(PersistentIdentifier.status == PIDStatus.NEW).delete(
+        synchronize_session=False
+    )
+    query.filter(PersistentIdentifier.status != PIDStatus.DELETED).update(
+        {PersistentIdentifier.status: PIDStatus.DELETED}, synchronize_session=False
+    )
+
+
+def apply_search_budget(
+    search, timeout=None, terminate_after=None, allow_partial_search_results=None
+):
+    """Limit the resources the search engine may spend on a search.
+
+    :param search: Search instance.
+    :param timeout: Time budget (e.g. ``'2s'``).
+    :param terminate_after: Maximum number of documents to collect per shard.
+    :param allow_partial_search_results: Whether partial results are allowed
+        when shards fail or time out.
+    :returns: The updated search instance.
+    """
+    extra = {}
+    if timeout is not None:
+        extra["timeout"] = timeout
+    if terminate_after is not None:
+        extra["terminate_after"] = terminate_after
+    if extra:
+        search = search.extra(**extra)
+    if allow_partial_search_results is not None:
+        search = search.params(
+            allow_partial_search_results=allow_partial_search_results
+        )
+    return search
+
+
+def execute_search(search):
+    """Execute a search.
+
+    If enabled (see
+    :data:`invenio_records_rest.config.RECORDS_REST_SEARCH_SINGLE_FLIGHT`),
+    identical searches running concurrently in the process share a single
+    request to the search engine.
+
+    The ``preference`` parameter only routes the search to the same shards
+    for a client, so it is not part of the key: identical searches of
+    different clients share a request.
+
+    :param search: Search instance.
+    :returns: The search response.
+    """
+    single_flight = current_records_rest.search_single_flight
+    if single_flight is None:
+        return search.execute()
+    params = {k: v for k, v in search._params.items() if k != "preference"}
+    key = json.dumps(
+        [str(search._using), search._index, params, search.to_dict()],
+        sort_keys=True,
+        default=str,
+    )
+    raw, _ = single_flight.do(key, lambda: search.execute().to_dict())
+    # Each caller gets its own copy, as responses are modified while
+    # serializing them.
+    return search._response_class(search, copy.deepcopy(raw))
+
+
 def _validate_pagination_args(args):
     if args.get("page") and args.get("from"):
         raise WebargsValidationError(
             _("The query parameters from and page must not be used at the same time."),
             field_names=["page", "from"],
         )
+    if args.get("cursor") is not None and (args.get("page") or args.get("from")):
+        raise WebargsValidationError(
+            _(
+                "The query parameter cursor must not be used together with "
+                "from or page."
+            ),
+            field_names=["cursor"],
+        )
 
 
 def use_paginate_args(default_size=25, max_results=10000):
-    """Get and validate pagination arguments."""
+    """Get and validate pagination arguments.
+
+    The arguments schema is compiled once when the decorator is applied.
+    """
+    argmap = compile_argmap(
+        {
+            "page": fields.Int(
+                validate=validate.Range(min=1),
+            ),
+            "from": fields.Int(
+                metadata={"load_from": "from"},
+                validate=validate.Range(min=1),
+            ),
+            "size": fields.Int(
+                validate=validate.Range(min=0),
+            ),
+            "cursor": fields.Str(),
+        }
+    )
+    location_kwargs = webargs_location_kwargs("querystring")
 
     def decorator(f):
         @wraps(f)
@@ -450,46 +974,12 @@ def use_paginate_args(default_size=25, max_results=10000):
             _max_results = max_results(self) if callable(max_results) else max_results
 
             try:
-                try:
-                    # webargs >= 6.0.0b1
-                    req = parser.parse(
-                        {
-                            "page": fields.Int(
-                                validate=validate.Range(min=1),
-                            ),
-                            "from": fields.Int(
-                                metadata={"load_from": "from"},
-                                validate=validate.Range(min=1),
-                            ),
-                            "size": fields.Int(
-                                validate=validate.Range(min=1),
-                                load_default=_default_size,
-                            ),
-                        },
-                        location="querystring",
-                        validate=_validate_pagination_args,
-                        error_status_code=400,
-                    )
-                except TypeError:
-                    # webargs < 6.0.0b1
-                    req = parser.parse(
-                        {
-                            "page": fields.Int(
-                                validate=validate.Range(min=1),
-                            ),
-                            "from": fields.Int(
-                                metadata={"load_from": "from"},
-                                validate=validate.Range(min=1),
-                            ),
-                            "size": fields.Int(
-                                validate=validate.Range(min=1),
-                                load_default=_default_size,
-                            ),
-                        },
-                        locations=["querystring"],
-                        validate=_validate_pagination_args,
-                        error_status_code=400,
-                    )
+                req = parser.parse(
+                    argmap,
+                    validate=_validate_pagination_args,
+                    error_status_code=400,
+                    **location_kwargs,
+                )
             # For validation errors, webargs raises an enhanced BadRequest
             except BadRequest as err:
                 raise SearchPaginationRESTError(
@@ -497,11 +987,31 @@ def use_paginate_args(default_size=25, max_results=10000):
                     errors=err.data.get("messages"),
                 )
 
-            # Default if neither page nor from is specified
-            if not (req.get("page") or req.get("from")):
+            req.setdefault("size", _default_size)
+
+            # Default if neither page, from nor cursor is specified
+            if not (req.get("page") or req.get("from")) and req.get("cursor") is None:
                 req["page"] = 1
 
-            if req.get("page"):
+            if req.get("cursor") is not None:
+                try:
+                    search_after = decode_search_cursor(req["cursor"])
+                except ValueError:
+                    raise SearchPaginationRESTError(
+                        description=_("Invalid pagination parameters."),
+                        errors={"querystring": {"cursor": [_("Invalid cursor.")]}},
+                    )
+                # The window is always the first ``size`` hits after the
+                # cursor, hence deep pages are not limited by max_result_window.
+                req.update(
+                    dict(
+                        from_idx=0,
+                        to_idx=req["size"],
+                        search_after=search_after,
+                        links=dict(self={"cursor": req["cursor"]}),
+                    )
+                )
+            elif req.get("page"):
                 req.update(
                     dict(
                         from_idx=(req["page"] - 1) * req["size"],
@@ -614,6 +1124,13 @@ class RecordsListResource(ContentNegotiatedMethodView):
         record_class=None,
         indexer_class=None,
         search_query_parser=None,
+        cursor_tiebreaker=None,
+        search_index=None,
+        required_source_fields=None,
+        search_timeout=None,
+        search_terminate_after=None,
+        allow_partial_search_results=None,
+        query_limits=None,
         **kwargs,
     ):
         """Constructor."""
@@ -647,6 +1164,13 @@ class RecordsListResource(ContentNegotiatedMethodView):
         self.record_class = record_class or Record
         self.indexer_class = indexer_class
         self.search_query_parser = search_query_parser
+        self.cursor_tiebreaker = cursor_tiebreaker or "_id"
+        self.search_index = search_index
+        self.required_source_fields = required_source_fields
+        self.search_timeout = search_timeout
+        self.search_terminate_after = search_terminate_after
+        self.allow_partial_search_results = allow_partial_search_results
+        self.query_limits = query_limits
 
     @need_record_permission("list_permission_factory")
     @use_paginate_args(
@@ -661,21 +1185,87 @@ class RecordsListResource(ContentNegotiatedMethodView):
         Permissions: the `list_permission_factory` permissions are
             checked.
 
+        The ``fields`` argument restricts the fields fetched from the search
+        engine and serialized for each hit. Otherwise, if the negotiated
+        serializer declares the ``_source`` fields it needs (see
+        :attr:`invenio_records_rest.serializers.base.PreprocessorMixinInterface.source_fields`),
+        only these fields are fetched.
+
+        Results can be paginated either with ``page``/``from`` and ``size``,
+        which is limited by ``max_result_window``, or with an opaque
+        ``cursor`` (start with an empty ``cursor=``) which uses
+        ``search_after`` and can traverse the full result set. In cursor mode
+        only a ``next`` link is returned.
+
+        With ``size=0`` only the total and the aggregations are returned: no
+        documents are fetched and only a ``self`` link is returned.
+
+        The response has an ETag computed from the hits, aggregations and
+        links, and conditional requests with ``If-None-Match`` are answered
+        with ``304 Not Modified`` without serializing the hits.
+
+        If a search cache is configured (see
+        :data:`invenio_records_rest.config.RECORDS_REST_SEARCH_CACHE`), the
+        serialized response is cached and served for identical requests.
+
         :returns: Search result containing hits and aggregations as
                   returned by invenio-search.
         """
+        search_cache = current_records_rest.search_cache
+        cache_key = None
+        if search_cache is not None:
+            cache_key = self._search_cache_key(search_cache)
+            response = search_cache.get(cache_key) if cache_key else None
+            if response is not None:
+                etag, _ = response.get_etag()
+                if etag:
+                    self.check_etag(etag)
+                return response
+
         # Arguments that must be added in prev/next links
         urlkwargs = dict()
         search_obj = self.search_class()
         search = search_obj.with_preference_param().params(version=True)
         search = search[pagination["from_idx"] : pagination["to_idx"]]
         search = search.extra(track_total_hits=True)
+        search = apply_search_budget(
+            search,
+            timeout=self.search_timeout,
+            terminate_after=self.search_terminate_after,
+            allow_partial_search_results=self.allow_partial_search_results,
+        )
 
         search, qs_kwargs = self.search_factory(search, self.search_query_parser)
         urlkwargs.update(qs_kwargs)
 
+        if "search_after" in pagination:
+            search = self._cursor_search(search, pagination["search_after"])
+
+        fields = get_requested_fields()
+        if fields:
+            urlkwargs["fields"] = ",".join(fields)
+        if pagination["size"] == 0:
+            # Count only, no documents are fetched.
+            search = search.source(False)
+        elif fields:
+            search = self._source_search(search, fields)
+        else:
+            source_fields = self._serializer_source_fields()
+            if source_fields is not None:
+                search = self._source_search(search, source_fields)
+
+        # Aggregations are executed separately from the hits if they are
+        # cached or computed concurrently.
+        get_aggregations = None
+        if search.aggs._params.get("aggs") and (
+            current_records_rest.aggregations_cache is not None
+            or current_app.config["RECORDS_REST_CONCURRENT_AGGREGATIONS"]
+        ):
+            get_aggregations = self._aggregations(search)
+            search = self._hits_search(search)
+
         # Execute search
-        search_result = search.execute()
+        search_result = execute_search(search)
 
         # Generate links for self/prev/next
         total = search_result.hits.total["value"]
@@ -691,17 +1281,304 @@ class RecordsListResource(ContentNegotiatedMethodView):
             links[name] = url_for(endpoint, **urlkwargs)
 
         _link("self")
-        if pagination["from_idx"] >= 1:
-            _link("prev")
-        if pagination["to_idx"] < min(total, self.max_result_window):
-            _link("next")
+        if "search_after" in pagination:
+            hits = search_result.hits
+            if hits and len(hits) == pagination["size"]:
+                pagination["links"]["next"] = {
+                    "cursor": encode_search_cursor(list(hits[-1].meta.sort))
+                }
+                _link("next")
+        elif pagination["size"]:
+            if pagination["from_idx"] >= 1:
+                _link("prev")
+            if pagination["to_idx"] < min(total, self.max_result_window):
+                _link("next")
+
+        search_result = search_result.to_dict()
+        if get_aggregations is not None:
+            search_result["aggregations"] = get_aggregations()
+
+        # Answer conditional requests before serializing the hits
+        etag = self._search_etag(search_result, links)
+        self.check_etag(etag)
 
-        return self.make_response(
+        response = self.make_response(
             pid_fetcher=self.pid_fetcher,
-            search_result=search_result.to_dict(),
+            search_result=search_result,
             links=links,
             item_links_factory=self.item_links_factory,
         )
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        if (
+            cache_key
+            and response.status_code == 200
+            and not is_partial_search_result(search_result)
+        ):
+            search_cache.set(cache_key, response)
+        return response
+
+    @need_record_permission("list_permission_factory")
+    def head(self, **kwargs):
+        """Count records.
+
+        Permissions: the `list_permission_factory` permissions are
+            checked.
+
+        The query and the filters are applied as for :meth:`get`, but neither
+        documents nor aggregations are computed. The number of matching
+        records is returned in the ``X-Total-Count`` header.
+
+        :returns: Empty response with the ``X-Total-Count`` header.
+        """
+        search = self.search_class().with_preference_param()
+        search = search[0:0].extra(track_total_hits=True).source(False)
+        search = apply_search_budget(
+            search,
+            timeout=self.search_timeout,
+            terminate_after=self.search_terminate_after,
+            allow_partial_search_results=self.allow_partial_search_results,
+        )
+        search, _ = self.search_factory(search, self.search_query_parser)
+        search = self._hits_search(search).sort()
+
+        search_result = execute_search(search)
+
+        response = current_app.response_class(status=200)
+        response.headers["X-Total-Count"] = str(search_result.hits.total["value"])
+        return response
+
+    def _search_cache_key(self, search_cache):
+        """Build the search cache key of the current request.
+
+        The key covers the endpoint, the root URL (host and script root, used
+        in links), all query string arguments (query, pagination, sort, facets
+        and filters), the negotiated media type and the permission scope of
+        the user.
+
+        :param search_cache: A :class:`invenio_records_rest.cache.ResponseCache`.
+        :returns: The cache key or ``None`` if no serializer matches.
+        """
+        mimetype, _ = self._negotiate_serializer()
+        if mimetype is None:
+            return None
+        return search_cache.make_key(
+            self.search_index,
+            request.endpoint,
+            request.root_url,
+            sorted(request.args.items(multi=True)),
+            mimetype,
+            current_records_rest.search_cache_scope(),
+        )
+
+    def _aggregations(self, search):
+        """Start the computation of the aggregations of a search.
+
+        If an aggregations cache is configured, the cache key only depends on
+        the query (including filters) and the aggregation definitions, not on
+        pagination, sort or post filters, so that the cached result is shared
+        by all pages of a listing.
+
+        On a cache miss the aggregations are computed by a separate request
+        without hits. With ``RECORDS_REST_CONCURRENT_AGGREGATIONS`` each
+        aggregation is sent as its own request to a thread pool, so that they
+        run concurrently with the hits request. Aggregations not finished
+        within ``RECORDS_REST_AGGREGATIONS_TIMEOUT`` seconds are left out of
+        the response (and the result is not cached).
+
+        :param search: Search instance including the aggregations.
+        :returns: Function returning the dictionary of aggregation results.
+        """
+        aggregations_cache = current_records_rest.aggregations_cache
+        body = search.to_dict()
+        key = None
+        if aggregations_cache is not None:
+            key = aggregations_cache.make_key(
+                self.search_index,
+                search._index,
+                body.get("query"),
+                body["aggs"],
+                current_records_rest.search_cache_scope(),
+            )
+            aggregations = aggregations_cache.get(key)
+            if aggregations is not None:
+                return lambda: aggregations
+
+        aggs_search = search[0:0].extra(track_total_hits=False).sort()
+        aggs_search._extra.pop("search_after", None)
+        aggs_search = aggs_search.source(False)
+
+        aggs = search.aggs._params["aggs"]
+        slots = current_records_rest.search_slots
+        concurrent = current_app.config["RECORDS_REST_CONCURRENT_AGGREGATIONS"]
+        if not concurrent or not acquire_slots(slots, len(aggs)):
+            # Disabled, or the thread pool is saturated.
+            result = execute_search(aggs_search).to_dict()
+            aggregations = result.get("aggregations", {})
+            if key and not is_partial_search_result(result):
+                aggregations_cache.set(key, aggregations)
+            return lambda: aggregations
+
+        timeout = current_app.config["RECORDS_REST_AGGREGATIONS_TIMEOUT"]
+        aggs_search = aggs_search.extra(timeout="{0}ms".format(int(timeout * 1000)))
+        app = current_app._get_current_object()
+
+        def execute(agg_search):
+            with app.app_context():
+                return agg_search.execute().to_dict()
+
+        futures = {}
+        for name, agg in aggs.items():
+            agg_search = aggs_search._clone()
+            agg_search.aggs._params = {"aggs": {name: agg}}
+            futures[name] = current_records_rest.search_executor.submit(
+                execute, agg_search
+            )
+            futures[name].add_done_callback(lambda future: slots.release())
+        deadline = time.monotonic() + timeout
+
+        def get_aggregations():
+            done, not_done = wait(
+                futures.values(), timeout=max(0, deadline - time.monotonic())
+            )
+            aggregations = {}
+            complete = not not_done
+            for name, future in futures.items():
+                if future in done:
+                    result = future.result()
+                    complete = complete and not is_partial_search_result(result)
+                    aggregations.update(result.get("aggregations", {}))
+                else:
+                    # Do not run the search if it did not start yet.
+                    future.cancel()
+                    current_app.logger.warning(
+                        "Aggregation {0} timed out.".format(name)
+                    )
+            if key and complete:
+                aggregations_cache.set(key, aggregations)
+            return aggregations
+
+        return get_aggregations
+
+    def _hits_search(self, search):
+        """Remove the aggregations from a search.
+
+        :param search: Search instance.
+        :returns: A copy of the search without aggregations.
+        """
+        search = search._clone()
+        search.aggs._params = {"aggs": {}}
+        return search
+
+    def _search_etag(self, search_result, links):
+        """Compute the ETag of a search response.
+
+        The ETag is a digest of the identifiers and versions of the hits, the
+        total, the aggregations, the links and the negotiated media type, so
+        it changes whenever the serialized response would change.
+
+        :param search_result: Search result as a dictionary.
+        :param links: Links of the search response.
+        :returns: The ETag (not quoted).
+        """
+        hits = search_result["hits"]
+        digest = hashlib.sha1()
+        digest.update(
+            json.dumps(
+                [
+                    self._negotiate_serializer()[0],
+                    [(hit["_id"], hit.get("_version")) for hit in hits["hits"]],
+                    hits.get("total"),
+                    search_result.get("aggregations"),
+                    links,
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def _negotiate_serializer(self):
+        """Get the serializer matching the current request.
+
+        :returns: Tuple of media type and serializer function, or
+            ``(None, None)`` if no serializer matches.
+        """
+        serializers, default_media_type = self.get_method_serializers(request.method)
+        serializer = self.match_serializers(serializers, default_media_type)
+        mimetype = next(
+            (mime for mime, func in serializers.items() if func is serializer), None
+        )
+        return mimetype, serializer
+
+    def _serializer_source_fields(self):
+        """Get the ``_source`` fields declared by the negotiated serializer.
+
+        :returns: List of field paths, or ``None`` if the serializer needs the
+            full documents.
+        """
+        _, serializer = self._negotiate_serializer()
+        return getattr(getattr(serializer, "serializer", None), "source_fields", None)
+
+    def _required_source_fields(self):
+        """Get the ``_source`` fields read by the PID fetcher and serializers.
+
+        Unless ``required_source_fields`` is set on the endpoint, they are
+        only known for the record identifier fetchers of Invenio-PIDStore.
+
+        :returns: List of field paths, or ``None`` if they are unknown.
+        """
+        if self.required_source_fields is not None:
+            return self.required_source_fields
+        if self.pid_fetcher in (recid_fetcher, recid_fetcher_v2):
+            return [current_app.config["PIDSTORE_RECID_FIELD"], "_created", "_updated"]
+        return None
+
+    def _source_search(self, search, fields):
+        """Restrict the ``_source`` fetched for each hit to a set of fields.
+
+        Excludes already defined on the search (e.g. by the search class) are
+        kept. The full ``_source`` is fetched if the fields needed by the PID
+        fetcher are unknown (see :meth:`_required_source_fields`).
+
+        :param search: Search instance.
+        :param fields: Requested field paths.
+        :returns: The updated search instance.
+        """
+        required_fields = self._required_source_fields()
+        if required_fields is None:
+            return search
+        source = search.to_dict().get("_source")
+        excludes = source.get("excludes", []) if isinstance(source, dict) else []
+        return search.source(
+            includes=sorted(set(fields) | set(required_fields)),
+            excludes=excludes,
+        )
+
+    def _cursor_search(self, search, search_after):
+        """Prepare a search for cursor based pagination.
+
+        A tie-breaker is appended to the sort so that the order of the hits is
+        total and hence the ``search_after`` values of the last hit identify a
+        unique position in the result set.
+
+        :param search: Search instance.
+        :param search_after: Sort values of the last hit of the previous page.
+        :returns: The updated search instance.
+        :raises invenio_records_rest.errors.SearchPaginationRESTError: If the
+            number of ``search_after`` values does not match the sort (e.g.
+            the cursor is reused with another ``sort``).
+        """
+        sort = list(search._sort) or ["_score"]
+        search = search.sort(*(sort + [{self.cursor_tiebreaker: "asc"}]))
+        if search_after and len(search_after) != len(search._sort):
+            raise SearchPaginationRESTError(
+                description=_("Invalid pagination parameters."),
+                errors={"querystring": {"cursor": [_("Invalid cursor.")]}},
+            )
+        if search_after:
+            search = search.extra(search_after=search_after)
+        return search
 
     @need_record_permission("create_permission_factory")
     def post(self, **kwargs):
@@ -752,6 +1629,7 @@ class RecordsListResource(ContentNegotiatedMethodView):
         # Index the record
         if self.indexer_class:
             self.indexer_class().index(record)
+        invalidate_search_cache(self.search_index)
 
         response = self.make_response(
             pid, record, 201, links_factory=self.item_links_factory
@@ -766,6 +1644,738 @@ class RecordsListResource(ContentNegotiatedMethodView):
         return response
 
 
+class RecordsExportResource(ContentNegotiatedMethodView):
+    """Resource for exporting all records matching a search."""
+
+    view_name = "{0}_export"
+
+    def __init__(
+        self,
+        pid_type=None,
+        pid_fetcher=None,
+        list_permission_factory=None,
+        search_class=None,
+        export_serializers=None,
+        default_media_type=None,
+        search_factory=None,
+        item_links_factory=None,
+        search_query_parser=None,
+        query_limits=None,
+        **kwargs,
+    ):
+        """Constructor."""
+        super().__init__(
+            serializers=export_serializers,
+            default_media_type=default_media_type,
+            **kwargs,
+        )
+        self.pid_type = pid_type
+        self.pid_fetcher = current_pidstore.fetchers[pid_fetcher]
+        self.list_permission_factory = (
+            list_permission_factory or current_records_rest.list_permission_factory
+        )
+        self.search_class = search_class
+        self.search_factory = partial(search_factory, self)
+        self.item_links_factory = item_links_factory
+        self.search_query_parser = search_query_parser
+        self.query_limits = query_limits
+
+    @need_record_permission("list_permission_factory")
+    def get(self, **kwargs):
+        """Export all records matching a search.
+
+        Permissions: the `list_permission_factory` permissions are
+            checked.
+
+        The query and filters are parsed as in the list view, but the hits
+        are retrieved in batches of ``RECORDS_REST_EXPORT_BATCH_SIZE`` using
+        a scroll and streamed to the client, hence the memory usage does not
+        depend on the size of the result set. Hits are not sorted and no
+        aggregations are computed.
+
+        :returns: Streamed response with all hits.
+        """
+        urlkwargs = dict()
+        search = self.search_class().params(version=True)
+        search, qs_kwargs = self.search_factory(search, self.search_query_parser)
+        urlkwargs.update(qs_kwargs)
+
+        hits = self._scan(search)
+
+        endpoint = ".{0}_export".format(
+            current_records_rest.default_endpoint_prefixes[self.pid_type]
+        )
+        links = dict(self=url_for(endpoint, _external=True, **urlkwargs))
+
+        return self.make_response(
+            pid_fetcher=self.pid_fetcher,
+            hits=hits,
+            links=links,
+            item_links_factory=self.item_links_factory,
+        )
+
+    def _scan(self, search):
+        """Iterate over all hits of a search using a scroll.
+
+        :param search: Search instance.
+        :returns: Iterator of raw hits.
+        """
+        body = search.to_dict()
+        # Neither aggregations nor the exact total are part of an export.
+        body.pop("aggs", None)
+        body["track_total_hits"] = False
+
+        hits = search_engine.helpers.scan(
+            dsl.connections.get_connection(search._using),
+            query=body,
+            index=search._index,
+            scroll=current_app.config["RECORDS_REST_EXPORT_SCROLL_TIMEOUT"],
+            size=current_app.config["RECORDS_REST_EXPORT_BATCH_SIZE"],
+            **search._params,
+        )
+        # Send the first request before the response is started, so that e.g.
+        # query syntax errors still result in a proper error response.
+        try:
+            first_hit = next(hits)
+        except StopIteration:
+            return iter([])
+        return itertools.chain([first_hit], hits)
+
+
+class RecordsFacetsResource(MethodView):
+    """Resource for the aggregations of a search."""
+
+    view_name = "{0}_facets"
+
+    def __init__(
+        self,
+        pid_type=None,
+        list_permission_factory=None,
+        search_class=None,
+        search_factory=None,
+        search_query_parser=None,
+        search_timeout=None,
+        allow_partial_search_results=None,
+        query_limits=None,
+        **kwargs,
+    ):
+        """Constructor."""
+        self.pid_type = pid_type
+        self.list_permission_factory = (
+            list_permission_factory or current_records_rest.list_permission_factory
+        )
+        self.search_class = search_class
+        self.search_factory = partial(search_factory, self)
+        self.search_query_parser = search_query_parser
+        self.search_timeout = search_timeout
+        self.allow_partial_search_results = allow_partial_search_results
+        self.query_limits = query_limits
+
+    @need_record_permission("list_permission_factory")
+    def get(self, **kwargs):
+        """Get the aggregations of a search.
+
+        Permissions: the `list_permission_factory` permissions are
+            checked.
+
+        The query, facets and filters are parsed as in the list view, but no
+        hits are retrieved and the hits are not sorted. The total number of
+        hits is only computed if requested with ``total=true``.
+
+        :returns: JSON response with the aggregations.
+        """
+        with_total = request.args.get("total", "").lower() in ("1", "true")
+
+        search = self.search_class().with_preference_param()
+        search = search[0:0].source(False).extra(track_total_hits=with_total)
+        search = apply_search_budget(
+            search,
+            timeout=self.search_timeout,
+            allow_partial_search_results=self.allow_partial_search_results,
+        )
+        urlkwargs = dict()
+        search, qs_kwargs = self.search_factory(search, self.search_query_parser)
+        urlkwargs.update(qs_kwargs)
+        search = search.sort()
+
+        search_result = execute_search(search).to_dict()
+
+        endpoint = ".{0}_facets".format(
+            current_records_rest.default_endpoint_prefixes[self.pid_type]
+        )
+        if with_total:
+            urlkwargs["total"] = "true"
+        result = dict(
+            aggregations=search_result.get("aggregations", {}),
+            links=dict(self=url_for(endpoint, _external=True, **urlkwargs)),
+        )
+        if with_total:
+            result["total"] = search_result["hits"]["total"]["value"]
+        if is_partial_search_result(search_result):
+            result["timed_out"] = search_result.get("timed_out", False)
+
+        return make_response(jsonify(result))
+
+
+class RecordsMultiGetResource(MethodView):
+    """Resource for fetching many records by PID value."""
+
+    view_name = "{0}_mget"
+
+    def __init__(
+        self,
+        pid_type=None,
+        read_permission_factory=None,
+        record_class=None,
+        record_serializers=None,
+        default_media_type=None,
+        search_class=None,
+        links_factory=None,
+        **kwargs,
+    ):
+        """Constructor."""
+        self.pid_type = pid_type
+        self.read_permission_factory = read_permission_factory
+        self.record_class = record_class or Record
+        self.record_serializers = record_serializers
+        self.default_media_type = default_media_type
+        self.search_class = search_class
+        self.links_factory = links_factory
+
+    def post(self, **kwargs):
+        """Get many records.
+
+        Permissions: the ``read_permission_factory`` permissions are checked
+            for each record.
+
+        The body is a JSON object with the list of requested PID values, e.g.
+        ``{"ids": ["1", "2"]}``. The PIDs are resolved with one query and the
+        records are loaded with another one. Each record is transformed by the
+        record serializer of the endpoint matching the ``Accept`` header,
+        which must produce JSON (e.g.
+        :class:`invenio_records_rest.serializers.json.JSONSerializer`).
+
+        The response lists an item per requested PID value, in the requested
+        order, with the HTTP ``status`` the item view would have returned and
+        either the ``record`` or an error ``message``.
+
+        :returns: JSON response with the records.
+        """
+        serializer = self._negotiate_serializer()
+        pid_values = self._load_pid_values()
+
+        # FIXME use context instead
+        request._methodview = self
+        permission_factory = (
+            self.read_permission_factory or current_records_rest.read_permission_factory
+        )
+
+        resolved = resolve_pid_values(
+            self.pid_type, pid_values, self.record_class, with_deleted=False
+        )
+        items = []
+        for pid_value in pid_values:
+            if isinstance(resolved[pid_value], dict):
+                items.append(resolved[pid_value])
+                continue
+            pid, record = resolved[pid_value]
+            if permission_factory and not permission_factory(record=record).can():
+                from flask_login import current_user
+
+                status = 401 if not current_user.is_authenticated else 403
+                items.append(dict(id=pid_value, status=status))
+                continue
+            items.append(
+                dict(
+                    id=pid_value,
+                    status=200,
+                    record=serializer.transform_record(
+                        pid, record, links_factory=self.links_factory
+                    ),
+                )
+            )
+
+        return make_response(jsonify(dict(hits=items)))
+
+    def _negotiate_serializer(self):
+        """Get the record serializer matching the ``Accept`` header.
+
+        Only the serializers producing JSON can be embedded in the response.
+        """
+        serializers = {
+            mimetype: responsify.serializer
+            for mimetype, responsify in self.record_serializers.items()
+            if hasattr(getattr(responsify, "serializer", None), "transform_record")
+        }
+        mimetypes = sorted(serializers, key=lambda m: m != self.default_media_type)
+        if not request.accept_mimetypes:
+            mimetype = next(iter(mimetypes), None)
+        else:
+            mimetype = request.accept_mimetypes.best_match(mimetypes)
+        if mimetype is None:
+            abort(406)
+        return serializers[mimetype]
+
+    def _load_pid_values(self):
+        """Load the requested PID values from the request body."""
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            raise InvalidDataRESTError()
+        pid_values = data.get("ids")
+        if not isinstance(pid_values, list) or not all(
+            isinstance(v, (str, int)) for v in pid_values
+        ):
+            raise RESTValidationError(
+                errors=[FieldError("ids", _("Must be a list of PID values."))]
+            )
+        max_size = current_app.config["RECORDS_REST_MGET_MAX_SIZE"]
+        if len(pid_values) > max_size:
+            raise RESTValidationError(
+                errors=[
+                    FieldError(
+                        "ids",
+                        _(
+                            "At most %(max_size)s records can be requested.",
+                            max_size=max_size,
+                        ),
+                    )
+                ]
+            )
+        return [str(v) for v in pid_values]
+
+
+class RecordsBulkResource(MethodView):
+    """Resource for operations on many records."""
+
+    view_name = "{0}_bulk"
+
+    def __init__(
+        self,
+        minter_name=None,
+        pid_type=None,
+        create_permission_factory=None,
+        update_permission_factory=None,
+        delete_permission_factory=None,
+        list_permission_factory=None,
+        record_class=None,
+        search_class=None,
+        search_factory=None,
+        search_query_parser=None,
+        query_limits=None,
+        record_loaders=None,
+        indexer_class=None,
+        search_index=None,
+        **kwargs,
+    ):
+        """Constructor."""
+        self.minter = current_pidstore.minters[minter_name]
+        self.pid_type = pid_type
+        self.create_permission_factory = (
+            create_permission_factory or current_records_rest.create_permission_factory
+        )
+        self.update_permission_factory = update_permission_factory
+        self.delete_permission_factory = delete_permission_factory
+        self.list_permission_factory = (
+            list_permission_factory or current_records_rest.list_permission_factory
+        )
+        self.record_class = record_class or Record
+        self.search_class = search_class
+        self.search_factory = partial(search_factory, self) if search_factory else None
+        self.search_query_parser = search_query_parser
+        self.query_limits = query_limits
+        self.loaders = record_loaders or current_records_rest.loaders
+        self.indexer_class = indexer_class
+        self.search_index = search_index
+
+    def post(self, **kwargs):
+        """Create many records.
+
+        Permissions: ``create_permission_factory``, for each record.
+
+        The body is either a JSON array (``application/json``) or one JSON
+        object per line (``application/x-ndjson``). Each item is deserialized
+        by the ``application/json`` loader of the endpoint, as the body of a
+        record creation.
+
+        The items are processed in batches of
+        :data:`invenio_records_rest.config.RECORDS_REST_BULK_BATCH_SIZE`.
+        The records of a batch are created in one transaction, each one in a
+        savepoint so that invalid items do not affect the others, and are then
+        indexed with one bulk request.
+
+        :returns: JSON response with an item per record, in the order of the
+            request, with the HTTP ``status`` of the creation and either the
+            PID value or the error.
+        """
+        loader = self.loaders.get("application/json")
+        if loader is None:
+            raise UnsupportedMediaRESTError("application/json")
+        items = self._load_items()
+
+        # FIXME use context instead
+        request._methodview = self
+
+        endpoint = None
+        results = []
+        batch_size = current_app.config["RECORDS_REST_BULK_BATCH_SIZE"]
+        try:
+            for start in range(0, len(items), batch_size):
+                created = []
+                for item in items[start : start + batch_size]:
+                    try:
+                        if not isinstance(item, dict):
+                            raise InvalidDataRESTError()
+                        with item_request_json(item):
+                            data = loader()
+                        if not isinstance(data, dict):
+                            raise InvalidDataRESTError()
+                        if self.create_permission_factory:
+                            verify_record_permission(
+                                self.create_permission_factory, data
+                            )
+                        with db.session.begin_nested():
+                            record_uuid = uuid.uuid4()
+                            try:
+                                pid = self.minter(record_uuid, data=data)
+                            except PIDAlreadyExists as error:
+                                raise PIDAlreadyExistsRESTError(pid_error=error)
+                            except (AssertionError, TypeError, ValueError):
+                                # E.g. the record already has a PID value.
+                                raise InvalidDataRESTError(
+                                    description=_(
+                                        "Could not mint a persistent identifier."
+                                    )
+                                )
+                            record = self.record_class.create(data, id_=record_uuid)
+                    except ValidationError as error:
+                        results.append(
+                            bulk_error_item(JSONSchemaValidationError(error))
+                        )
+                    except HTTPException as error:
+                        results.append(bulk_error_item(error))
+                    except SQLAlchemyError:
+                        current_app.logger.exception("Failed to create record.")
+                        error = InvalidDataRESTError(
+                            description=_("Could not store the record.")
+                        )
+                        results.append(bulk_error_item(error))
+                    else:
+                        results.append(None)
+                        created.append((len(results) - 1, pid, record))
+                db.session.commit()
+
+                if self.indexer_class:
+                    bulk_index_records(self.indexer_class(), [r for _, _, r in created])
+                for position, pid, record in created:
+                    if endpoint is None:
+                        endpoint = ".{0}_item".format(
+                            current_records_rest.default_endpoint_prefixes[pid.pid_type]
+                        )
+                    results[position] = dict(
+                        status=201,
+                        id=pid.pid_value,
+                        revision=record.revision_id,
+                        location=url_for(
+                            endpoint, pid_value=pid.pid_value, _external=True
+                        ),
+                    )
+        finally:
+            # Also invalidate after a failure, earlier batches are committed.
+            invalidate_search_cache(self.search_index)
+
+        return make_response(jsonify(dict(items=results)))
+
+    def put(self, **kwargs):
+        """Replace many records.
+
+        Permissions: ``update_permission_factory``, for each record.
+
+        The body is a list of items like in :meth:`post`. Each item is an
+        object with the PID value of the record (``id``), its new
+        ``metadata`` and optionally the ``revision`` the client last read,
+        which is checked like the ``If-Match`` header of the item view. The
+        metadata is deserialized by the ``application/json`` loader of the
+        endpoint.
+
+        :returns: JSON response with an item per record, in the order of the
+            request, with the HTTP ``status`` of the update and either the new
+            revision or the error.
+        """
+        loader = self.loaders.get("application/json")
+        if loader is None:
+            raise UnsupportedMediaRESTError("application/json")
+
+        def replace(record, data):
+            # The resolved record is left untouched if the update fails.
+            return type(record)(data, model=record.model)
+
+        return self._update("metadata", loader, replace, dict)
+
+    def patch(self, **kwargs):
+        """Modify many records.
+
+        Permissions: ``update_permission_factory``, for each record.
+
+        Same as :meth:`put`, but each item has a JSON-patch (``patch``)
+        instead of the metadata, deserialized by the
+        ``application/json-patch+json`` loader of the endpoint.
+
+        :returns: JSON response with an item per record.
+        """
+        loader = self.loaders.get("application/json-patch+json")
+        if loader is None:
+            raise UnsupportedMediaRESTError("application/json-patch+json")
+
+        def apply_patch(record, data):
+            try:
+                return record.patch(data)
+            except (JsonPatchException, JsonPointerException):
+                raise PatchJSONFailureRESTError()
+
+        return self._update("patch", loader, apply_patch, list)
+
+    def delete(self, **kwargs):
+        """Delete many records.
+
+        Permissions: ``delete_permission_factory``, for each record. When
+        deleting by query, the ``list_permission_factory`` permissions are
+        checked as well.
+
+        The records are given either as a list of PID values, like the items
+        of :meth:`post`, or by a search query (``q`` and the other search
+        arguments of the list view) matching at most
+        :data:`invenio_records_rest.config.RECORDS_REST_BULK_MAX_SIZE`
+        records.
+
+        The records of a batch are deleted in one transaction, each one in a
+        savepoint so that failing items do not affect the others. All PIDs of
+        a record are marked as deleted with set-based updates (see
+        :func:`delete_record_pids`) and the records of a batch are removed
+        from the search engine with one bulk request.
+
+        :returns: JSON response with an item per record, in the order of the
+            request, with the HTTP ``status`` of the deletion.
+        """
+        # FIXME use context instead
+        request._methodview = self
+        if "q" in request.args:
+            pid_values = self._search_pid_values()
+        else:
+            pid_values = self._load_items()
+            if not all(isinstance(v, (str, int)) for v in pid_values):
+                raise InvalidDataRESTError()
+            pid_values = [str(v) for v in pid_values]
+        resolved = resolve_pid_values(
+            self.pid_type, pid_values, self.record_class, with_deleted=False
+        )
+        permission_factory = (
+            self.delete_permission_factory
+            or current_records_rest.delete_permission_factory
+        )
+
+        results = []
+        batch_size = current_app.config["RECORDS_REST_BULK_BATCH_SIZE"]
+        try:
+            for start in range(0, len(pid_values), batch_size):
+                deleted = []
+                for pid_value in pid_values[start : start + batch_size]:
+                    if isinstance(resolved[pid_value], dict):
+                        results.append(resolved[pid_value])
+                        continue
+                    pid, record = resolved[pid_value]
+                    try:
+                        if permission_factory:
+                            verify_record_permission(permission_factory, record)
+                        with db.session.begin_nested():
+                            record.delete()
+                            delete_record_pids([record.id])
+                    except HTTPException as error:
+                        results.append(dict(bulk_error_item(error), id=pid_value))
+                    except SQLAlchemyError:
+                        current_app.logger.exception("Failed to delete record.")
+                        error = InvalidDataRESTError(
+                            description=_("Could not delete the record.")
+                        )
+                        results.append(dict(bulk_error_item(error), id=pid_value))
+                    else:
+                        error = PIDDeletedRESTError()
+                        resolved[pid_value] = dict(
+                            id=pid_value, status=error.code, message=error.description
+                        )
+                        results.append(dict(id=pid_value, status=204))
+                        deleted.append(record)
+                db.session.commit()
+
+                if self.indexer_class:
+                    bulk_delete_records(self.indexer_class(), deleted)
+                for record in deleted:
+                    invalidate_existence_indexes(record)
+        finally:
+            # Also invalidate after a failure, earlier batches are committed.
+            invalidate_search_cache(self.search_index)
+
+        return make_response(jsonify(dict(items=results)))
+
+    def _search_pid_values(self):
+        """Get the PID values of the records matching the search query."""
+        if self.list_permission_factory:
+            verify_record_permission(self.list_permission_factory, None)
+
+        max_size = current_app.config["RECORDS_REST_BULK_MAX_SIZE"]
+        search = self.search_class().with_preference_param()
+        search = self.search_factory(search, self.search_query_parser)[0]
+        search = search.sort()[0:max_size].source(False)
+        # The aggregations of the facets are not needed.
+        search.aggs._params = {"aggs": {}}
+        search = search.extra(track_total_hits=max_size + 1)
+        search_result = execute_search(search)
+        if search_result.hits.total.value > max_size:
+            raise InvalidDataRESTError(
+                description=_(
+                    "At most %(max_size)s records can be deleted at once.",
+                    max_size=max_size,
+                )
+            )
+
+        object_uuids = [hit.meta.id for hit in search_result]
+        if not object_uuids:
+            return []
+        return [
+            pid_value
+            for (pid_value,) in db.session.query(PersistentIdentifier.pid_value)
+            .filter(
+                PersistentIdentifier.pid_type == self.pid_type,
+                PersistentIdentifier.object_type == "rec",
+                PersistentIdentifier.object_uuid.in_(object_uuids),
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+            )
+            .order_by(PersistentIdentifier.pid_value)
+        ]
+
+    def _update(self, field, loader, apply, data_type):
+        """Update the records of a bulk request.
+
+        The records are resolved with :func:`resolve_pid_values` and are then
+        updated in batches, like the records created by :meth:`post`.
+
+        :param field: Name of the field of the items with the update.
+        :param loader: Loader deserializing the update.
+        :param apply: Function applying the deserialized update to a record
+            and returning the updated record.
+        :param data_type: Expected type of the deserialized update.
+        :returns: JSON response with an item per record.
+        """
+        items = self._load_items()
+        valid = [
+            isinstance(item, dict)
+            and isinstance(item.get("id"), (str, int))
+            and field in item
+            for item in items
+        ]
+        resolved = resolve_pid_values(
+            self.pid_type,
+            [str(item["id"]) for item, ok in zip(items, valid) if ok],
+            self.record_class,
+            with_deleted=False,
+        )
+
+        # FIXME use context instead
+        request._methodview = self
+        permission_factory = (
+            self.update_permission_factory
+            or current_records_rest.update_permission_factory
+        )
+
+        results = []
+        batch_size = current_app.config["RECORDS_REST_BULK_BATCH_SIZE"]
+        try:
+            for start in range(0, len(items), batch_size):
+                updated = []
+                for item, ok in zip(
+                    items[start : start + batch_size], valid[start : start + batch_size]
+                ):
+                    if not ok:
+                        results.append(bulk_error_item(InvalidDataRESTError()))
+                        continue
+                    pid_value = str(item["id"])
+                    if isinstance(resolved[pid_value], dict):
+                        results.append(resolved[pid_value])
+                        continue
+                    pid, record = resolved[pid_value]
+                    try:
+                        if permission_factory:
+                            verify_record_permission(permission_factory, record)
+                        revision = item.get("revision")
+                        if revision is not None and str(revision) != str(
+                            record.revision_id
+                        ):
+                            raise PreconditionFailed()
+                        with item_request_json(item[field], pid=pid, record=record):
+                            data = loader()
+                        if not isinstance(data, data_type):
+                            raise InvalidDataRESTError()
+                        with db.session.begin_nested():
+                            record = apply(record, data)
+                            record.commit()
+                    except ValidationError as error:
+                        error = JSONSchemaValidationError(error)
+                        results.append(dict(bulk_error_item(error), id=pid_value))
+                    except HTTPException as error:
+                        results.append(dict(bulk_error_item(error), id=pid_value))
+                    except SQLAlchemyError:
+                        current_app.logger.exception("Failed to update record.")
+                        error = InvalidDataRESTError(
+                            description=_("Could not store the record.")
+                        )
+                        results.append(dict(bulk_error_item(error), id=pid_value))
+                    else:
+                        resolved[pid_value] = (pid, record)
+                        results.append(None)
+                        updated.append((len(results) - 1, pid, record))
+                db.session.commit()
+
+                if self.indexer_class:
+                    bulk_index_records(self.indexer_class(), [r for _, _, r in updated])
+                for position, pid, record in updated:
+                    invalidate_existence_indexes(record)
+                    results[position] = dict(
+                        status=200, id=pid.pid_value, revision=record.revision_id
+                    )
+        finally:
+            # Also invalidate after a failure, earlier batches are committed.
+            invalidate_search_cache(self.search_index)
+
+        return make_response(jsonify(dict(items=results)))
+
+    def _load_items(self):
+        """Load the items of a bulk request."""
+        if request.mimetype == "application/x-ndjson":
+            try:
+                items = [
+                    json.loads(line)
+                    for line in request.get_data(as_text=True).splitlines()
+                    if line.strip()
+                ]
+            except ValueError:
+                raise InvalidDataRESTError()
+        elif request.mimetype == "application/json":
+            items = request.get_json(silent=True)
+            if not isinstance(items, list):
+                raise InvalidDataRESTError()
+        else:
+            raise UnsupportedMediaRESTError(request.mimetype)
+
+        max_size = current_app.config["RECORDS_REST_BULK_MAX_SIZE"]
+        if len(items) > max_size:
+            raise InvalidDataRESTError(
+                description=_(
+                    "At most %(max_size)s records can be sent at once.",
+                    max_size=max_size,
+                )
+            )
+        return items
+
+
 class RecordResource(ContentNegotiatedMethodView):
     """Resource for record items."""
 
@@ -781,6 +2391,7 @@ class RecordResource(ContentNegotiatedMethodView):
         loaders=None,
         search_class=None,
         indexer_class=None,
+        search_index=None,
         **kwargs,
     ):
         """Constructor."""
@@ -806,6 +2417,7 @@ class RecordResource(ContentNegotiatedMethodView):
         self.links_factory = links_factory
         self.loaders = loaders or current_records_rest.loaders
         self.indexer_class = indexer_class
+        self.search_index = search_index
 
     @pass_record
     @need_record_permission("delete_permission_factory")
@@ -841,6 +2453,9 @@ class RecordResource(ContentNegotiatedMethodView):
         db.session.commit()
         if self.indexer_class:
             self.indexer_class().delete(record)
+        invalidate_search_cache(self.search_index)
+        invalidate_existence_indexes(record)
+        invalidate_pid_cache(all_pids)
 
         return "", 204
 
@@ -908,6 +2523,8 @@ class RecordResource(ContentNegotiatedMethodView):
         db.session.commit()
         if self.indexer_class:
             self.indexer_class().index(record)
+        invalidate_search_cache(self.search_index)
+        invalidate_existence_indexes(record)
 
         return self.make_response(pid, record, links_factory=self.links_factory)
 
@@ -949,6 +2566,8 @@ class RecordResource(ContentNegotiatedMethodView):
         db.session.commit()
         if self.indexer_class:
             self.indexer_class().index(record)
+        invalidate_search_cache(self.search_index)
+        invalidate_existence_indexes(record)
         return self.make_response(pid, record, links_factory=self.links_factory)
 
 
@@ -957,10 +2576,19 @@ class SuggestResource(MethodView):
 
     view_name = "{0}_suggest"
 
-    def __init__(self, suggesters, search_class=None, **kwargs):
+    def __init__(
+        self,
+        suggesters,
+        search_class=None,
+        search_timeout=None,
+        allow_partial_search_results=None,
+        **kwargs,
+    ):
         """Constructor."""
         self.suggesters = suggesters
         self.search_class = search_class
+        self.search_timeout = search_timeout
+        self.allow_partial_search_results = allow_partial_search_results
 
     def get(self, **kwargs):
         """Get suggestions."""
@@ -998,7 +2626,11 @@ class SuggestResource(MethodView):
             )
 
         # Add completions
-        s = self.search_class()
+        s = apply_search_budget(
+            self.search_class(),
+            timeout=self.search_timeout,
+            allow_partial_search_results=self.allow_partial_search_results,
+        )
         for field, val, opts in completions:
             source = opts.pop("_source", None)
             if source is not None:
@@ -1006,7 +2638,7 @@ class SuggestResource(MethodView):
             else:
                 s = s.suggest(field, val, **opts)
 
-        response = s.execute().to_dict()["suggest"]
+        response = execute_search(s).to_dict()["suggest"]
 
         result = dict()
         for field, val, opts in completions:
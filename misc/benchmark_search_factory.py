@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Microbenchmark of the default search factory.
+
+Measures the time spent building the search of a list request with the
+default query parser, facets and sorter factories, without executing it.
+Run it on two checkouts to compare them:
+
+.. code-block:: console
+
+    $ python misc/benchmark_search_factory.py
+    $ git checkout <other revision>
+    $ python misc/benchmark_search_factory.py
+"""
+
+import argparse
+import timeit
+from functools import partial
+
+from flask import Flask
+from invenio_search.engine import dsl
+
+from invenio_records_rest import InvenioRecordsREST
+from invenio_records_rest.facets import range_filter, terms_filter
+from invenio_records_rest.query import default_search_factory
+
+FACETS = {
+    "records": {
+        "aggs": {
+            "type": {"terms": {"field": "type"}},
+            "subtype": {"terms": {"field": "subtype", "size": 20}},
+            "keywords": {"terms": {"field": "keywords"}},
+            "year": {"date_histogram": {"field": "date", "interval": "year"}},
+        },
+        "filters": {"type": terms_filter("type")},
+        "post_filters": {
+            "keywords": partial(terms_filter("keywords")),
+            "year": range_filter("date", format="yyyy", end_date_math="/y"),
+        },
+    }
+}
+
+SORT_OPTIONS = {
+    "records": {
+        "mostrecent": {"fields": ["-date", {"title": {"order": "asc"}}]},
+    }
+}
+
+QUERY_STRING = {
+    "q": "title:test",
+    "type": "article",
+    "keywords": "physics",
+    "year": "2000--2020",
+    "sort": "mostrecent",
+}
+
+
+def create_app():
+    """Create an application with the benchmarked facets and sort options."""
+    app = Flask(__name__)
+    app.config.update(
+        RECORDS_REST_FACETS=FACETS,
+        RECORDS_REST_SORT_OPTIONS=SORT_OPTIONS,
+    )
+    InvenioRecordsREST(app)
+    return app
+
+
+def main():
+    """Print the time per search built, best of several repetitions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.test_request_context("/records/", query_string=QUERY_STRING):
+
+        def build():
+            search = dsl.Search(index="records")
+            return default_search_factory(None, search)
+
+        def build_body():
+            return build()[0].to_dict()
+
+        for name, func in (("search", build), ("search and body", build_body)):
+            best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+            print("{0}: {1:.1f} us per request".format(name, best / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cache tests."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Response
+from invenio_search.engine import dsl
+from mock import patch
+
+from invenio_records_rest.cache import (
+    CacheAdapter,
+    ExistenceIndex,
+    LRUCache,
+    NamespacedCache,
+    QueryParserCache,
+    ResponseCache,
+    SingleFlight,
+)
+from invenio_records_rest.errors import InvalidQueryRESTError
+from invenio_records_rest.query import default_search_factory
+
+
+def test_lru_cache():
+    """Test LRU eviction and expiration."""
+    cache = LRUCache(maxsize=2, default_timeout=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" is the least recently used entry
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    with patch("invenio_records_rest.cache.time.monotonic", return_value=0):
+        cache.set("d", 4)
+        cache.set("e", 5, timeout=0)
+    with patch("invenio_records_rest.cache.time.monotonic", return_value=11):
+        assert cache.get("d") is None
+        assert cache.get("e") == 5
+
+
+def test_cache_adapter():
+    """Test adapter for shared caches."""
+
+    class SharedCache(object):
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            return self.data.get(key)
+
+        def set(self, key, value, timeout=None):
+            self.data[key] = value
+
+        def delete(self, key):
+            self.data.pop(key, None)
+
+    shared = SharedCache()
+    cache = CacheAdapter(shared, key_prefix="p:")
+    cache.set("a", 1, timeout=5)
+    assert shared.data == {"p:a": 1}
+    assert cache.get("a") == 1
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_response_cache(app):
+    """Test response caching and invalidation."""
+    cache = ResponseCache(LRUCache(), timeout=10)
+    key = cache.make_key("records", "recid_list", [("q", "test")])
+    assert key == cache.make_key("records", "recid_list", [("q", "test")])
+    assert key != cache.make_key("records", "recid_list", [("q", "other")])
+    assert key != cache.make_key("authors", "recid_list", [("q", "test")])
+    assert cache.get(key) is None
+
+    response = Response(
+        '{"hits": {}}',
+        mimetype="application/json",
+        headers={"Link": '<http://localhost/records/>; rel="self"'},
+    )
+    cache.set(key, response)
+    cached = cache.get(key)
+    assert cached.get_data() == response.get_data()
+    assert cached.mimetype == "application/json"
+    assert cached.headers["Link"] == response.headers["Link"]
+
+    cache.invalidate("authors")
+    assert cache.get(key) is not None
+    cache.invalidate("records")
+    assert cache.make_key("records", "recid_list", [("q", "test")]) != key
+
+
+def test_namespaced_cache():
+    """Test namespaced cache of plain values."""
+    cache = NamespacedCache(LRUCache(), timeout=10)
+    key = cache.make_key("records", {"query": {"match_all": {}}})
+    cache.set(key, {"type": {"buckets": []}})
+    assert cache.get(key) == {"type": {"buckets": []}}
+    cache.invalidate("records")
+    key = cache.make_key("records", {"query": {"match_all": {}}})
+    assert cache.get(key) is None
+
+
+def test_namespaced_cache_refresh_interval():
+    """Test that values computed before the index refresh are not cached."""
+    cache = NamespacedCache(LRUCache(), timeout=10, refresh_interval=1)
+    key = cache.make_key("records", "q")
+    cache.set(key, "cached")
+    assert cache.get(key) == "cached"
+
+    with patch("invenio_records_rest.cache.time.time", return_value=100.0):
+        cache.invalidate("records")
+        key = cache.make_key("records", "q")
+        cache.set(key, "stale")
+    assert cache.get(key) is None
+
+    with patch("invenio_records_rest.cache.time.time", return_value=101.0):
+        assert cache.make_key("records", "q") == key
+        cache.set(key, "fresh")
+    assert cache.get(key) == "fresh"
+
+
+def test_single_flight():
+    """Test coalescing of concurrent identical calls."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+
+    def worker():
+        results.append(single_flight.do("key", func))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Give the other calls time to join the call in flight
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("result", False)] + [("result", True)] * 3
+
+    # Results are not kept once the call is done
+    assert single_flight.do("key", lambda: "new") == ("new", False)
+
+    # Exceptions are raised
+    def error():
+        raise ValueError()
+
+    pytest.raises(ValueError, single_flight.do, "key", error)
+    assert not single_flight._calls
+
+
+def test_existence_index(app):
+    """Test the per-process index of existing identifiers."""
+    existence_index = ExistenceIndex(refresh_interval=60, max_size=10)
+    assert existence_index.is_stale
+    assert "a" not in existence_index
+    # Nothing is known before the identifiers are loaded
+    existence_index.add("a")
+    assert "a" not in existence_index
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def scan(search):
+        started.set()
+        release.wait(5)
+        return {"a", "b", "c"}
+
+    with ThreadPoolExecutor(1) as executor, patch.object(
+        ExistenceIndex, "_scan", side_effect=scan
+    ):
+        future = existence_index.refresh(None, executor)
+        started.wait(5)
+        assert existence_index.refresh(None, executor) is None
+        # Identifiers discarded while loading are not added
+        existence_index.discard("c")
+        release.set()
+        future.result(5)
+
+    assert not existence_index.is_stale
+    assert "a" in existence_index
+    assert "b" in existence_index
+    assert "c" not in existence_index
+    existence_index.discard("a")
+    assert "a" not in existence_index
+    existence_index.add("d")
+    assert "d" in existence_index
+
+    # Failures leave the index empty until the next refresh
+    with ThreadPoolExecutor(1) as executor, patch.object(
+        ExistenceIndex, "_scan", side_effect=ValueError
+    ):
+        existence_index.refresh(None, executor).result(5)
+    assert "b" not in existence_index
+
+
+def test_query_parser_cache():
+    """Test caching of parsed query strings."""
+    calls = []
+
+    def parser(qstr):
+        calls.append(qstr)
+        if qstr.endswith(":"):
+            raise SyntaxError()
+        return dsl.Q("query_string", query=qstr)
+
+    cache = QueryParserCache(LRUCache(), timeout=10)
+    assert cache.hit_rate == 0.0
+    for _ in range(3):
+        query = cache.parse(parser, "title:back")
+        assert query == dsl.Q("query_string", query="title:back")
+    assert calls == ["title:back"]
+
+    # Invalid query strings are cached too
+    for _ in range(2):
+        pytest.raises(SyntaxError, cache.parse, parser, "title:")
+    assert calls == ["title:back", "title:"]
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert cache.hit_rate == 0.6
+
+    # Keys depend on the parser and the endpoint it is used in
+    assert cache.make_key(parser, "a") != cache.make_key(dsl.Q, "a")
+    assert cache.make_key(parser, "a", scope="a.list") != cache.make_key(
+        parser, "a", scope="b.list"
+    )
+
+    # Parsers with the same qualified name are separated by their endpoint
+    parsers = [lambda qstr: dsl.Q("match", a=qstr), lambda qstr: dsl.Q("match", b=qstr)]
+    assert cache.make_key(parsers[0], "x") == cache.make_key(parsers[1], "x")
+    assert [
+        cache.parse(p, "x", scope=scope).to_dict()
+        for p, scope in zip(parsers, ["a.list", "b.list"])
+    ] == [
+        {"match": {"a": "x"}},
+        {"match": {"b": "x"}},
+    ]
+
+
+def test_query_parser_cache_search_factory(app):
+    """Test the query parser cache in the default search factory."""
+    calls = []
+
+    def parser(qstr):
+        calls.append(qstr)
+        if qstr == "invalid":
+            raise SyntaxError()
+        return dsl.Q("query_string", query=qstr)
+
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_QUERY_PARSER_CACHE": LRUCache}):
+        state.__dict__.pop("query_parser_cache", None)
+        for q in ["back", "back", "invalid", "invalid"]:
+            with app.test_request_context("/", query_string=dict(q=q)):
+                search = dsl.Search(index="records")
+                if q == "invalid":
+                    with pytest.raises(InvalidQueryRESTError):
+                        default_search_factory(None, search, parser)
+                else:
+                    search, _ = default_search_factory(None, search, parser)
+                    assert search.to_dict()["query"] == dict(
+                        query_string=dict(query="back")
+                    )
+        assert calls == ["back", "invalid"]
+        assert state.query_parser_cache.hits == 2
+    state.__dict__.pop("query_parser_cache", None)
@@ -4,6 +4,8 @@
 
 """Facets tests."""
 
+from functools import partial
+
 import pytest
 from flask import Flask
 from invenio_rest.errors import RESTValidationError
@@ -15,6 +17,7 @@ from invenio_records_rest.facets import (
     _create_filter_dsl,
     _post_filter,
     _query_filter,
+    compile_facets,
     default_facets_factory,
     range_filter,
     terms_filter,
@@ -279,3 +282,31 @@ def test_selecting_all_facets_by_default(app):
         search = dsl.Search().query(dsl.Q(query="value"))
         search, urlkwargs = default_facets_factory(search, "test_facet_names")
         assert search.to_dict().get("aggs") == expected_agg
+
+
+def test_compile_facets():
+    """Test compilation of facets definitions."""
+    defs = dict(
+        aggs=dict(type=dict(terms=dict(field="upload_type"))),
+        post_filters=dict(type=terms_filter("type")),
+    )
+    compiled = compile_facets(defs)
+    assert isinstance(compiled.aggs["type"], dsl.aggs.Terms)
+    assert compiled.aggs["type"].to_dict() == defs["aggs"]["type"]
+    assert compiled.post_filters == defs["post_filters"]
+    assert compiled.filters == {}
+    assert compile_facets(defs) is compiled
+
+    # Definitions changed in place are compiled again
+    defs["aggs"]["subtype"] = dict(terms=dict(field="subtype"))
+    compiled = compile_facets(defs)
+    assert set(compiled.aggs) == {"type", "subtype"}
+    defs["aggs"]["subtype"] = dict(terms=dict(field="subtype", size=5))
+    assert compile_facets(defs).aggs["subtype"].to_dict() == dict(
+        terms=dict(field="subtype", size=5)
+    )
+
+    # Definitions are not compared by value
+    defs["post_filters"]["subtype"] = partial(terms_filter("subtype"))
+    compiled = compile_facets(defs)
+    assert compile_facets(defs) is compiled
@@ -7,10 +7,15 @@
 import copy
 
 import pytest
+from flask import url_for
 from helpers import create_record, get_json, record_url
+from invenio_pidstore.models import PersistentIdentifier
 
 from invenio_records_rest.config import RECORDS_REST_ENDPOINTS
-from invenio_records_rest.links import default_links_factory_with_additional
+from invenio_records_rest.links import (
+    default_links_factory,
+    default_links_factory_with_additional,
+)
 from invenio_records_rest.views import create_blueprint
 
 
@@ -25,6 +30,28 @@ def test_default_links_factory_with_additional(app, db):
         assert links["test_link"] == "http://localhost:5000/1"
 
 
+def test_default_links_factory(app):
+    """Test that links built from templates match the URL map."""
+    state = app.extensions["invenio-records-rest"]
+    for base_url in (
+        "http://localhost:5000",
+        "https://example.org/api",
+        "https://other.example.org",
+        "http://xn--bcher-kva.example",
+    ):
+        with app.test_request_context("/records/", base_url=base_url):
+            for pid_value in ("1", "a b", "10.1234/ab?c#d", "é"):
+                pid = PersistentIdentifier(pid_type="recid", pid_value=pid_value)
+                assert default_links_factory(pid)["self"] == url_for(
+                    "invenio_records_rest.recid_item",
+                    pid_value=pid_value,
+                    _external=True,
+                )
+    # Templates do not depend on the host of the request
+    assert len(state.link_templates) == 1
+    assert all(state.link_templates.values())
+
+
 # Create a configuration with an old link factory. Used in the next test.
 config = copy.deepcopy(RECORDS_REST_ENDPOINTS)
 config["recid"]["links_factory_imp"] = lambda pid: {
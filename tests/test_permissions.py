@@ -5,8 +5,15 @@
 """Permissions tests."""
 
 import json
+import time
+import uuid
+from unittest.mock import patch
 
+from flask import request
 from helpers import record_url
+from invenio_search import RecordsSearch
+
+from invenio_records_rest.utils import check_search_existence
 
 
 def test_default_permissions(
@@ -43,3 +50,72 @@ def test_default_permissions(
         assert 403 == client.put(rec_url, **uargs).status_code
         assert 403 == client.patch(rec_url, **upargs).status_code
         assert 403 == client.delete(rec_url, query_string=qs).status_code
+
+
+def test_check_search_existence(app, db, test_records, indexed_records):
+    """Test the read permission based on the existence indexes."""
+    state = app.extensions["invenio-records-rest"]
+    pid, record = test_records[0]
+    rec_url = record_url(pid)
+    with patch.dict(
+        app.config,
+        {"RECORDS_REST_DEFAULT_READ_PERMISSION_FACTORY": check_search_existence},
+    ):
+        state.reset_permission_factories()
+        with app.test_client() as client:
+            assert client.get(rec_url).status_code == 200
+            (existence_index,) = state.existence_indexes.values()
+            for _ in range(50):
+                if not existence_index.is_stale:
+                    break
+                time.sleep(0.1)
+            assert str(record.id) in existence_index
+
+            # Records known to exist are not searched for
+            with patch("invenio_search.RecordsSearch.count") as count:
+                assert client.get(rec_url).status_code == 200
+                assert not count.called
+
+            # Records deleted through the REST API are removed
+            assert client.delete(rec_url).status_code == 204
+            assert str(record.id) not in existence_index
+    state.reset_permission_factories()
+    state.__dict__.pop("existence_indexes", None)
+
+
+def test_check_search_existence_fallback(app):
+    """Test the fallback to a search if no existence index can be used."""
+    state = app.extensions["invenio-records-rest"]
+    state.__dict__.pop("existence_indexes", None)
+    record = type("Record", (), {"id": uuid.uuid4()})()
+    view = type("View", (), {"search_class": RecordsSearch})()
+    with patch("invenio_search.RecordsSearch.count", return_value=1) as count, patch(
+        "invenio_records_rest.utils.ExistenceIndex.refresh"
+    ) as refresh:
+        with app.test_request_context("/records/1"):
+            request._methodview = view
+            assert check_search_existence(record).can()
+            (existence_index,) = state.existence_indexes.values()
+            # Indexes are not loaded in the search thread pool
+            assert refresh.call_args[0][1] is state.existence_index_executor
+            existence_index._ids = {str(record.id)}
+            existence_index._loaded_at = time.monotonic()
+            count.reset_mock()
+            assert check_search_existence(record).can()
+            assert not count.called
+
+            # A different search of the same endpoint does not use the index
+            view.search_class = lambda: RecordsSearch().filter("term", owner=1)
+            assert check_search_existence(record).can()
+            assert count.called
+            assert list(state.existence_indexes.values()) == [existence_index]
+
+        # The number of existence indexes is bounded
+        with patch.dict(app.config, {"RECORDS_REST_EXISTENCE_INDEX_MAX_INDEXES": 1}):
+            with app.test_request_context("/records/"):
+                request._methodview = view
+                count.reset_mock()
+                assert check_search_existence(record).can()
+                assert count.called
+                assert len(state.existence_indexes) == 1
+    state.__dict__.pop("existence_indexes", None)
@@ -4,10 +4,14 @@
 
 """PID resolver tests."""
 
+from unittest.mock import patch
+
 from flask import url_for
-from helpers import create_record
+from helpers import create_record, get_json
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus, RecordIdentifier
 
+from invenio_records_rest.cache import LRUCache
+
 
 def test_record_resolution(app, db):
     """Test resolution of PIDs to records."""
@@ -67,3 +71,36 @@ def test_record_resolution(app, db):
             headers=headers,
         )
         assert res.status_code == 301
+
+
+def test_record_resolution_cache(app, db):
+    """Test resolution of PIDs with the PID cache."""
+    pid_ok, record = create_record({"title": "test"})
+    pid_red = PersistentIdentifier.create("recid", "101", status=PIDStatus.REGISTERED)
+    pid_red.redirect(pid_ok)
+    db.session.commit()
+
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_PID_CACHE": LRUCache}):
+        state.__dict__.pop("pid_cache", None)
+        ok_url = url_for("invenio_records_rest.recid_item", pid_value=pid_ok.pid_value)
+        red_url = url_for("invenio_records_rest.recid_item", pid_value="101")
+        with app.test_client() as client:
+            assert client.get(ok_url).status_code == 200
+            assert client.get(red_url).status_code == 301
+
+            # Cached PIDs are resolved without querying the PIDs
+            with patch.object(PersistentIdentifier, "get") as get:
+                res = client.get(ok_url)
+                assert res.status_code == 200
+                assert get_json(res)["metadata"]["title"] == "test"
+                res = client.get(red_url)
+                assert res.status_code == 301
+                assert res.headers["Location"].endswith(ok_url)
+                assert not get.called
+
+            # Deleting the record through the REST API invalidates its PID
+            with patch("invenio_indexer.api.RecordIndexer.delete"):
+                assert client.delete(ok_url).status_code == 204
+            assert client.get(ok_url).status_code == 410
+    state.__dict__.pop("pid_cache", None)
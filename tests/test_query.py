@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Query factory tests."""
+
+import threading
+
+import pytest
+from helpers import get_json
+
+from invenio_records_rest.query import default_query_analyzer
+
+LIMITS = dict(
+    max_clauses=5,
+    allow_leading_wildcard=False,
+    max_wildcards=2,
+    max_regex_length=10,
+    max_fuzziness=1,
+    max_fuzzy_terms=1,
+    text_fields=["title"],
+)
+
+
+@pytest.mark.parametrize(
+    "query_string,violations",
+    [
+        ("back to the future", []),
+        ('title:"back to the future"~3 AND year:[2000 TO 2010]', []),
+        ("title:fut* OR *", []),
+        ("*:*", []),
+        ("title:*ture", ["leading_wildcard"]),
+        ("?uture", ["leading_wildcard"]),
+        (r"\*future", []),
+        ("f*u*t*", ["wildcards"]),
+        ("title:/fu.*re/", []),
+        ("title:/[a-z]+ture[0-9]*/", ["regex"]),
+        ("future~1", []),
+        ("future~", ["fuzziness"]),
+        ("back~1 future~1", ["fuzzy_terms"]),
+        ("title:[a TO z]", ["text_range"]),
+        ("title:>a", ["text_range"]),
+        ("year:>2000", []),
+        ("a OR b OR c OR d OR e OR f", ["clauses"]),
+        ("(a b) (c d) (e f)", ["clauses"]),
+    ],
+)
+def test_default_query_analyzer(query_string, violations):
+    """Test the detection of complex query strings."""
+    assert default_query_analyzer(query_string, LIMITS) == violations
+
+
+def test_default_query_analyzer_no_limits():
+    """Test that missing limits are not checked."""
+    assert default_query_analyzer("*a~5 OR title:[a TO z] " * 100, {}) == []
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(query_limits=LIMITS))], indirect=["app"]
+)
+def test_query_limits(app, search_url):
+    """Test rejection of complex query strings by the search view."""
+    state = app.extensions["invenio-records-rest"]
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="*ture AND f*u*t*"))
+        assert res.status_code == 400
+        data = get_json(res)
+        assert data["message"] == "The search query is too complex."
+        assert {e["field"] for e in data["errors"]} == {"q"}
+        assert len(data["errors"]) == 2
+    assert state.rejected_queries["leading_wildcard"] == 1
+    assert state.rejected_queries["wildcards"] == 1
+
+
+def test_count_rejected_query(app):
+    """Test counting rejected query strings from several threads."""
+    state = app.extensions["invenio-records-rest"]
+
+    def reject():
+        for _ in range(1000):
+            state.count_rejected_query(["wildcards"])
+
+    threads = [threading.Thread(target=reject) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state.rejected_queries["wildcards"] == 4000
@@ -193,3 +193,26 @@ def test_serialize_search():
     assert expected_next_rows == row_3.rstrip()
     assert expected_next_rows == row_4.rstrip()
     assert expected_next_rows == row_5.rstrip()
+
+
+def test_source_fields():
+    """Test the source fields of the included columns."""
+    assert CSVSerializer(SimpleSchema).source_fields == [
+        "description",
+        "extra",
+        "langs",
+        "number",
+        "related",
+        "title",
+    ]
+    assert CSVSerializer(
+        SimpleSchema, csv_included_fields=["langs", "title.title"]
+    ).source_fields == ["langs", "title"]
+
+    # The whole metadata is dumped by the default schema.
+    assert CSVSerializer().source_fields is None
+    source_fields = CSVSerializer(
+        csv_included_fields=["id", "metadata_title_title"]
+    ).source_fields
+    assert "title" in source_fields
+    assert "description" not in source_fields
@@ -48,6 +48,12 @@ def test_serialize(serializer):
     assert len(tree.xpath("/oai_datacite/datacentreSymbol")) == 1
 
 
+@pytest.mark.parametrize("serializer", [DataCite40Serializer, DataCite41Serializer])
+def test_source_fields(serializer):
+    """Test the source fields read by the nested schema."""
+    assert serializer(SimpleSchema).source_fields == ["doi"]
+
+
 @pytest.mark.parametrize("serializer", [DataCite40Serializer, DataCite41Serializer])
 def test_serialize_search(serializer):
     """Test JSON serialize."""
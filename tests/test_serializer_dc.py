@@ -30,6 +30,11 @@ def test_serialize():
     assert len(tree) == 1
 
 
+def test_source_fields():
+    """Test the source fields read by the schema."""
+    assert DublinCoreSerializer(SimpleSchema).source_fields == ["titles"]
+
+
 def test_serialize_search():
     """Test JSON serialize."""
 
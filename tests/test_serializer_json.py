@@ -11,7 +11,7 @@ from invenio_rest.serializer import BaseSchema as Schema
 from marshmallow import fields
 
 from invenio_records_rest.schemas.fields import PersistentIdentifier as PIDField
-from invenio_records_rest.serializers.json import JSONSerializer
+from invenio_records_rest.serializers.json import JSONIdsSerializer, JSONSerializer
 
 
 def test_serialize():
@@ -78,6 +78,60 @@ def test_serialize_search():
     )
 
 
+def test_serialize_search_partial():
+    """Test JSON serialization of partial search results."""
+
+    def fetcher(obj_uuid, data):
+        return PersistentIdentifier(pid_type="recid", pid_value=data["pid"])
+
+    result = dict(
+        hits=dict(hits=[], total=dict(value=0)),
+        timed_out=False,
+        _shards=dict(total=1, successful=1, skipped=0, failed=0),
+    )
+    data = json.loads(JSONSerializer().serialize_search(fetcher, result))
+    assert "timed_out" not in data
+    assert "_shards" not in data
+
+    result.update(
+        timed_out=True,
+        _shards=dict(total=2, successful=1, skipped=0, failed=1, failures=[{}]),
+    )
+    data = json.loads(JSONSerializer().serialize_search(fetcher, result))
+    assert data["timed_out"] is True
+    assert data["terminated_early"] is False
+    assert data["_shards"] == dict(total=2, successful=1, skipped=0, failed=1)
+
+
+def test_serialize_search_ids():
+    """Test JSON serialization of search results as identifiers."""
+
+    def fetcher(obj_uuid, data):
+        return PersistentIdentifier(pid_type="recid", pid_value=data["pid"])
+
+    result = dict(
+        hits=dict(
+            hits=[
+                {"_source": dict(pid="1"), "_id": "a", "_version": 1},
+                {"_source": dict(pid="2"), "_id": "b", "_version": 1},
+            ],
+            total=dict(value=3),
+        ),
+        aggregations=dict(type=dict(buckets=[])),
+    )
+    data = json.loads(
+        JSONIdsSerializer().serialize_search(
+            fetcher, result, links=dict(self="http://localhost/")
+        )
+    )
+    assert data == dict(
+        hits=dict(hits=["1", "2"], total=3),
+        links=dict(self="http://localhost/"),
+        aggregations=dict(type=dict(buckets=[])),
+    )
+    assert JSONIdsSerializer.source_fields == []
+
+
 def test_serialize_pretty(app):
     """Test pretty JSON."""
 
@@ -94,3 +148,39 @@ def test_serialize_pretty(app):
         assert (
             JSONSerializer(TestSchema).serialize(pid, rec) == '{\n  "title": "test"\n}'
         )
+
+
+def test_serialize_search_stream(app):
+    """Test JSON streaming serialization of search hits."""
+
+    class TestSchema(Schema):
+        title = fields.Str(attribute="metadata.mytitle")
+        id = PIDField(attribute="pid.pid_value")
+
+    def fetcher(obj_uuid, data):
+        return PersistentIdentifier(pid_type="recid", pid_value=data["pid"])
+
+    def hits():
+        for i in range(3):
+            yield {
+                "_source": dict(mytitle="test{0}".format(i), pid=str(i)),
+                "_id": str(i),
+                "_version": 1,
+            }
+
+    with app.test_request_context():
+        chunks = JSONSerializer(TestSchema).serialize_search_stream(
+            fetcher, hits(), links=dict(self="http://localhost/records/_export")
+        )
+        data = json.loads("".join(chunks))
+
+    assert data["links"] == dict(self="http://localhost/records/_export")
+    assert data["hits"] == dict(
+        hits=[dict(title="test{0}".format(i), id=str(i)) for i in range(3)]
+    )
+
+    with app.test_request_context():
+        data = json.loads(
+            "".join(JSONSerializer(TestSchema).serialize_search_stream(fetcher, []))
+        )
+    assert data == dict(hits=dict(hits=[]), links={})
@@ -58,3 +58,15 @@ def test_transform_record_default_schema():
         "metadata": {"title": "test"},
         "updated": None,
     }
+
+
+def test_source_fields():
+    """Test declaration of the source fields used by the serializer."""
+
+    class _SourceSchema(_TestSchema):
+        source_fields = ["title"]
+
+    assert SimpleMarshmallowSerializer(_TestSchema).source_fields is None
+    assert SimpleMarshmallowSerializer(_SourceSchema).source_fields == ["title"]
+    serializer = SimpleMarshmallowSerializer(_SourceSchema, source_fields=["a"])
+    assert serializer.source_fields == ["a"]
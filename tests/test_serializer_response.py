@@ -3,12 +3,18 @@
 
 """Invenio serializer tests."""
 
+import uuid
+from unittest.mock import patch
+
 from invenio_pidstore.models import PersistentIdentifier
 from invenio_records import Record
+from invenio_records.models import RecordMetadata
 
+from invenio_records_rest.cache import CacheAdapter, LRUCache
 from invenio_records_rest.serializers.response import (
     record_responsify,
     search_responsify,
+    search_stream_responsify,
 )
 
 
@@ -23,6 +29,11 @@ class TestSerializer(object):
         """Dummy method."""
         return str(len(result))
 
+    def serialize_search_stream(self, fetcher, hits, **kwargs):
+        """Dummy method."""
+        for hit in hits:
+            yield "{0};".format(hit)
+
 
 def test_record_responsify(app):
     """Test JSON serialize."""
@@ -40,6 +51,49 @@ def test_record_responsify(app):
     assert resp.status_code == 201
 
 
+def test_record_responsify_cache(app):
+    """Test caching of serialized records."""
+    calls = []
+
+    class CountingSerializer(TestSerializer):
+        def serialize(self, pid, record, **kwargs):
+            calls.append(pid.pid_value)
+            return super().serialize(pid, record, **kwargs)
+
+    state = app.extensions["invenio-records-rest"]
+    rec_serializer = record_responsify(CountingSerializer(), "application/x-custom")
+    pid = PersistentIdentifier(pid_type="rec", pid_value="1")
+    model = RecordMetadata(id=uuid.uuid4(), version_id=1)
+    rec = Record({"title": "test"}, model=model)
+
+    with patch.dict(
+        app.config, {"RECORDS_REST_RECORD_CACHE": lambda: CacheAdapter(LRUCache())}
+    ):
+        state.__dict__.pop("record_cache", None)
+        with app.test_request_context("/records/1"):
+            for _ in range(2):
+                resp = rec_serializer(pid, rec)
+                assert resp.get_data(as_text=True) == "1:test"
+                assert resp.headers["ETag"] == '"0"'
+            assert len(calls) == 1
+
+            # A new revision is serialized again
+            model.version_id = 2
+            resp = rec_serializer(pid, rec)
+            assert resp.headers["ETag"] == '"1"'
+            assert len(calls) == 2
+
+            # Responses with other status codes are not cached
+            rec_serializer(pid, rec, code=201)
+            assert len(calls) == 3
+
+        # Serialization options are part of the key
+        with app.test_request_context("/records/1?prettyprint=1"):
+            rec_serializer(pid, rec)
+            assert len(calls) == 4
+    state.__dict__.pop("record_cache", None)
+
+
 def test_search_responsify(app):
     """Test JSON serialize."""
     search_serializer = search_responsify(TestSerializer(), "application/x-custom")
@@ -49,6 +103,8 @@ def test_search_responsify(app):
 
     result = ["a"] * 5
 
+    assert isinstance(search_serializer.serializer, TestSerializer)
+
     resp = search_serializer(fetcher, result)
     assert resp.status_code == 200
     assert resp.content_type == "application/x-custom"
@@ -57,3 +113,21 @@ def test_search_responsify(app):
     resp = search_serializer(fetcher, result, code=201, headers=[("X-Test", "test")])
     assert resp.status_code == 201
     assert resp.headers["X-Test"] == "test"
+
+
+def test_search_stream_responsify(app):
+    """Test streaming search response."""
+    stream_serializer = search_stream_responsify(
+        TestSerializer(), "application/x-custom"
+    )
+
+    def fetcher():
+        pass
+
+    with app.test_request_context():
+        resp = stream_serializer(fetcher, iter(["a", "b"]), headers=[("X-Test", "t")])
+        assert resp.status_code == 200
+        assert resp.is_streamed
+        assert resp.content_type == "application/x-custom"
+        assert resp.headers["X-Test"] == "t"
+        assert resp.get_data(as_text=True) == "a;b;"
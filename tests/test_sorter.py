@@ -7,6 +7,7 @@ import pytest
 from invenio_search.engine import dsl
 
 from invenio_records_rest.sorter import (
+    compile_sort_options,
     default_sorter_factory,
     eval_field,
     geolocation_sort,
@@ -148,3 +149,29 @@ def test_default_sorter_factory(app):
     with app.test_request_context("/?q=test"):
         query, urlargs = default_sorter_factory(dsl.Search(), "aidx")
         assert "sort" not in query.to_dict()
+
+
+def test_compile_sort_options():
+    """Test compilation of sort options."""
+    options = dict(
+        mostrecent=dict(fields=[dict(date=dict(order="desc")), "-_score"]),
+        dynamic=dict(fields=[lambda asc: dict(f=dict(order=asc))]),
+    )
+    compiled = compile_sort_options(options)
+    assert compiled.eval_fields("mostrecent", True) == [
+        dict(date=dict(order="desc")),
+        dict(_score=dict(order="desc")),
+    ]
+    assert compiled.eval_fields("mostrecent", False) == [
+        dict(date=dict(order="asc")),
+        dict(_score=dict(order="asc")),
+    ]
+    assert compiled.eval_fields("dynamic", False) == [dict(f=dict(order=False))]
+    assert compiled.eval_fields("unknown", True) is None
+    assert compile_sort_options(options) is compiled
+
+    # Options changed in place are compiled again
+    options["mostrecent"]["fields"] = ["title"]
+    assert compile_sort_options(options).eval_fields("mostrecent", True) == [
+        dict(title=dict(order="asc"))
+    ]
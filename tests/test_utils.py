@@ -7,7 +7,15 @@
 import pytest
 
 from invenio_records_rest.proxies import current_records_rest
-from invenio_records_rest.utils import build_default_endpoint_prefixes
+from invenio_records_rest.utils import (
+    SearchArgs,
+    build_default_endpoint_prefixes,
+    decode_search_cursor,
+    encode_search_cursor,
+    get_requested_fields,
+    is_partial_search_result,
+    select_fields,
+)
 
 
 @pytest.mark.parametrize(
@@ -145,3 +153,72 @@ def test_get_default_endpoint_for_inconsistent(app):
             }
         )
     assert "No endpoint-prefix" in str(excinfo.value)
+
+
+def test_search_cursor():
+    """Test encoding and decoding of search cursors."""
+    values = [2015, "Back to the Future", "3f7a"]
+    cursor = encode_search_cursor(values)
+    assert "=" not in cursor
+    assert decode_search_cursor(cursor) == values
+    assert decode_search_cursor("") == []
+    pytest.raises(ValueError, decode_search_cursor, "!notacursor")
+    pytest.raises(ValueError, decode_search_cursor, encode_search_cursor({"a": 1}))
+
+
+def test_select_fields():
+    """Test selection of a subset of fields."""
+    data = {
+        "title": "Back to the Future",
+        "year": 2015,
+        "authors": [{"name": "Marty", "affiliation": "HV"}, "Doc"],
+        "meta": {"a": 1, "b": {"c": 2}},
+    }
+    assert select_fields(data, ["title", "meta.b.c"]) == {
+        "title": "Back to the Future",
+        "meta": {"b": {"c": 2}},
+    }
+    assert select_fields(data, ["authors.name"]) == {"authors": [{"name": "Marty"}]}
+    # A fully selected parent wins over its subpaths.
+    assert select_fields(data, ["meta", "meta.a"]) == {"meta": data["meta"]}
+    assert select_fields(data, ["year.value", "missing"]) == {}
+
+
+def test_get_requested_fields(app):
+    """Test parsing of the fields query string argument."""
+    assert get_requested_fields() == []
+    with app.test_request_context("/?fields=title,year&fields=meta.a,,title"):
+        assert get_requested_fields() == ["meta.a", "title", "year"]
+        # The argument is parsed once per request.
+        assert get_requested_fields() is get_requested_fields()
+    with app.test_request_context("/"):
+        assert get_requested_fields() == []
+
+
+def test_search_args(app):
+    """Test parsing of the arguments of a search request."""
+    with app.test_request_context("/?q=title:a&type=x&type=y&facets=a,b"):
+        args = SearchArgs.from_request()
+        assert args.q == "title:a"
+        assert args.sort == ""
+        assert sorted(args.facets) == ["a", "b"]
+        assert args.values.getlist("type") == ["x", "y"]
+        with pytest.raises(TypeError):
+            args.values["type"] = "z"
+    with app.test_request_context("/?sort=-year"):
+        args = SearchArgs.from_request()
+        assert args.q is None
+        assert args.sort == "-year"
+        assert args.facets == []
+
+
+def test_is_partial_search_result():
+    """Test detection of partial search results."""
+    shards = dict(total=2, successful=2, skipped=0, failed=0)
+    assert not is_partial_search_result(dict(timed_out=False, _shards=shards))
+    assert not is_partial_search_result({})
+    assert is_partial_search_result(dict(timed_out=True, _shards=shards))
+    assert is_partial_search_result(dict(terminated_early=True, _shards=shards))
+    assert is_partial_search_result(
+        dict(timed_out=False, _shards=dict(shards, successful=1, failed=1))
+    )
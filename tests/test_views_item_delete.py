@@ -3,9 +3,12 @@
 
 """Delete record tests."""
 
+import pytest
+from conftest import IndexFlusher
 from flask import url_for
-from helpers import get_json, record_url
-from invenio_pidstore.models import PersistentIdentifier
+from helpers import assert_hits_len, get_json, record_url
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.api import Record
 from mock import patch
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -63,3 +66,74 @@ def test_delete_with_sqldatabase_error(app, indexed_records):
     with app.test_client() as client:
         res = client.get(record_url(pid))
         assert res.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_delete(app, db, indexed_records, search_url, search_class):
+    """Test deleting many records in one request."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    (pid1, record1), (pid2, record2) = indexed_records[:2]
+    PersistentIdentifier.create(
+        "doi",
+        "10.1234/1",
+        object_type="rec",
+        object_uuid=record1.id,
+        status=PIDStatus.REGISTERED,
+    )
+    db.session.commit()
+    with app.test_client() as client:
+        res = client.delete(bulk_url, json=[pid1.pid_value, pid2.pid_value, "missing"])
+        assert res.status_code == 200
+        items = get_json(res)["items"]
+        assert [item["status"] for item in items] == [204, 204, 404]
+        for pid in (pid1, pid2):
+            assert client.get(record_url(pid)).status_code == 410
+        assert PersistentIdentifier.get("doi", "10.1234/1").is_deleted()
+
+        res = client.delete(bulk_url, json=[pid1.pid_value])
+        assert get_json(res)["items"][0]["status"] == 410
+
+        # Delete by query
+        IndexFlusher(search_class).flush_and_wait()
+        res = client.delete(bulk_url, query_string=dict(q="title:Galaxy"))
+        (item,) = get_json(res)["items"]
+        assert item["status"] == 204
+        IndexFlusher(search_class).flush_and_wait()
+        res = client.get(search_url)
+        assert_hits_len(res, 1)
+
+        with patch.dict(app.config, {"RECORDS_REST_BULK_MAX_SIZE": 0}):
+            res = client.delete(bulk_url, query_string=dict(q="*"))
+            assert res.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "app",
+    [dict(endpoint=dict(use_bulk_view=True, indexer_class=None))],
+    indirect=["app"],
+)
+def test_bulk_delete_failing_item(app, db, test_records):
+    """Test an item of a bulk deletion failing to be stored."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    (pid1, record1), (pid2, record2) = test_records[:2]
+    delete = Record.delete
+
+    def failing_delete(self, *args, **kwargs):
+        if self.id == record1.id:
+            raise SQLAlchemyError()
+        return delete(self, *args, **kwargs)
+
+    with app.test_client() as client:
+        with patch.object(Record, "delete", failing_delete):
+            res = client.delete(bulk_url, json=[pid1.pid_value, pid2.pid_value])
+        assert res.status_code == 200
+        items = get_json(res)["items"]
+        assert [(item["id"], item["status"]) for item in items] == [
+            (pid1.pid_value, 400),
+            (pid2.pid_value, 204),
+        ]
+        assert client.get(record_url(pid1)).status_code == 200
+        assert not PersistentIdentifier.get("recid", pid1.pid_value).is_deleted()
+        assert client.get(record_url(pid2)).status_code == 410
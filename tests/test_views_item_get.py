@@ -3,8 +3,15 @@
 
 """Get record tests."""
 
+from unittest.mock import patch
+
+import pytest
 from flask import url_for
 from helpers import get_json, record_url, to_relative_url
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+
+from invenio_records_rest.cache import LRUCache
+from invenio_records_rest.serializers.json import JSONSerializer
 
 
 def test_item_get(app, test_records):
@@ -31,6 +38,44 @@ def test_item_get(app, test_records):
         assert data == get_json(res)
 
 
+def test_item_get_fields(app, test_records):
+    """Test retrieval of a subset of the record fields."""
+    with app.test_client() as client:
+        pid, record = test_records[0]
+
+        res = client.get(record_url(pid), query_string={"fields": "title,year"})
+        assert res.status_code == 200
+        data = get_json(res)
+        assert data["id"] == pid.pid_value
+        assert data["metadata"] == {"title": record["title"], "year": record["year"]}
+
+
+def test_item_get_cache(app, db, test_records):
+    """Test serving records from the serialized records cache."""
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_RECORD_CACHE": LRUCache}):
+        state.__dict__.pop("record_cache", None)
+        with app.test_client() as client:
+            pid, record = test_records[0]
+            res = client.get(record_url(pid))
+            data = get_json(res)
+
+            with patch.object(JSONSerializer, "serialize") as serialize:
+                res = client.get(record_url(pid))
+                assert res.status_code == 200
+                assert get_json(res) == data
+                assert not serialize.called
+
+            # A new revision of the record is not served from the cache
+            record["title"] = "Updated title"
+            record.commit()
+            db.session.commit()
+            res = client.get(record_url(pid))
+            assert get_json(res)["metadata"]["title"] == "Updated title"
+            assert res.headers["ETag"] == '"{}"'.format(record.revision_id)
+    state.__dict__.pop("record_cache", None)
+
+
 def test_item_get_etag(app, test_records):
     """Test VALID record get request (GET .../records/<record_id>)."""
     with app.test_client() as client:
@@ -72,3 +117,82 @@ def test_item_get_invalid_mimetype(app, test_records):
         # Check that GET with non accepted format will return 406
         res = client.get(record_url(pid), headers=[("Accept", "video/mp4")])
         assert res.status_code == 406
+
+
+def deny_unknown_film(record=None, *args, **kwargs):
+    """Permission factory denying access to the "Unknown film" record."""
+    return type(
+        "DenyUnknownFilm",
+        (),
+        {"can": lambda self: record["title"] != "Unknown film"},
+    )()
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        dict(
+            endpoint=dict(
+                use_mget_view=True,
+                read_permission_factory_imp=deny_unknown_film,
+            )
+        )
+    ],
+    indirect=["app"],
+)
+def test_mget(app, db, test_records, default_permissions):
+    """Test fetching many records in one request."""
+    pid, record = test_records[0]
+    PersistentIdentifier.create("recid", "deleted", status=PIDStatus.DELETED)
+    redirected = PersistentIdentifier.create(
+        "recid", "redirected", status=PIDStatus.REGISTERED
+    )
+    redirected.redirect(pid)
+    db.session.commit()
+    mget_url = url_for("invenio_records_rest.recid_mget")
+    pid_values = [p.pid_value for p, r in test_records]
+
+    with app.test_client() as client:
+        res = client.post(
+            mget_url,
+            json=dict(ids=pid_values + ["missing", "deleted", "redirected", 1]),
+        )
+        assert res.status_code == 200
+        hits = get_json(res)["hits"]
+        assert [h["id"] for h in hits] == pid_values + [
+            "missing",
+            "deleted",
+            "redirected",
+            "1",
+        ]
+        assert hits[0]["status"] == 200
+        assert hits[0]["record"] == get_json(client.get(record_url(pid)))
+        titles = [r["title"] for p, r in test_records]
+        denied = titles.index("Unknown film")
+        assert hits[denied]["status"] == 401
+        assert "record" not in hits[denied]
+        res = client.post(
+            mget_url, json=dict(ids=[pid_values[denied]]), query_string=dict(user=1)
+        )
+        assert get_json(res)["hits"][0]["status"] == 403
+        assert [h["status"] for h in hits[-4:]] == [404, 410, 301, 200]
+        assert hits[-2]["location"] == record_url(pid)
+
+        # Invalid requests
+        assert client.post(mget_url, json=dict(ids="1")).status_code == 400
+        assert client.post(mget_url, data="ids").status_code == 400
+        with patch.dict(app.config, {"RECORDS_REST_MGET_MAX_SIZE": 2}):
+            res = client.post(mget_url, json=dict(ids=pid_values))
+            assert res.status_code == 400
+        res = client.post(
+            mget_url, json=dict(ids=pid_values), headers={"Accept": "text/plain"}
+        )
+        assert res.status_code == 406
+
+        # Deleted records are gone, even if their PID is still registered
+        record.delete()
+        db.session.commit()
+        res = client.post(mget_url, json=dict(ids=[pid.pid_value]))
+        (hit,) = get_json(res)["hits"]
+        assert hit["status"] == 410
+        assert "record" not in hit
@@ -8,6 +8,7 @@ import json
 import mock
 import pytest
 from conftest import IndexFlusher
+from flask import url_for
 from helpers import _mock_validate_fail, assert_hits_len, get_json, record_url
 
 
@@ -153,3 +154,36 @@ def test_validation_error(app, test_records, test_patch, content_type):
         # Patch record
         res = client.patch(url, data=json.dumps(test_patch), headers=HEADERS)
         assert res.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_patch(app, db, search, test_records, search_url, search_class):
+    """Test patching many records in one request."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    (pid1, record1), (pid2, record2), (pid3, record3) = test_records[:3]
+    patch = [{"op": "replace", "path": "/year", "value": 1985}]
+    revision1, revision2 = record1.revision_id, record2.revision_id
+    with app.test_client() as client:
+        res = client.patch(
+            bulk_url,
+            json=[
+                dict(id=pid1.pid_value, revision=revision1, patch=patch),
+                dict(id=pid2.pid_value, revision=revision2 + 1, patch=patch),
+                dict(id=pid3.pid_value, patch=[{"op": "invalid"}]),
+                dict(id="missing", patch=patch),
+                dict(patch=patch),
+            ],
+        )
+        assert res.status_code == 200
+        items = get_json(res)["items"]
+        assert [item["status"] for item in items] == [200, 412, 400, 404, 400]
+        assert items[0]["revision"] == revision1 + 1
+
+        assert get_json(client.get(record_url(pid1)))["metadata"]["year"] == 1985
+        assert get_json(client.get(record_url(pid2)))["metadata"]["year"] != 1985
+
+        IndexFlusher(search_class).flush_and_wait()
+        res = client.get(search_url, query_string={"year": 1985})
+        assert_hits_len(res, 1)
@@ -8,7 +8,9 @@ import json
 import mock
 import pytest
 from conftest import IndexFlusher
+from flask import url_for
 from helpers import _mock_validate_fail, assert_hits_len, get_json, record_url
+from sqlalchemy.exc import SQLAlchemyError
 
 
 @pytest.mark.parametrize(
@@ -162,3 +164,75 @@ def test_validation_error(app, test_records, content_type):
         url = record_url(pid)
         res = client.put(url, data=json.dumps(record.dumps()), headers=HEADERS)
         assert res.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_put(app, db, search, test_records, search_url, search_class):
+    """Test replacing many records in one request."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    with app.test_client() as client:
+        items = []
+        for pid, record in test_records:
+            data = dict(record, title="Updated")
+            items.append(
+                dict(id=pid.pid_value, revision=record.revision_id, metadata=data)
+            )
+        with mock.patch.dict(app.config, {"RECORDS_REST_BULK_BATCH_SIZE": 3}):
+            res = client.put(bulk_url, json=items)
+        assert res.status_code == 200
+        assert [item["status"] for item in get_json(res)["items"]] == [200] * 4
+
+        # Stale revisions are rejected
+        res = client.put(bulk_url, json=items[:1])
+        assert get_json(res)["items"][0]["status"] == 412
+
+        for pid, record in test_records:
+            res = client.get(record_url(pid))
+            assert get_json(res)["metadata"]["title"] == "Updated"
+
+        IndexFlusher(search_class).flush_and_wait()
+        res = client.get(search_url, query_string={"q": "title:Updated"})
+        assert_hits_len(res, 4)
+
+
+@mock.patch("invenio_records.api.Record.commit", _mock_validate_fail)
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_put_validation_error(app, db, test_records):
+    """Test invalid records of a bulk replacement."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    pid, record = test_records[0]
+    with app.test_client() as client:
+        res = client.put(bulk_url, json=[dict(id=pid.pid_value, metadata=dict(record))])
+        (item,) = get_json(res)["items"]
+        assert item["status"] == 400
+        assert item["id"] == pid.pid_value
+        assert item["message"].startswith("Validation error")
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_put_invalid_items(app, db, test_records):
+    """Test items of a bulk replacement failing to be loaded or stored."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    pid, record = test_records[0]
+    with app.test_client() as client:
+        res = client.put(bulk_url, json=[dict(id=pid.pid_value, metadata=1)])
+        assert get_json(res)["items"][0]["status"] == 400
+
+        with mock.patch(
+            "invenio_records.api.Record.commit", side_effect=SQLAlchemyError()
+        ):
+            res = client.put(
+                bulk_url, json=[dict(id=pid.pid_value, metadata=dict(title="New"))]
+            )
+            (item,) = get_json(res)["items"]
+            assert item["status"] == 400
+            assert item["id"] == pid.pid_value
+
+        res = client.get(record_url(pid))
+        assert get_json(res)["metadata"] == record.dumps()
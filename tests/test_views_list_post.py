@@ -8,7 +8,12 @@ import json
 import mock
 import pytest
 from conftest import IndexFlusher
+from flask import url_for
 from helpers import _mock_validate_fail, assert_hits_len, get_json, record_url
+from invenio_pidstore import current_pidstore
+from invenio_pidstore.errors import PIDAlreadyExists
+from invenio_pidstore.minters import recid_minter
+from invenio_pidstore.models import PersistentIdentifier
 from mock import patch
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -130,3 +135,124 @@ def test_jsonschema_validation_error(app, db, search_url, content_type):
         assert res.status_code == 400
         data = get_json(res)
         assert data["message"]
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_create(app, db, search, test_data, search_url, search_class):
+    """Test creating many records in one request."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    with app.test_client() as client:
+        with patch.dict(app.config, {"RECORDS_REST_BULK_BATCH_SIZE": 2}):
+            res = client.post(bulk_url, json=test_data[:2] + [None] + test_data[2:3])
+        assert res.status_code == 200
+        items = get_json(res)["items"]
+        assert [item["status"] for item in items] == [201, 201, 400, 201]
+        for item in items[:2] + items[3:]:
+            res = client.get(record_url(item["id"]))
+            assert res.status_code == 200
+            assert res.headers["ETag"] == '"{0}"'.format(item["revision"])
+            assert item["location"] == get_json(res)["links"]["self"]
+
+        # Newline delimited JSON
+        res = client.post(
+            bulk_url,
+            data="\n".join(json.dumps(d) for d in test_data[3:]),
+            content_type="application/x-ndjson",
+        )
+        assert [item["status"] for item in get_json(res)["items"]] == [201]
+
+        IndexFlusher(search_class).flush_and_wait()
+        res = client.get(search_url)
+        assert_hits_len(res, 4)
+
+        # Invalid requests
+        assert client.post(bulk_url, json=test_data[0]).status_code == 400
+        res = client.post(bulk_url, data="{", content_type="application/x-ndjson")
+        assert res.status_code == 400
+        res = client.post(bulk_url, data="", content_type="video/mp4")
+        assert res.status_code == 415
+        with patch.dict(app.config, {"RECORDS_REST_BULK_MAX_SIZE": 1}):
+            assert client.post(bulk_url, json=test_data).status_code == 400
+
+
+@mock.patch("invenio_records.api.Record.create", _mock_validate_fail)
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_create_validation_error(app, db, test_data):
+    """Test invalid records of a bulk creation."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    with app.test_client() as client:
+        res = client.post(bulk_url, json=test_data[:1])
+        assert res.status_code == 200
+        (item,) = get_json(res)["items"]
+        assert item["status"] == 400
+        assert item["message"].startswith("Validation error")
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_bulk_view=True))], indirect=["app"]
+)
+def test_bulk_create_invalid_items(app, db, test_data):
+    """Test items of a bulk creation failing to be minted or stored."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+
+    def minter(record_uuid, data):
+        if data["title"] == "Duplicate":
+            raise PIDAlreadyExists("recid", "1")
+        return recid_minter(record_uuid, data)
+
+    with app.test_client() as client, patch.dict(
+        current_pidstore.minters, {"recid": minter}
+    ):
+        res = client.post(
+            bulk_url,
+            json=[1, dict(test_data[0], control_number="1"), dict(title="Duplicate")],
+        )
+        assert res.status_code == 200
+        items = get_json(res)["items"]
+        assert [item["status"] for item in items] == [400, 400, 409]
+
+        with patch("invenio_records.api.Record.create", side_effect=SQLAlchemyError()):
+            res = client.post(bulk_url, json=test_data[:1])
+            assert res.status_code == 200
+            assert get_json(res)["items"][0]["status"] == 400
+    assert PersistentIdentifier.query.count() == 0
+
+
+class CustomIndexer(object):
+    """Indexer implementing only the public indexing methods."""
+
+    indexed = []
+
+    def index(self, record):
+        """Index a record."""
+        if record["title"] == "Unindexable":
+            raise RuntimeError()
+        self.indexed.append(record.id)
+
+
+@pytest.mark.parametrize(
+    "app",
+    [dict(endpoint=dict(use_bulk_view=True, indexer_class=CustomIndexer))],
+    indirect=["app"],
+)
+def test_bulk_create_custom_indexer(app, db, test_data):
+    """Test bulk creation with an indexer without bulk actions."""
+    bulk_url = url_for("invenio_records_rest.recid_bulk")
+    CustomIndexer.indexed = []
+    with app.test_client() as client, patch(
+        "invenio_records_rest.views.invalidate_search_cache"
+    ) as invalidate:
+        res = client.post(bulk_url, json=test_data[:2])
+        assert res.status_code == 200
+        assert [item["status"] for item in get_json(res)["items"]] == [201, 201]
+        assert len(CustomIndexer.indexed) == 2
+        assert invalidate.call_count == 1
+
+        # The search cache is invalidated even if indexing fails
+        with pytest.raises(RuntimeError):
+            client.post(bulk_url, json=[dict(title="Unindexable")])
+        assert invalidate.call_count == 2
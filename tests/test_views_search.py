@@ -4,12 +4,30 @@
 """Search tests."""
 
 import re
+import threading
+import time
+from concurrent.futures import Future
 
 import pytest
 from flask import url_for
-from helpers import assert_hits_len, get_json, parse_url, to_relative_url
+from helpers import (
+    assert_hits_len,
+    get_json,
+    parse_url,
+    record_url,
+    to_relative_url,
+)
+from invenio_pidstore import current_pidstore
+from invenio_pidstore.fetchers import FetchedPID
+from invenio_search import current_search
+from invenio_search.engine import dsl
 from mock import patch
 
+from invenio_records_rest.cache import LRUCache, ResponseCache
+from invenio_records_rest.query import es_search_factory
+from invenio_records_rest.utils import encode_search_cursor
+from invenio_records_rest.views import RecordsListResource
+
 
 def test_json_result_serializer(app, indexed_records, test_records, search_url):
     """JSON result."""
@@ -424,3 +442,420 @@ def test_max_result_window_invalid_params(app, indexed_records, search_url):
         assert "Maximum number of 3 results have been reached." in res.get_data(
             as_text=True
         )
+
+
+def test_cursor_pagination(app, indexed_records, search_url):
+    """Test cursor based pagination."""
+    with app.test_client() as client:
+        seen = []
+        res = client.get(search_url, query_string=dict(size=1, cursor="", sort="year"))
+        data = get_json(res)
+        while data["hits"]["hits"]:
+            assert len(data["hits"]["hits"]) == 1
+            assert "prev" not in data["links"]
+            seen.append(data["hits"]["hits"][0]["metadata"]["year"])
+            # A full page always has a next link.
+            parsed_url = parse_url(data["links"]["next"])
+            assert parsed_url["qs"]["size"] == ["1"]
+            assert parsed_url["qs"]["sort"] == ["year"]
+            assert "page" not in parsed_url["qs"]
+            res = client.get(to_relative_url(data["links"]["next"]))
+            assert res.status_code == 200
+            data = get_json(res)
+
+        assert "next" not in data["links"]
+        assert seen == sorted(r["year"] for _, r in indexed_records)
+
+
+def test_cursor_invalid_params(app, indexed_records, search_url):
+    """Test invalid cursor parameters."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(cursor="!notacursor"))
+        assert res.status_code == 400
+
+        # Wrong number of values or values which are not scalars
+        for values in ([1], [1, 2, 3, 4], [{"a": 1}, "b"]):
+            res = client.get(
+                search_url,
+                query_string=dict(cursor=encode_search_cursor(values), sort="-year"),
+            )
+            assert res.status_code == 400
+
+        res = client.get(search_url, query_string=dict(cursor="", page=2))
+        assert res.status_code == 400
+
+        # Cursor pagination is not limited by the max result window.
+        res = client.get(search_url, query_string=dict(cursor="", size=10))
+        assert res.status_code == 200
+
+
+def test_search_etag(app, indexed_records, search_url):
+    """Test conditional requests of search results."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="back"))
+        assert res.status_code == 200
+        assert res.cache_control.no_cache
+        etag = res.headers["ETag"]
+
+        # Same results
+        res = client.get(
+            search_url, query_string=dict(q="back"), headers={"If-None-Match": etag}
+        )
+        assert res.status_code == 304
+
+        # Other results
+        res = client.get(
+            search_url,
+            query_string=dict(q="year:2015"),
+            headers={"If-None-Match": etag},
+        )
+        assert res.status_code == 200
+        assert res.headers["ETag"] != etag
+
+
+def test_search_single_flight(app, indexed_records, search_url):
+    """Test searching with coalescing of identical searches."""
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_SEARCH_SINGLE_FLIGHT": True}):
+        state.__dict__.pop("search_single_flight", None)
+        assert state.search_single_flight is not None
+        with app.test_client() as client:
+            for _ in range(2):
+                res = client.get(search_url, query_string=dict(q="back"))
+                assert_hits_len(res, 2)
+    state.__dict__.pop("search_single_flight", None)
+
+
+def test_search_single_flight_clients(app, indexed_records, search_url):
+    """Test coalescing of concurrent identical searches of different clients."""
+    state = app.extensions["invenio-records-rest"]
+    execute = dsl.Search.execute
+    entered = []
+
+    def do(key, func):
+        entered.append(key)
+        return single_flight_do(key, func)
+
+    def slow_execute(self, *args, **kwargs):
+        # Wait for the second request to join the search in flight.
+        for _ in range(100):
+            if len(entered) == 2:
+                break
+            time.sleep(0.01)
+        return execute(self, *args, **kwargs)
+
+    responses = []
+
+    def search(remote_addr):
+        with app.test_client() as client:
+            responses.append(
+                client.get(
+                    search_url,
+                    query_string=dict(q="back"),
+                    environ_base={"REMOTE_ADDR": remote_addr},
+                )
+            )
+
+    with patch.dict(app.config, {"RECORDS_REST_SEARCH_SINGLE_FLIGHT": True}):
+        state.__dict__.pop("search_single_flight", None)
+        single_flight_do = state.search_single_flight.do
+        with patch.object(
+            state.search_single_flight, "do", side_effect=do
+        ), patch.object(
+            dsl.Search, "execute", autospec=True, side_effect=slow_execute
+        ) as execute_mock:
+            threads = [
+                threading.Thread(target=search, args=(addr,))
+                for addr in ("10.0.0.1", "10.0.0.2")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(responses) == 2
+        for res in responses:
+            assert_hits_len(res, 2)
+        assert entered[0] == entered[1]
+        assert execute_mock.call_count == 1
+    state.__dict__.pop("search_single_flight", None)
+
+
+@pytest.mark.parametrize(
+    "app",
+    [dict(endpoint=dict(search_timeout="10s", search_terminate_after=1))],
+    indirect=["app"],
+)
+def test_search_budget(app, indexed_records, search_url):
+    """Test the search budget of an endpoint."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="back"))
+        assert res.status_code == 200
+        data = get_json(res)
+        assert data["terminated_early"] is True
+        assert data["timed_out"] is False
+        assert len(data["hits"]["hits"]) == 1
+
+
+def test_fields(app, indexed_records, search_url):
+    """Test selecting a subset of the fields of the hits."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="year:2015", fields="title"))
+        assert_hits_len(res, 1)
+        data = get_json(res)
+        hit = data["hits"]["hits"][0]
+        assert list(hit["metadata"]) == ["title"]
+        assert hit["created"]
+        assert hit["id"]
+        parsed_url = parse_url(data["links"]["self"])
+        assert parsed_url["qs"]["fields"] == ["title"]
+
+
+def test_fields_required_source_fields(app):
+    """Test the source fields needed by the PID fetcher of an endpoint."""
+
+    def doi_fetcher(record_uuid, data):
+        return FetchedPID(provider=None, pid_type="doi", pid_value=data["doi"])
+
+    def make_resource(**kwargs):
+        return RecordsListResource(
+            minter_name="recid",
+            search_serializers={},
+            search_factory=es_search_factory,
+            **kwargs,
+        )
+
+    search = dsl.Search(index="records")
+    with app.test_request_context(), patch.dict(
+        current_pidstore.fetchers, doi=doi_fetcher
+    ):
+        resource = make_resource(pid_fetcher="recid")
+        assert resource._source_search(search, ["title"]).to_dict()["_source"] == {
+            "includes": ["_created", "_updated", "control_number", "title"],
+            "excludes": [],
+        }
+        # The fields read by other fetchers are unknown.
+        resource = make_resource(pid_fetcher="doi")
+        assert resource._source_search(search, ["title"]).to_dict() == {}
+        resource = make_resource(pid_fetcher="doi", required_source_fields=["doi"])
+        assert resource._source_search(search, ["title"]).to_dict()["_source"] == {
+            "includes": ["doi", "title"],
+            "excludes": [],
+        }
+
+
+def test_count_only(app, indexed_records, search_url):
+    """Test counting records without fetching them."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="back", size=0))
+        assert_hits_len(res, 0)
+        data = get_json(res)
+        assert data["hits"]["total"] == 2
+        assert "aggregations" in data
+        assert list(data["links"]) == ["self"]
+
+        res = client.head(search_url, query_string=dict(q="back"))
+        assert res.status_code == 200
+        assert res.headers["X-Total-Count"] == "2"
+        assert res.data == b""
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        dict(
+            endpoint=dict(
+                search_serializers={
+                    "application/json": "invenio_records_rest.serializers"
+                    ":json_v1_search",
+                    "application/x-ids+json": "invenio_records_rest.serializers"
+                    ":json_v1_search_ids",
+                },
+                search_serializers_aliases={"ids": "application/x-ids+json"},
+            )
+        )
+    ],
+    indirect=["app"],
+)
+def test_ids_only(app, indexed_records, search_url):
+    """Test listing only the identifiers of the records."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="back", format="ids"))
+        assert res.status_code == 200
+        assert res.content_type == "application/x-ids+json"
+        data = get_json(res)
+        assert data["hits"]["total"] == 2
+        pids = {pid.pid_value for pid, _ in indexed_records}
+        assert len(data["hits"]["hits"]) == 2
+        assert set(data["hits"]["hits"]) <= pids
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        dict(
+            endpoint=dict(
+                export_serializers={
+                    "application/json": (
+                        "invenio_records_rest.serializers:json_v1_search_stream"
+                    ),
+                },
+            )
+        )
+    ],
+    indirect=["app"],
+)
+def test_export(app, indexed_records):
+    """Test streaming export of all search hits."""
+    app.config["RECORDS_REST_EXPORT_BATCH_SIZE"] = 1
+    export_url = url_for("invenio_records_rest.recid_export")
+    with app.test_client() as client:
+        res = client.get(export_url)
+        assert res.status_code == 200
+        data = get_json(res)
+        assert len(data["hits"]["hits"]) == len(indexed_records)
+        assert "aggregations" not in data
+        assert data["links"]["self"].endswith(export_url)
+
+        res = client.get(export_url, query_string=dict(q="back"))
+        assert len(get_json(res)["hits"]["hits"]) == 2
+
+        res = client.get(export_url, query_string=dict(q="nomatch"))
+        assert get_json(res)["hits"]["hits"] == []
+
+
+@pytest.mark.parametrize(
+    "app", [dict(endpoint=dict(use_facets_view=True))], indirect=["app"]
+)
+def test_facets_view(app, indexed_records):
+    """Test retrieving only the aggregations of a search."""
+    facets_url = url_for("invenio_records_rest.recid_facets")
+    with app.test_client() as client:
+        res = client.get(facets_url)
+        assert res.status_code == 200
+        data = get_json(res)
+        assert "hits" not in data
+        assert "total" not in data
+        assert len(data["aggregations"]["stars"]["buckets"]) == 3
+        assert data["links"]["self"].startswith("http://")
+
+        res = client.get(facets_url, query_string=dict(q="back", total="true"))
+        data = get_json(res)
+        assert data["total"] == 2
+        assert parse_url(data["links"]["self"])["qs"]["total"] == ["true"]
+
+
+def test_search_cache(app, indexed_records, search_class, search_url):
+    """Test caching of search responses and their invalidation."""
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_SEARCH_CACHE": LRUCache}):
+        state.__dict__.pop("search_cache", None)
+        with app.test_client() as client:
+            res = client.get(search_url, query_string=dict(q="back"))
+            assert_hits_len(res, 2)
+
+            # Identical requests are served without querying the search engine
+            with patch("invenio_search.RecordsSearch.execute") as execute:
+                res = client.get(search_url, query_string=dict(q="back"))
+                assert_hits_len(res, 2)
+                assert not execute.called
+
+            # Writes through the REST API invalidate the cache
+            pid, record = indexed_records[0]
+            res = client.delete(record_url(pid))
+            assert res.status_code == 204
+            current_search.flush_and_refresh(search_class.Meta.index)
+            res = client.get(search_url, query_string=dict(q="back"))
+            assert_hits_len(res, 1)
+    state.__dict__.pop("search_cache", None)
+
+
+def test_search_cache_key(app):
+    """Test that search cache keys depend on the root URL used in links."""
+    resource = RecordsListResource(
+        minter_name="recid",
+        pid_fetcher="recid",
+        search_serializers={"application/json": lambda *args, **kwargs: None},
+        default_media_type="application/json",
+        search_factory=es_search_factory,
+    )
+    search_cache = ResponseCache(LRUCache())
+    keys = []
+    for base_url in ("http://localhost/", "http://localhost/api/"):
+        with app.test_request_context("/records/?q=back", base_url=base_url):
+            keys.append(resource._search_cache_key(search_cache))
+    assert None not in keys
+    assert keys[0] != keys[1]
+
+
+def test_aggregations_cache(app, indexed_records, search_url):
+    """Test that aggregations are cached independently of pagination."""
+    state = app.extensions["invenio-records-rest"]
+    with patch.dict(app.config, {"RECORDS_REST_AGGREGATIONS_CACHE": LRUCache}):
+        state.__dict__.pop("aggregations_cache", None)
+        with app.test_client() as client:
+            res = client.get(search_url, query_string=dict(size=1, page=1))
+            assert_hits_len(res, 1)
+            aggs = get_json(res)["aggregations"]
+            assert aggs["stars"]["buckets"]
+
+            # Other pages and sorts reuse the cached aggregations
+            cache = state.aggregations_cache
+            with patch.object(cache, "set") as cache_set:
+                res = client.get(
+                    search_url, query_string=dict(size=1, page=2, sort="year")
+                )
+                assert_hits_len(res, 1)
+                assert get_json(res)["aggregations"] == aggs
+                assert not cache_set.called
+
+            # A different query computes new aggregations
+            res = client.get(search_url, query_string=dict(q="back"))
+            assert_hits_len(res, 2)
+            assert get_json(res)["aggregations"] != aggs
+    state.__dict__.pop("aggregations_cache", None)
+
+
+def test_concurrent_aggregations(app, indexed_records, search_url):
+    """Test aggregations computed concurrently with the hits."""
+    with app.test_client() as client:
+        res = client.get(search_url, query_string=dict(q="back", size=1))
+        expected = get_json(res)
+
+        with patch.dict(app.config, {"RECORDS_REST_CONCURRENT_AGGREGATIONS": True}):
+            res = client.get(search_url, query_string=dict(q="back", size=1))
+            assert_hits_len(res, 1)
+            data = get_json(res)
+            assert data["aggregations"] == expected["aggregations"]
+            assert data["hits"] == expected["hits"]
+
+
+def test_concurrent_aggregations_saturated(app, indexed_records, search_url):
+    """Test aggregations of a saturated thread pool and timed out ones."""
+    state = app.extensions["invenio-records-rest"]
+    futures = []
+
+    def submit(*args):
+        futures.append(Future())
+        return futures[-1]
+
+    config = {
+        "RECORDS_REST_CONCURRENT_AGGREGATIONS": True,
+        "RECORDS_REST_AGGREGATIONS_TIMEOUT": 0,
+    }
+    with app.test_client() as client, patch.dict(app.config, config), patch.object(
+        state.search_executor, "submit", side_effect=submit
+    ):
+        # Aggregations are computed inline without idle threads
+        state.__dict__["search_slots"] = threading.BoundedSemaphore(1)
+        state.search_slots.acquire()
+        res = client.get(search_url, query_string=dict(q="back"))
+        assert get_json(res)["aggregations"]["stars"]["buckets"]
+        assert not futures
+
+        # Aggregations which are not started in time are cancelled
+        state.search_slots.release()
+        res = client.get(search_url, query_string=dict(q="back"))
+        assert "stars" not in get_json(res)["aggregations"]
+        assert [future.cancelled() for future in futures] == [True]
+        assert state.search_slots.acquire(blocking=False)
+    state.__dict__.pop("search_slots", None)
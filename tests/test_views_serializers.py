@@ -8,6 +8,10 @@ import json
 
 import pytest
 from flask import current_app
+from helpers import get_json
+
+from invenio_records_rest.serializers.json import JSONSerializer
+from invenio_records_rest.serializers.response import search_responsify
 
 
 def json_record(*args, **kwargs):
@@ -40,6 +44,11 @@ def xml_search(*args, **kwargs):
     )
 
 
+json_title_search = search_responsify(
+    JSONSerializer(source_fields=["title"]), "application/json"
+)
+
+
 @pytest.mark.parametrize(
     "app",
     [
@@ -136,3 +145,27 @@ def test_serializer_aliases(app, db, search, indexed_records):
         res = client.get("/records/1?format=get-json")
         assert res.status_code == 200
         assert res.content_type == "application/json"
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        dict(
+            endpoint=dict(
+                search_serializers={
+                    "application/json": "test_views_serializers:json_title_search",
+                },
+            ),
+        )
+    ],
+    indirect=["app"],
+    scope="function",
+)
+def test_serializer_source_fields(app, db, search, indexed_records):
+    """Test fetching only the source fields declared by the serializer."""
+    with app.test_client() as client:
+        res = client.get("/records/", query_string={"q": "year:2015"})
+        assert res.status_code == 200
+        hit = get_json(res)["hits"]["hits"][0]
+        assert set(hit["metadata"]) == {"title", "control_number"}
+        assert hit["created"]